@@ -9,6 +9,8 @@ from PyQt5.QtWidgets import QApplication
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from ui.main_window import FolderManager, ImageProcessor, PrintManager
+import startup_bench
+from core import digest, frame_cache
 
 class TestFolderManager(unittest.TestCase):
     def setUp(self):
@@ -63,6 +65,97 @@ class TestFolderManager(unittest.TestCase):
         self.assertTrue(success)
         self.assertEqual(status, "existing")
 
+    def test_claim_folder_skips_taken_name(self):
+        # 다른 부스가 먼저 만든 이름은 건너뛰고 다음 번호로 생성
+        name = self.manager.get_actual_folder_name("400")
+        os.makedirs(os.path.join(self.test_dir, name))
+        success, path, status = self.manager.claim_folder(name)
+        self.assertTrue(success)
+        self.assertEqual((os.path.basename(path), status), ("400_1", "renamed"))
+        self.assertEqual(self.manager.get_actual_folder_name("400"), "400_2")
+        self.assertEqual(self.manager.claim_folder("400_2")[2], "created")
+
+        # 이전과 같이 가장 큰 접미사 다음 번호 사용 (중간에 빈 번호는 다시 쓰지 않음)
+        os.makedirs(os.path.join(self.test_dir, "400_5"))
+        self.assertEqual(self.manager.get_actual_folder_name("400"), "400_6")
+
+    def test_session_manifest_reset(self):
+        from core.session import SessionManifest
+        _, folder, _ = self.manager.create_folder("200")
+        manifest = SessionManifest.open(folder)
+        for slot in range(2):
+            path = os.path.join(folder, f"copy{slot + 1}_a.jpg")
+            with open(path, "wb") as f:
+                f.write(b"photo%d" % slot)
+            manifest.record_input(slot, path, mode="four_cut")
+        # 앱이 만들지 않은 파일 (copy 접두어여도 기록에 없으면 유지)
+        with open(os.path.join(folder, "copy_of_receipt.txt"), "w") as f:
+            f.write("x")
+
+        loaded = SessionManifest.load(folder)
+        self.assertEqual([os.path.basename(p) for p in loaded.input_slots()], ["copy1_a.jpg", "copy2_a.jpg"])
+
+        loaded.delete_files()
+        self.assertEqual(sorted(os.listdir(folder)), [SessionManifest.FILENAME, "copy_of_receipt.txt"])
+
+        loaded.close()
+        self.assertEqual(SessionManifest.load(folder).state, SessionManifest.STATE_CLOSED)
+
+    def test_runtime_state_kept_out_of_settings_file(self):
+        import json
+        from core.settings import SettingsManager
+        settings_path = os.path.join(self.test_dir, "settings.json")
+        # 이전 버전이 settings.json에 남긴 실행 상태
+        with open(settings_path, "w", encoding="utf-8") as f:
+            json.dump({"expand_pixels": 6, "recent_frames": ["old.png"]}, f)
+
+        manager = SettingsManager(settings_path)
+        self.assertEqual(manager.get("recent_frames"), ["old.png"])
+        manager.set("active_session", "sessions/300")
+        manager.set("recent_frames", ["a.png", "old.png"])
+        with open(settings_path, encoding="utf-8") as f:
+            self.assertEqual(json.load(f), {"expand_pixels": 6, "recent_frames": ["old.png"]})
+
+        manager.set("expand_pixels", 4)
+        with open(settings_path, encoding="utf-8") as f:
+            self.assertNotIn("recent_frames", json.load(f))
+        reloaded = SettingsManager(settings_path)
+        self.assertEqual(reloaded.state_path, os.path.join(self.test_dir, "cache", "state.json"))
+        self.assertEqual(reloaded.get("active_session"), "sessions/300")
+        self.assertEqual(reloaded.get("recent_frames"), ["a.png", "old.png"])
+        self.assertEqual(reloaded.get("expand_pixels"), 4)
+
+    def test_ingest_dedupes_same_photo(self):
+        from core.digest import file_digest
+        from core.ingest import Ingestor
+        source = os.path.join(self.test_dir, "original.jpg")
+        with open(source, "wb") as f:
+            f.write(os.urandom(4096))
+        _, folder, _ = self.manager.create_folder("500")
+
+        ingestor = Ingestor()
+        first = ingestor.ingest(source, os.path.join(folder, "copy1_original.jpg"))
+        second = ingestor.ingest(source, os.path.join(folder, "copy2_original.jpg"))
+        self.assertFalse(first.reused)
+        self.assertTrue(second.reused)
+        self.assertEqual(first.digest, file_digest(source))
+        self.assertEqual(second.digest, file_digest(second.path))
+
+    def test_ingest_working_copy(self):
+        from PIL import Image
+        from core.ingest import Ingestor
+        source = os.path.join(self.test_dir, "camera.jpg")
+        exif = Image.Exif()
+        exif[0x0112] = 6  # 90도 회전되어 저장된 세로 사진
+        Image.new("RGB", (1200, 800), "white").save(source, exif=exif)
+        _, folder, _ = self.manager.create_folder("600")
+
+        result = Ingestor().ingest(source, os.path.join(folder, "copy1_camera.jpg"), region_sizes=[(300, 200)])
+        self.assertEqual(result.method, "working")
+        with Image.open(result.path) as image:
+            self.assertEqual(image.size, (300, 450))
+            self.assertNotIn(0x0112, image.getexif())
+
 
 class TestImageProcessor(unittest.TestCase):
     def setUp(self):
@@ -74,6 +167,255 @@ class TestImageProcessor(unittest.TestCase):
     def test_instantiation(self):
         self.assertIsInstance(self.processor, ImageProcessor)
 
+    def test_reuses_result_for_identical_input(self):
+        from PIL import Image
+        from core.render_cache import RenderCache
+        test_dir = "test_render_cache"
+        os.makedirs(test_dir, exist_ok=True)
+        self.addCleanup(shutil.rmtree, test_dir)
+        photo = os.path.join(test_dir, "copy1_a.png")
+        Image.new('RGB', (20, 20), (255, 0, 0)).save(photo)
+
+        processor = ImageProcessor(render_cache=RenderCache(os.path.join(test_dir, "cache")))
+        output = processor.process_images([photo], "none", None, test_dir)
+        mtime = os.stat(output).st_mtime_ns
+
+        # 입력이 같으면 결과 파일을 다시 쓰지 않음
+        self.assertEqual(processor.process_images([photo], "none", None, test_dir), output)
+        self.assertEqual(os.stat(output).st_mtime_ns, mtime)
+
+        # 결과 파일이 지워져도 렌더 캐시에서 복원
+        os.remove(output)
+        processor.process_images([photo], "none", None, test_dir)
+        self.assertTrue(os.path.exists(output))
+
+        # 결과 파일이 바깥에서 바뀌면 기록이 무효 - 세션 폴더에는 다이제스트 파일을 만들지 않음
+        with open(output, 'ab') as f:
+            f.write(b'\0')
+        self.assertIsNone(digest.read_output_digest(output))
+        self.assertEqual(sorted(os.listdir(test_dir)), ["cache", "copy1_a.png", "processed_copy1_a.png"])
+
+    def test_digest_memo_is_bounded(self):
+        self.addCleanup(digest._digest_memo.clear)
+        for i in range(digest.MAX_DIGEST_MEMO + 10):
+            digest._memo_put(("p", i, 0), "d")
+        self.assertEqual(len(digest._digest_memo), digest.MAX_DIGEST_MEMO)
+        self.assertIsNone(digest._memo_get(("p", 0, 0)))
+        self.assertEqual(digest._memo_get(("p", 10, 0)), "d")
+
+    def test_frameless_output_applies_exif_orientation(self):
+        from PIL import Image
+        from core.jobs import RenderJob, run_render_job
+        test_dir = "test_frameless_orientation"
+        os.makedirs(test_dir, exist_ok=True)
+        self.addCleanup(shutil.rmtree, test_dir)
+        # 가로로 저장되고 EXIF 방향 6(시계 방향 90도 회전해서 표시)인 사진
+        photo = os.path.join(test_dir, "copy1_a.jpg")
+        exif = Image.Exif()
+        exif[0x0112] = 6
+        Image.new('RGB', (60, 40), (255, 0, 0)).save(photo, exif=exif)
+
+        # 미리보기와 같은 방향 (세로) 으로 저장
+        output = self.processor.process_images([photo], "none", None, test_dir)
+        with Image.open(output) as image:
+            self.assertEqual(image.size, (40, 60))
+        job_output = os.path.join(test_dir, "job.jpg")
+        run_render_job(RenderJob(frame="none", photos=[photo], output=job_output), None, test_dir)
+        with Image.open(job_output) as image:
+            self.assertEqual(image.size, (40, 60))
+
+    def test_preview_matches_full_render_layout(self):
+        from PIL import Image
+        from core.compositing import insert_images_into_frame, render_preview
+        test_dir = "test_render_preview"
+        os.makedirs(test_dir, exist_ok=True)
+        self.addCleanup(shutil.rmtree, test_dir)
+        frame = Image.new('RGBA', (600, 400), (255, 255, 255, 255))
+        frame.paste((0, 0, 0, 0), (100, 100, 300, 300))
+        frame_path = os.path.join(test_dir, "frame.png")
+        frame.save(frame_path)
+        photo = os.path.join(test_dir, "copy1_a.png")
+        Image.new('RGB', (80, 60), (255, 0, 0)).save(photo)
+        photo_regions = [(photo, (100, 100, 300, 300))]
+
+        # 미리보기 상자(280x186) 안에 맞춘 크기, 사진 영역과 프레임 위치는 원본 합성과 같은 비율
+        preview = render_preview(photo_regions, frame_path, (280, 186))
+        self.assertEqual(preview.size, (279, 186))
+        output = os.path.join(test_dir, "processed.png")
+        insert_images_into_frame(photo_regions, frame_path, output)
+        with Image.open(output) as full:
+            for x, y in ((200, 200), (20, 20)):
+                self.assertEqual(preview.getpixel((round(x * 0.465), round(y * 0.465)))[:3],
+                                 full.getpixel((x, y))[:3])
+
+        # 실시간 미리보기: 맞춘 사진을 캐시해 다시 디코딩하지 않고, 쓰이지 않는 항목은 제거
+        cache = {}
+        render_preview(photo_regions, frame_path, (280, 186), fitted_cache=cache)
+        (fitted,) = cache.values()
+        render_preview(photo_regions, frame_path, (280, 186), fitted_cache=cache)
+        self.assertIs(next(iter(cache.values())), fitted)
+        render_preview([], frame_path, (280, 186), fitted_cache=cache)
+        self.assertEqual(cache, {})
+
+    def test_normalized_regions_follow_frame_resolution(self):
+        import json
+        from PIL import Image
+        from core.frame_catalog import FrameManager
+        test_dir = "test_norm_regions"
+        os.makedirs(os.path.join(test_dir, "frame"), exist_ok=True)
+        self.addCleanup(shutil.rmtree, test_dir)
+        frames_json = os.path.join(test_dir, "frames.json")
+        with open(frames_json, 'w', encoding='utf-8') as f:
+            json.dump([{"name": "t", "filename": "f.png", "regions": [[100, 100, 300, 300]]}], f)
+        frame = Image.new('RGBA', (600, 400), (255, 255, 255, 255))
+        frame.paste((0, 0, 0, 0), (100, 100, 300, 300))
+        frame.save(os.path.join(test_dir, "frame", "f.png"))
+
+        # 이전 형식은 로드할 때 정규화 좌표로 변환
+        manager = FrameManager(frames_json)
+        self.assertTrue(manager.migrated)
+        frame_data = manager.get_frame_by_filename("f.png")
+        self.assertEqual(frame_data['norm_regions'], [[0.166667, 0.25, 0.5, 0.75]])
+
+        # 프레임 PNG를 2배 해상도로 바꿔도 영역이 따라감, 절반 배율 합성은 원본 크기와 같음
+        frame.resize((1200, 800)).save(os.path.join(test_dir, "frame", "f.png"))
+        self.assertEqual(manager.pixel_regions(frame_data), [(200, 200, 600, 600)])
+        photo = os.path.join(test_dir, "copy1_a.png")
+        Image.new('RGB', (80, 60), (255, 0, 0)).save(photo)
+        processor = ImageProcessor(frame_dir=os.path.join(test_dir, "frame"))
+        image = processor.render_at_scale([photo], "f.png", manager, scale=0.5)
+        self.assertEqual(image.size, (600, 400))
+        self.assertEqual(image.getpixel((200, 200))[:3], (255, 0, 0))
+        self.assertEqual(image.getpixel((50, 50))[:3], (255, 255, 255))
+        assets = frame_cache.get_frame_cache().peek(os.path.join(test_dir, "frame", "f.png"))
+        self.assertEqual([level.size for level in assets.levels], [(600, 400), (300, 200)])
+
+        # PNG 교체 후 설정 화면 저장: 편집하지 않은 항목은 정규화 좌표 유지, 편집한 항목만 새 크기로 정규화
+        import copy
+        manager.save_frames()
+        manager = FrameManager(frames_json)
+        edited = {"name": "e", "filename": "f.png", "regions": manager.pixel_regions(frame_data)}
+        manager.set_frames(copy.deepcopy(manager.get_all_frames()) + [edited])
+        manager.save_frames()
+        manager = FrameManager(frames_json)
+        untouched, edited = manager.get_all_frames()
+        self.assertEqual(untouched['norm_regions'], [[0.166667, 0.25, 0.5, 0.75]])
+        self.assertEqual(manager.pixel_regions(untouched), [(200, 200, 600, 600)])
+        self.assertEqual((edited['size'], edited['norm_regions']), ([1200, 800], untouched['norm_regions']))
+
+    def test_viewing_frame_in_settings_keeps_norm_regions(self):
+        import json
+        from PIL import Image
+        from core.frame_catalog import FrameManager
+        from core.settings import SettingsManager
+        from ui.settings_dialog import SettingsDialog
+        app = QApplication.instance() or QApplication([])
+        test_dir = "test_settings_norm"
+        os.makedirs(os.path.join(test_dir, "frame"), exist_ok=True)
+        self.addCleanup(shutil.rmtree, test_dir)
+        # 1200x1600 기준으로 저장된 프레임의 PNG가 600x800으로 교체된 상태
+        Image.new('RGBA', (600, 800), (255, 255, 255, 255)).save(os.path.join(test_dir, "frame", "f.png"))
+        frames = [{"name": name, "filename": "f.png", "type": "single_cut", "size": [1200, 1600],
+                   "regions": [[200, 200, 600, 600]], "norm_regions": [[0.166667, 0.125, 0.5, 0.375]]}
+                  for name in ("a", "b")]
+        frames_json = os.path.join(test_dir, "frames.json")
+        with open(frames_json, 'w', encoding='utf-8') as f:
+            json.dump(frames, f)
+
+        dialog = SettingsDialog(FrameManager(frames_json), SettingsManager(os.path.join(test_dir, "settings.json")))
+        for row in (0, 1, 0):
+            dialog.select_frame_row(row)
+        # 보기만 한 프레임은 정규화 좌표를 그대로 유지
+        self.assertEqual(dialog.temp_frames, frames)
+
+        # 영역을 편집하면 현재 PNG 기준 픽셀 좌표로 다시 저장 (저장 시 다시 정규화)
+        dialog.region_widgets[0].x1.setValue(50)
+        self.assertNotIn('norm_regions', dialog.temp_frames[0])
+        self.assertEqual(dialog.temp_frames[0]['regions'], [[50, 100, 300, 300]])
+        self.assertEqual(dialog.temp_frames[1], frames[1])
+
+    def test_slot_masks_follow_frame_openings(self):
+        from PIL import Image, ImageDraw
+        from core.compositing import insert_images_into_frame
+        test_dir = "test_slot_masks"
+        os.makedirs(test_dir, exist_ok=True)
+        self.addCleanup(shutil.rmtree, test_dir)
+        # 원형 구멍 두 개, 영역 사각형은 서로 겹침
+        frame = Image.new('RGBA', (500, 300), (0, 0, 255, 255))
+        draw = ImageDraw.Draw(frame)
+        draw.ellipse((50, 50, 220, 220), fill=(0, 0, 0, 0))
+        draw.ellipse((240, 50, 410, 220), fill=(0, 0, 0, 0))
+        draw.ellipse((56, 198, 70, 212), fill=(0, 0, 0, 0))          # 원 바깥의 작은 장식 구멍
+        draw.rectangle((100, 225, 199, 229), fill=(0, 0, 255, 55))   # 반투명 틴트 (구멍 임계값 미만)
+        frame_path = os.path.join(test_dir, "frame.png")
+        frame.save(frame_path)
+        red, green = os.path.join(test_dir, "red.png"), os.path.join(test_dir, "green.png")
+        Image.new('RGB', (100, 100), (255, 0, 0)).save(red)
+        Image.new('RGB', (100, 100), (0, 255, 0)).save(green)
+
+        output = os.path.join(test_dir, "processed.png")
+        insert_images_into_frame([(red, (50, 50, 250, 220)), (green, (210, 50, 410, 220))], frame_path, output)
+        with Image.open(output) as result:
+            result = result.convert('RGB')
+            self.assertEqual(result.getpixel((215, 135)), (255, 0, 0))   # 빨간 사진은 자기 구멍에 그대로
+            self.assertEqual(result.getpixel((245, 135)), (0, 255, 0))
+            self.assertEqual(result.getpixel((230, 135)), (0, 0, 255))   # 구멍 사이 프레임
+            self.assertEqual(result.getpixel((55, 55)), (0, 0, 255))     # 원 바깥 모서리
+            self.assertEqual(result.getpixel((63, 205)), (255, 0, 0))    # 다른 슬롯 것이 아닌 구멍은 유지
+        # 다른 슬롯 영역을 알려 주면 그 구멍만 제외, 모르면 영역 안의 투명도 그대로
+        cache = frame_cache.get_frame_cache()
+        self.assertEqual(cache.slot_mask(frame_path, (50, 50, 250, 220), others=[(210, 50, 410, 220)])[0],
+                         (50, 50, 221, 220))
+        self.assertEqual(cache.slot_mask(frame_path, (50, 50, 250, 220))[0], (50, 50, 250, 220))
+
+        # 반투명 영역도 프레임 투명도 그대로 마스크에 포함
+        mask_box, mask, warp = cache.slot_mask(frame_path, (90, 100, 210, 230), others=[(210, 50, 410, 220)])
+        self.assertEqual(mask.getpixel((150 - mask_box[0], 227 - mask_box[1])), 200)
+
+        # 구멍 임계값에 못 미치는 반투명 창(알파 150)도 사진을 프레임 아래에 합성
+        tinted = Image.new('RGBA', (400, 300), (255, 255, 255, 255))
+        tinted.paste((255, 255, 255, 150), (100, 50, 300, 250))
+        tinted_path = os.path.join(test_dir, "tinted.png")
+        tinted.save(tinted_path)
+        insert_images_into_frame([(red, (100, 50, 300, 250))], tinted_path, output)
+        with Image.open(output) as result:
+            self.assertEqual(result.convert('RGBA').getpixel((200, 150)), (255, 150, 150, 193))
+
+    def test_tilted_opening_warps_photo(self):
+        from PIL import Image, ImageDraw
+        from core.compositing import insert_images_into_frame
+        from core.region_detect import KIND_RECT, KIND_ROTATED, KIND_SHAPE, detect_openings
+        test_dir = "test_tilted_opening"
+        os.makedirs(test_dir, exist_ok=True)
+        self.addCleanup(shutil.rmtree, test_dir)
+        # 10도 기울어진 사각형, 축 정렬 사각형, 원형 구멍
+        frame = Image.new('RGBA', (900, 400), (0, 0, 255, 255))
+        draw = ImageDraw.Draw(frame)
+        draw.polygon([(70, 80), (316, 123), (281, 320), (35, 277)], fill=(0, 0, 0, 0))
+        draw.rectangle((400, 100, 599, 299), fill=(0, 0, 0, 0))
+        draw.ellipse((650, 100, 850, 300), fill=(0, 0, 0, 0))
+        frame_path = os.path.join(test_dir, "frame.png")
+        frame.save(frame_path)
+
+        openings = detect_openings(frame)
+        self.assertEqual([o.kind for o in openings], [KIND_ROTATED, KIND_RECT, KIND_SHAPE])
+        self.assertAlmostEqual(openings[0].angle, 10, delta=0.5)
+        self.assertEqual(openings[1].box, (400, 100, 600, 300))
+
+        # 위쪽 띠가 빨간 사진 - 구멍을 따라 기울어져 들어가고 구멍 안에 빈 곳이 없음
+        photo = os.path.join(test_dir, "photo.png")
+        image = Image.new('RGB', (250, 200), (0, 255, 0))
+        ImageDraw.Draw(image).rectangle((0, 0, 249, 30), fill=(255, 0, 0))
+        image.save(photo)
+        output = os.path.join(test_dir, "processed.png")
+        insert_images_into_frame([(photo, openings[0].box)], frame_path, output)
+        with Image.open(output) as result:
+            result = result.convert('RGB')
+            self.assertEqual(result.getpixel((193, 110)), (255, 0, 0))   # 기울어진 위쪽 변 근처
+            self.assertEqual(result.getpixel((175, 200)), (0, 255, 0))
+            self.assertEqual(result.getpixel((60, 100)), (0, 0, 255))    # 박스 안이지만 구멍 밖
+            self.assertEqual(result.getpixel((45, 270)), (0, 255, 0))    # 왼쪽 아래 모서리 안쪽
+
 
 class TestPrintManager(unittest.TestCase):
     def setUp(self):
@@ -82,6 +424,353 @@ class TestPrintManager(unittest.TestCase):
     def test_instantiation(self):
         self.assertIsInstance(self.manager, PrintManager)
 
+    def test_print_raster_cached_at_device_size(self):
+        import tempfile
+        from PIL import Image
+        from core.print_render import render_print_raster
+        with tempfile.TemporaryDirectory() as tmp:
+            image_path = os.path.join(tmp, "processed_a.png")
+            Image.new("RGB", (600, 400), "white").save(image_path)
+
+            raster = render_print_raster(image_path, (300, 300))
+            self.assertEqual((raster.width, raster.height), (300, 200))
+            self.assertFalse(raster.cached)
+            self.assertTrue(render_print_raster(image_path, (300, 300)).cached)
+
+            # 인쇄 영역이 더 크면 확대하지 않고 그대로 (프린터 쪽에서 확대)
+            self.assertEqual(render_print_raster(image_path, (1200, 1200)).width, 600)
+
+    def test_file_backend_prints_without_dialog(self):
+        import tempfile
+        from PIL import Image
+        from ui import print_cli
+        app = QApplication.instance() or QApplication([])
+        with tempfile.TemporaryDirectory() as tmp:
+            image_path = os.path.join(tmp, "processed_a.png")
+            Image.new("RGB", (60, 180), (255, 0, 0)).save(image_path)
+            out_dir = os.path.join(tmp, "prints")
+            self.assertEqual(print_cli.main([image_path, "--backend", "png", "--layout", "2up",
+                                             "--dpi", "50", "-o", out_dir]), 0)
+            (name,) = os.listdir(out_dir)
+            with Image.open(os.path.join(out_dir, name)) as page:
+                # 4x6인치 x 50dpi 용지에 같은 결과 두 장 (가운데는 셀 안, 모서리는 흰 여백)
+                self.assertEqual(page.size, (200, 300))
+                self.assertEqual(page.convert("RGB").getpixel((60, 150)), (255, 0, 0))
+                self.assertEqual(page.convert("RGB").getpixel((2, 2)), (255, 255, 255))
+
+            # 모아서 인쇄하는 작업은 하나만 모였어도 반복하지 않음 (남은 셀은 비움)
+            shutil.rmtree(out_dir)
+            self.assertEqual(print_cli.main([image_path, "--backend", "png", "--layout", "2up", "--collect",
+                                             "--dpi", "50", "-o", out_dir]), 0)
+            (name,) = os.listdir(out_dir)
+            with Image.open(os.path.join(out_dir, name)) as page:
+                self.assertEqual(page.convert("RGB").getpixel((60, 150)), (255, 0, 0))
+                self.assertEqual(page.convert("RGB").getpixel((140, 150)), (255, 255, 255))
+
+    def test_print_queue_collect_flush_and_retry(self):
+        from ui.print_queue import PrintQueue, STATUS_COLLECTING, STATUS_DONE, STATUS_FAILED
+
+        class FakePrintManager:
+            def __init__(self):
+                self.calls = []
+                self.fail = False
+
+            def render_to_sink(self, sink, image_paths, layout, repeat=False):
+                self.calls.append((list(image_paths), layout, repeat))
+                if self.fail:
+                    raise RuntimeError("용지 없음")
+                return {}
+
+        class FakeSink:
+            output_path = None
+
+        manager = FakePrintManager()
+        print_queue = PrintQueue(manager)
+        self.addCleanup(print_queue.stop)
+
+        # 단일 결과 submit만 배치 수만큼 반복
+        single = print_queue.submit(["a.png"], FakeSink(), "2up")
+        print_queue.wait()
+        self.assertEqual(single.status, STATUS_DONE)
+        self.assertEqual(manager.calls[-1], (["a.png"], "2up", True))
+
+        # 모으는 중에는 인쇄하지 않고, 배치 수가 차면 반복 없이 한 장으로 인쇄
+        collected = print_queue.collect("b.png", FakeSink(), "2up")
+        self.assertEqual(collected.status, STATUS_COLLECTING)
+        self.assertEqual(len(manager.calls), 1)
+        self.assertIs(print_queue.collect("c.png", FakeSink(), "2up"), collected)
+        print_queue.wait()
+        self.assertEqual(collected.status, STATUS_DONE)
+        self.assertEqual(manager.calls[-1], (["b.png", "c.png"], "2up", False))
+
+        # 덜 모인 작업은 flush로 모인 만큼 바로 인쇄 (역시 반복 안 함)
+        partial = print_queue.collect("d.png", FakeSink(), "2up")
+        self.assertIsNot(partial, collected)
+        print_queue.flush(partial)
+        print_queue.wait()
+        self.assertEqual(partial.status, STATUS_DONE)
+        self.assertEqual(manager.calls[-1], (["d.png"], "2up", False))
+
+        # 다시 시도는 실패한 작업만
+        manager.fail = True
+        failed = print_queue.submit(["e.png", "f.png"], FakeSink(), "2up")
+        print_queue.wait()
+        self.assertEqual(failed.status, STATUS_FAILED)
+        self.assertEqual(failed.error, "용지 없음")
+        self.assertEqual(manager.calls[-1], (["e.png", "f.png"], "2up", False))
+
+        count = len(manager.calls)
+        print_queue.retry(single)
+        print_queue.flush(collected)
+        print_queue.wait()
+        self.assertEqual(len(manager.calls), count)
+        self.assertEqual(single.status, STATUS_DONE)
+
+        manager.fail = False
+        print_queue.retry(failed)
+        print_queue.wait()
+        self.assertEqual(failed.status, STATUS_DONE)
+        self.assertIsNone(failed.error)
+        self.assertEqual(failed.attempts, 2)
+        self.assertEqual(print_queue.pending_count(), 0)
+
+    def test_plan_page_two_up(self):
+        from core.imposition import plan_page
+        # 세로로 긴 스트립 두 장은 세로 용지에 나란히 (2열 x 1행)
+        plan = plan_page((1200, 1800), (600, 1800), 2)
+        self.assertEqual(plan.grid, (2, 1))
+        (x1, y1, w, h), (x2, y2, _, _) = plan.cells
+        self.assertEqual((x2 - x1, y1, y2), (w, y1, y1))
+        self.assertLessEqual(h, 1800 - 2 * 36)
+        self.assertEqual(len(plan.cut_marks), 2 * 3 + 2 * 2)
+        # 재단선은 셀 바깥 여백에만
+        for mx1, my1, mx2, my2 in plan.cut_marks:
+            self.assertTrue(max(my1, my2) <= y1 or min(my1, my2) >= y1 + h
+                            or max(mx1, mx2) <= x1 or min(mx1, mx2) >= x2 + w)
+
+class TestFrameListModel(unittest.TestCase):
+    def test_thumbnails_use_row_index_and_bounded_cache(self):
+        import tempfile
+        from unittest import mock
+        from PyQt5.QtCore import Qt
+        from PyQt5.QtGui import QImage
+        from ui.frame_list_model import FrameListModel
+        app = QApplication.instance() or QApplication([])
+        self.addCleanup(FrameListModel._pixmap_cache.clear)
+        with tempfile.TemporaryDirectory() as tmp:
+            for name in ("a.png", "b.png"):
+                QImage(20, 20, QImage.Format_RGB32).save(os.path.join(tmp, name))
+            frames = [{"name": "a", "filename": "a.png"}, {"name": "b", "filename": "b.png"},
+                      {"name": "a2", "filename": "a.png"}]
+            model = FrameListModel(frames, frame_dir=tmp)
+            path = os.path.join(tmp, "a.png")
+
+            # 같은 파일을 쓰는 행만 갱신
+            changed = []
+            model.dataChanged.connect(lambda top, bottom, roles: changed.append(top.row()))
+            model._on_thumbnail_loaded(path, QImage(10, 10, QImage.Format_RGB32))
+            self.assertEqual(changed, [0, 2])
+
+            # 다시 그릴 때마다 stat 하지 않음
+            with mock.patch("ui.frame_list_model.os.stat", wraps=os.stat) as stat:
+                for _ in range(3):
+                    model.data(model.index(0), Qt.DecorationRole)
+                self.assertEqual(stat.call_count, 0)
+
+            # 캐시는 최대 개수를 넘지 않음 (오래 사용하지 않은 것부터 제거)
+            with mock.patch.object(FrameListModel, "MAX_CACHED_THUMBNAILS", 1):
+                model._on_thumbnail_loaded(os.path.join(tmp, "b.png"), QImage(10, 10, QImage.Format_RGB32))
+                self.assertEqual([key[0] for key in FrameListModel._pixmap_cache], [os.path.join(tmp, "b.png")])
+
+class TestLivePreview(unittest.TestCase):
+    def test_keeps_only_latest_request(self):
+        import threading
+        from PyQt5.QtCore import Qt
+        from ui.live_preview import LivePreview
+
+        class BlockingProcessor:
+            """첫 합성이 끝나지 않은 동안 요청이 더 들어오도록 붙잡아 두는 가짜 처리기"""
+            def __init__(self):
+                self.started = threading.Event()
+                self.release = threading.Event()
+                self.calls = []
+
+            def render_preview(self, files, frame_name, frame_manager, box_size, expand_pixels=0, fitted_cache=None):
+                self.calls.append(list(files))
+                self.started.set()
+                self.release.wait(5)
+                return None
+
+        processor = BlockingProcessor()
+        preview = LivePreview(processor, frame_manager=None)
+        self.addCleanup(preview.stop)
+        rendered = []
+        preview.rendered.connect(lambda serial, image: rendered.append((serial, image)), Qt.DirectConnection)
+
+        preview.request(["a.jpg"], "frame", (300, 200))
+        self.assertTrue(processor.started.wait(5))
+        # 합성 중 연속 요청은 쌓이지 않고 마지막 것으로 대체됨
+        preview.request(["a.jpg", "b.jpg"], "frame", (300, 200))
+        latest = preview.request(["a.jpg", "b.jpg", "c.jpg"], "frame", (300, 200))
+        processor.release.set()
+        preview.wait()
+
+        self.assertEqual(latest, 3)
+        self.assertEqual(processor.calls, [["a.jpg"], ["a.jpg", "b.jpg", "c.jpg"]])
+        self.assertEqual(rendered, [(1, None), (3, None)])
+
+        # 끝난 뒤의 요청은 스레드를 다시 시작
+        self.assertEqual(preview.request(["d.jpg"], "frame", (300, 200)), 4)
+        preview.wait()
+        self.assertEqual(processor.calls[-1], ["d.jpg"])
+        self.assertEqual(rendered[-1], (4, None))
+
+
+class TestStartupBudget(unittest.TestCase):
+    def test_deferred_modules_not_imported(self):
+        result = startup_bench.measure_import_time(runs=1)
+        # 지연 로드 대상 모듈은 시작 시점에 import 되지 않아야 함
+        self.assertEqual(startup_bench.find_deferred_imports(result["modules"]), [])
+
+    @unittest.skipUnless(os.environ.get("BITTARA_STARTUP_BUDGET"),
+                         "시간 예산 검사는 BITTARA_STARTUP_BUDGET=1 일 때만 (부하가 있는 CI에서 불안정)")
+    def test_import_time_within_budget(self):
+        result = startup_bench.measure_import_time()
+        self.assertLess(result["total_ms"], startup_bench.DEFAULT_BUDGET_MS)
+
+class TestCoreHeadless(unittest.TestCase):
+    def test_core_does_not_import_qt(self):
+        # 코어 패키지는 PyQt5 없이 로드되어야 함 (워커 프로세스, CLI, 테스트용)
+        import subprocess
+        code = ("import sys, core, core.compositing, core.frame_cache, core.imaging; "
+                "print(any(m == 'PyQt5' or m.startswith('PyQt5.') for m in sys.modules))")
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)))
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), "False")
+
+class TestFrameCache(unittest.TestCase):
+    def setUp(self):
+        from PIL import Image
+        self.test_dir = "test_frame_cache"
+        os.makedirs(self.test_dir, exist_ok=True)
+        self.paths = []
+        for i in range(3):
+            path = os.path.join(self.test_dir, f"frame{i}.png")
+            Image.new('RGBA', (100, 100), (255, 0, 0, 128)).save(path)
+            self.paths.append(path)
+
+    def tearDown(self):
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def test_budget_eviction(self):
+        # 프레임 2장 분량의 예산 -> 가장 오래된 항목 제거
+        cache = frame_cache.FrameCache(budget_bytes=2 * frame_cache.estimate_nbytes((100, 100)) + 2 * 100 * 100 * 4)
+        for path in self.paths:
+            cache.get(path)
+        self.assertNotIn(self.paths[0], cache)
+        self.assertIn(self.paths[2], cache)
+        self.assertLessEqual(cache.used_bytes, cache.budget_bytes)
+
+    def test_warm_order(self):
+        frames = [{'filename': 'a.png'}, {'filename': 'b.png'}, {'filename': 'c.png'}]
+        self.assertEqual(frame_cache.order_frames_for_warmup(frames, ['c.png', 'x.png']),
+                         ['c.png', 'a.png', 'b.png'])
+
+        cache = frame_cache.FrameCache()
+        self.assertEqual(cache.warm(self.paths, regions={self.paths[1]: [(10, 10, 60, 60), (50, 10, 90, 60)]}), 3)
+        self.assertEqual(cache.get(self.paths[0]).alpha.mode, 'L')
+        # 영역을 주면 합성과 같은 슬롯 마스크까지 미리 준비
+        masks = cache.get(self.paths[1]).slot_masks
+        self.assertEqual(len(masks), 2)
+        self.assertIs(cache.slot_mask(self.paths[1], (10, 10, 60, 60), others=[(50, 10, 90, 60)]),
+                      masks[((100, 100), (10, 10, 60, 60), ((50, 10, 90, 60),))])
+
+    def test_raw_store_roundtrip(self):
+        from PIL import Image
+        store = frame_cache.RawFrameStore(os.path.join(self.test_dir, "raw"))
+        decoded = frame_cache.decode_frame(self.paths[0], disk_store=store)
+        mapped = frame_cache.decode_frame(self.paths[0], disk_store=store)
+        self.assertEqual(mapped.frame.tobytes(), decoded.frame.tobytes())
+        self.assertEqual(mapped.preview.size, decoded.preview.size)
+
+        # 원본 PNG가 바뀌면 이전 raw 파일은 무효화/삭제
+        Image.new('RGBA', (50, 50), (0, 0, 255, 255)).save(self.paths[0])
+        changed = frame_cache.decode_frame(self.paths[0], disk_store=store)
+        self.assertEqual(changed.size, (50, 50))
+        self.assertEqual(len(os.listdir(store.cache_dir)), 1)
+
+        # raw 파일은 원본 크기/수정 시각으로 찾음 (시작 시 PNG 전체를 해시하지 않음)
+        stat = os.stat(self.paths[0])
+        self.assertEqual(os.listdir(store.cache_dir),
+                         [f"{store.source_prefix(self.paths[0])}{stat.st_size}-{stat.st_mtime_ns}.raw"])
+
+class TestRenderCli(unittest.TestCase):
+    def setUp(self):
+        from PIL import Image
+        self.test_dir = "test_render_cli"
+        os.makedirs(self.test_dir, exist_ok=True)
+        Image.new('RGB', (40, 30), (0, 128, 255)).save(os.path.join(self.test_dir, "a.jpg"))
+
+    def tearDown(self):
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def test_csv_manifest(self):
+        from core import cli, jobs
+        manifest = os.path.join(self.test_dir, "jobs.csv")
+        with open(manifest, "w", encoding="utf-8") as f:
+            f.write("frame,output,photo1,photo2,profile\n")
+            f.write("none,out/a.png,a.jpg,,archive\n")
+        loaded = jobs.load_manifest(manifest)
+        self.assertEqual(loaded[0].photos, [os.path.join(os.path.abspath(self.test_dir), "a.jpg"), None])
+        self.assertEqual(loaded[0].profile, "archive")
+
+        self.assertEqual(cli.main(["render", "--manifest", manifest, "-q"]), 0)
+        self.assertTrue(os.path.exists(os.path.join(self.test_dir, "out", "a.png")))
+
+    def test_batch_frame_affinity(self):
+        from core.batch import BatchRenderer, assign_by_frame
+        from core.jobs import RenderJob
+        jobs = [RenderJob(frame=f, photos=[], output=str(i)) for i, f in enumerate("aaaabbc")]
+        assignments = assign_by_frame(jobs, 2)
+        self.assertEqual(sorted(i for worker in assignments for i in worker), list(range(7)))
+        # 같은 프레임 묶음(최대 ceil(7/2)=4개)은 한 워커에 모임
+        self.assertIn([0, 1, 2, 3], assignments)
+
+        photo = os.path.abspath(os.path.join(self.test_dir, "a.jpg"))
+        jobs = [RenderJob(frame="none", photos=[photo], output=os.path.join(os.path.abspath(self.test_dir), f"b{i}.png"))
+                for i in range(3)]
+        with BatchRenderer(workers=2) as renderer:
+            results = list(renderer.run(jobs))
+        self.assertEqual(sorted(r.index for r in results), [0, 1, 2])
+        self.assertTrue(all(r.ok for r in results))
+        self.assertEqual(renderer.stats.succeeded, 3)
+
+    def test_rerender_skips_unchanged_sessions(self):
+        from core import cli, rerender
+        from core.digest import read_output_digest
+        session_dir = os.path.join(self.test_dir, "sessions", "101")
+        os.makedirs(session_dir)
+        for slot in (2, 1):
+            shutil.copy(os.path.join(self.test_dir, "a.jpg"), os.path.join(session_dir, f"copy{slot}_a.jpg"))
+
+        session = rerender.read_session(session_dir)
+        self.assertEqual([os.path.basename(p) for p in session.slots], ["copy1_a.jpg", "copy2_a.jpg"])
+
+        root = os.path.join(self.test_dir, "sessions")
+        args = ["rerender", root, "--frame", "none", "--all-sessions", "--workers", "1", "-q", "--expand-pixels", "0"]
+        self.assertEqual(cli.main(args), 0)
+        # 다이제스트는 세션 폴더가 아니라 캐시에 기록
+        self.assertIsNotNone(read_output_digest(os.path.join(session_dir, "processed_copy1_a.jpg")))
+        self.assertFalse([n for n in os.listdir(session_dir) if n.endswith(".digest")])
+
+        jobs, skipped = rerender.plan_rerender(rerender.scan_sessions(root), None, "frame")
+        self.assertEqual((len(jobs), len(skipped)), (0, 1))
+        jobs, _ = rerender.plan_rerender(rerender.scan_sessions(root), None, "frame", profile="web")
+        self.assertEqual(len(jobs), 1)
+
 if __name__ == '__main__':
     # QApplication 필요 (QMessageBox 등 사용 시)
     app = QApplication(sys.argv)
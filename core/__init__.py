@@ -0,0 +1,18 @@
+"""
+코어 패키지 (Qt 비의존)
+합성, 레이아웃 계획, 프레임 카탈로그, 설정, 세션 폴더 관리를 포함합니다.
+GUI(ui 패키지), CLI, 워커 프로세스가 공통으로 사용하며 PyQt5를 import 하지 않습니다.
+PIL은 합성/캐시 모듈(core.compositing, core.frame_cache)을 사용할 때 로드됩니다.
+"""
+
+from .frame_catalog import FrameManager
+from .settings import SettingsManager
+from .session import FolderManager
+from .processor import ImageProcessor
+
+__all__ = [
+    'FrameManager',
+    'SettingsManager',
+    'FolderManager',
+    'ImageProcessor',
+]
@@ -0,0 +1,7 @@
+"""python -m core 진입점 (core.cli 참고)"""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
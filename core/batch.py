@@ -0,0 +1,233 @@
+"""
+배치 렌더링 모듈
+미리 띄워 둔 워커 프로세스들로 많은 합성 작업을 병렬 처리합니다 (행사 전체 재렌더링 등).
+
+- 워커는 시작 시 한 번만 생성되고, 각자 프레임 캐시를 유지합니다.
+- 같은 프레임을 쓰는 작업은 같은 워커로 보내 캐시 적중을 높입니다 (프레임 친화도).
+- 결과는 완료되는 순서대로 스트리밍되며, 끝나면 jobs/s와 작업별 지연 시간을 집계합니다.
+
+사용 예:
+    with BatchRenderer(workers=4) as renderer:
+        for result in renderer.run(jobs):
+            print(result.output, result.ok)
+        print(renderer.stats.summary())
+"""
+
+import contextlib
+import io
+import math
+import multiprocessing
+import os
+import queue
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+_STOP = None
+
+
+@dataclass
+class BatchResult:
+    """작업 하나의 결과"""
+    index: int                  # 입력 작업 목록에서의 위치
+    output: str
+    ok: bool
+    error: Optional[str] = None
+    latency_ms: float = 0.0     # 워커에서 측정한 작업 처리 시간
+    worker: int = -1
+    cache_hit: bool = False     # 작업 시작 시 프레임이 워커 캐시에 있었는지
+
+
+@dataclass
+class BatchStats:
+    """배치 실행 통계"""
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    cache_hits: int = 0
+    wall_seconds: float = 0.0
+    latencies_ms: List[float] = field(default_factory=list)
+
+    def add(self, result):
+        if result.ok:
+            self.succeeded += 1
+        else:
+            self.failed += 1
+        if result.cache_hit:
+            self.cache_hits += 1
+        self.latencies_ms.append(result.latency_ms)
+
+    @property
+    def jobs_per_second(self):
+        done = self.succeeded + self.failed
+        return done / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    def percentile(self, p):
+        """지연 시간 백분위수 (nearest-rank)"""
+        if not self.latencies_ms:
+            return 0.0
+        ordered = sorted(self.latencies_ms)
+        rank = max(1, math.ceil(p / 100.0 * len(ordered)))
+        return ordered[rank - 1]
+
+    def summary(self):
+        mean = sum(self.latencies_ms) / len(self.latencies_ms) if self.latencies_ms else 0.0
+        return (f"{self.succeeded}개 완료, {self.failed}개 실패 / {self.total}개, "
+                f"총 {self.wall_seconds:.2f} s ({self.jobs_per_second:.2f} jobs/s), "
+                f"지연 평균 {mean:.1f} ms, p50 {self.percentile(50):.1f} ms, "
+                f"p95 {self.percentile(95):.1f} ms, 최대 {self.percentile(100):.1f} ms, "
+                f"프레임 캐시 적중 {self.cache_hits}/{self.total}")
+
+
+def assign_by_frame(jobs, workers):
+    """프레임 친화도 기반 작업 배분
+
+    같은 프레임 작업을 묶되, 한 프레임이 전체의 1/workers보다 많으면 여러 워커로 나눠
+    부하를 맞춥니다. 묶음은 큰 것부터 가장 한가한 워커에 배정합니다.
+
+    Returns: 워커별 작업 인덱스 목록 [[index, ...], ...]
+    """
+    groups = OrderedDict()
+    for index, job in enumerate(jobs):
+        groups.setdefault(job.frame, []).append(index)
+
+    chunk_size = max(1, math.ceil(len(jobs) / workers))
+    chunks = []
+    for indices in groups.values():
+        for start in range(0, len(indices), chunk_size):
+            chunks.append(indices[start:start + chunk_size])
+    chunks.sort(key=len, reverse=True)
+
+    assignments = [[] for _ in range(workers)]
+    for chunk in chunks:
+        target = min(range(workers), key=lambda w: len(assignments[w]))
+        assignments[target].extend(chunk)
+    return assignments
+
+
+def _worker_main(worker_id, task_queue, result_queue, frames_json, frame_dir):
+    """워커 프로세스 루프 - 프레임 카탈로그와 프레임 캐시를 프로세스 수명 동안 유지"""
+    from .frame_cache import get_frame_cache
+    from .frame_catalog import FrameManager
+    from .jobs import NO_FRAME, run_render_job
+
+    frame_manager = FrameManager(frames_json)
+    cache = get_frame_cache()
+
+    while True:
+        task = task_queue.get()
+        if task is _STOP:
+            break
+        index, job = task
+
+        cache_hit = False
+        if job.frame != NO_FRAME:
+            frame_data = frame_manager.find_frame(job.frame)
+            if frame_data:
+                cache_hit = os.path.join(frame_dir, frame_data['filename']) in cache
+
+        started = time.perf_counter()
+        try:
+            # 합성 디버그 출력은 워커에서 숨김
+            with contextlib.redirect_stdout(io.StringIO()):
+                run_render_job(job, frame_manager, frame_dir)
+            result = BatchResult(index, job.output, True)
+        except Exception as e:
+            result = BatchResult(index, job.output, False, error=str(e))
+        result.latency_ms = (time.perf_counter() - started) * 1000
+        result.worker = worker_id
+        result.cache_hit = cache_hit
+        result_queue.put(result)
+
+
+class BatchRenderer:
+    """프로세스 풀 기반 배치 렌더러 (워커를 미리 띄워 재사용)"""
+
+    def __init__(self, workers=None, frames_json="frames.json", frame_dir="frame"):
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.frames_json = os.path.abspath(frames_json)
+        self.frame_dir = os.path.abspath(frame_dir)
+        self.stats = BatchStats()
+
+        # Qt 등 스레드를 가진 부모 프로세스에서도 안전하도록 spawn 사용
+        self._context = multiprocessing.get_context("spawn")
+        self._processes = []
+        self._task_queues = []
+        self._result_queue = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def start(self):
+        """워커 프로세스 시작 (이미 시작되었으면 무시)"""
+        if self._processes:
+            return
+        self._result_queue = self._context.Queue()
+        for worker_id in range(self.workers):
+            task_queue = self._context.Queue()
+            process = self._context.Process(
+                target=_worker_main,
+                args=(worker_id, task_queue, self._result_queue, self.frames_json, self.frame_dir),
+                daemon=True,
+            )
+            process.start()
+            self._task_queues.append(task_queue)
+            self._processes.append(process)
+
+    def close(self):
+        """워커 종료"""
+        for task_queue in self._task_queues:
+            task_queue.put(_STOP)
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        self._processes = []
+        self._task_queues = []
+        self._result_queue = None
+
+    def run(self, jobs):
+        """작업 실행 - 완료되는 순서대로 BatchResult를 생성(yield)
+
+        실행이 끝나면 self.stats에 통계가 남습니다.
+        """
+        self.start()
+        jobs = list(jobs)
+        self.stats = BatchStats(total=len(jobs))
+        started = time.perf_counter()
+
+        outstanding = [set() for _ in range(self.workers)]
+        for worker_id, indices in enumerate(assign_by_frame(jobs, self.workers)):
+            for index in indices:
+                outstanding[worker_id].add(index)
+                self._task_queues[worker_id].put((index, jobs[index]))
+
+        remaining = len(jobs)
+        while remaining:
+            try:
+                result = self._result_queue.get(timeout=0.5)
+            except queue.Empty:
+                # 비정상 종료한 워커의 남은 작업은 실패로 처리
+                for worker_id, process in enumerate(self._processes):
+                    if not process.is_alive() and outstanding[worker_id]:
+                        for index in sorted(outstanding[worker_id]):
+                            result = BatchResult(index, jobs[index].output, False,
+                                                 error=f"워커 {worker_id} 비정상 종료 (exit code {process.exitcode})",
+                                                 worker=worker_id)
+                            self.stats.add(result)
+                            remaining -= 1
+                            yield result
+                        outstanding[worker_id].clear()
+                continue
+
+            outstanding[result.worker].discard(result.index)
+            self.stats.add(result)
+            remaining -= 1
+            yield result
+
+        self.stats.wall_seconds = time.perf_counter() - started
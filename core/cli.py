@@ -0,0 +1,211 @@
+"""
+명령줄 합성 도구
+GUI 없이 frames.json의 프레임으로 사진을 합성합니다 (재렌더링, 자동화, 성능 측정용).
+
+사용법:
+    python -m core render --frame 01.png -o out.jpg a.jpg b.jpg c.jpg d.jpg
+    python -m core render --frame "4컷 - 파란색" -o out.png --expand-pixels 5 --profile archive a.jpg ...
+    python -m core render --manifest jobs.json     # 또는 jobs.csv (형식은 core.jobs 참고)
+    python -m core render --manifest jobs.json --workers 4   # 프로세스 풀로 병렬 처리 (core.batch)
+    python -m core rerender . --frame 02.png     # 세션 폴더 전체를 다른 프레임으로 재합성 (core.rerender)
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+from .encoders import DEFAULT_PROFILE, ENCODER_PROFILES
+from .frame_catalog import FrameManager
+from .batch import BatchResult, BatchStats
+from .jobs import NO_FRAME, RenderJob, load_manifest, run_render_job
+
+
+def _add_catalog_arguments(parser):
+    parser.add_argument("--frames-json", default="frames.json", help="프레임 카탈로그 경로 (기본: frames.json)")
+    parser.add_argument("--frame-dir", default="frame", help="프레임 이미지 폴더 (기본: frame)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="합성 디버그 출력 숨김")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m core", description="Bittara Photo 명령줄 합성 도구")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    render = subparsers.add_parser("render", help="사진을 프레임에 합성하여 저장")
+    render.add_argument("photos", nargs="*", help="슬롯 순서대로의 사진 경로")
+    render.add_argument("--frame", help="frames.json의 프레임 파일명 또는 이름 ('none'이면 프레임 없이 저장)")
+    render.add_argument("-o", "--output", help="출력 파일 경로 (.jpg/.jpeg는 JPEG, 그 외 PNG)")
+    render.add_argument("--expand-pixels", type=int, default=0, help="합성 영역 확장 픽셀 (기본: 0)")
+    render.add_argument("--profile", default=DEFAULT_PROFILE, choices=sorted(ENCODER_PROFILES),
+                        help=f"인코더 프로필 (기본: {DEFAULT_PROFILE})")
+    render.add_argument("--manifest", help="여러 작업을 담은 JSON/CSV 매니페스트")
+    render.add_argument("--stop-on-error", action="store_true", help="매니페스트 작업 실패 시 중단")
+    render.add_argument("--workers", type=int, default=1,
+                        help="병렬 처리 워커 프로세스 수 (기본: 1, 0이면 CPU 수)")
+    _add_catalog_arguments(render)
+    render.set_defaults(handler=cmd_render)
+
+    rerender = subparsers.add_parser("rerender", help="세션 폴더들을 다른 프레임으로 다시 합성")
+    rerender.add_argument("root", nargs="?", default=".", help="세션 폴더들이 있는 루트 (기본: 현재 폴더)")
+    rerender.add_argument("--frame", required=True, help="frames.json의 프레임 파일명 또는 이름 ('none' 가능)")
+    rerender.add_argument("--expand-pixels", type=int, default=None,
+                          help="합성 영역 확장 픽셀 (기본: settings.json 값)")
+    rerender.add_argument("--profile", default=DEFAULT_PROFILE, choices=sorted(ENCODER_PROFILES),
+                          help=f"인코더 프로필 (기본: {DEFAULT_PROFILE})")
+    rerender.add_argument("--output-root", help="결과를 둘 루트 (기본: 각 세션 폴더에 덮어씀)")
+    rerender.add_argument("--all-sessions", action="store_true",
+                          help="사진 수가 프레임 영역 수와 다른 세션도 포함")
+    rerender.add_argument("--force", action="store_true", help="입력이 바뀌지 않았어도 다시 렌더링")
+    rerender.add_argument("--dry-run", action="store_true", help="렌더링할 세션만 출력")
+    rerender.add_argument("--workers", type=int, default=0, help="워커 프로세스 수 (기본: 0 = CPU 수)")
+    rerender.add_argument("--settings", default="settings.json", help="설정 파일 경로 (기본: settings.json)")
+    _add_catalog_arguments(rerender)
+    rerender.set_defaults(handler=cmd_rerender)
+
+    return parser
+
+
+def iter_results_sequential(jobs, frame_manager, frame_dir, quiet=False, stop_on_error=False):
+    """작업들을 현재 프로세스에서 순서대로 실행하며 BatchResult를 생성(yield)"""
+    for index, job in enumerate(jobs):
+        started = time.perf_counter()
+        try:
+            with contextlib.redirect_stdout(io.StringIO()) if quiet else contextlib.nullcontext():
+                run_render_job(job, frame_manager, frame_dir)
+            result = BatchResult(index, job.output, True)
+        except Exception as e:
+            result = BatchResult(index, job.output, False, error=str(e))
+        result.latency_ms = (time.perf_counter() - started) * 1000
+        yield result
+        if stop_on_error and not result.ok:
+            break
+
+
+def execute_jobs(jobs, frames_json, frame_dir, workers=1, quiet=False, stop_on_error=False,
+                 on_result=None, label="render"):
+    """작업 실행 (workers > 1이면 프로세스 풀) - 완료 순서대로 결과를 출력하고 통계 반환
+
+    on_result(job, result)는 각 작업이 끝날 때마다 호출됩니다.
+    """
+    frame_dir = os.path.abspath(frame_dir)
+
+    if workers > 1 and len(jobs) > 1:
+        from .batch import BatchRenderer
+
+        with BatchRenderer(workers=min(workers, len(jobs)), frames_json=frames_json,
+                           frame_dir=frame_dir) as renderer:
+            for result in renderer.run(jobs):
+                _report(jobs[result.index], result, on_result, label)
+            stats = renderer.stats
+    else:
+        frame_manager = FrameManager(frames_json)
+        if not frame_manager.get_all_frames():
+            print(f"[{label}] 경고: 프레임 카탈로그가 비어 있음: {frames_json}", file=sys.stderr)
+
+        stats = BatchStats(total=len(jobs))
+        started = time.perf_counter()
+        for result in iter_results_sequential(jobs, frame_manager, frame_dir, quiet, stop_on_error):
+            stats.add(result)
+            _report(jobs[result.index], result, on_result, label)
+        stats.wall_seconds = time.perf_counter() - started
+
+    print(f"[{label}] {stats.summary()}")
+    return stats
+
+
+def _report(job, result, on_result, label):
+    if result.ok:
+        worker = f", 워커 {result.worker}" if result.worker >= 0 else ""
+        print(f"[{label}] 완료 {result.output} ({result.latency_ms:.1f} ms{worker})")
+    else:
+        print(f"[{label}] 실패 {result.output}: {result.error}", file=sys.stderr)
+    if on_result is not None:
+        on_result(job, result)
+
+
+def _worker_count(args, parser):
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+    if workers > 1 and getattr(args, "stop_on_error", False):
+        parser.error("--stop-on-error는 --workers 1에서만 사용할 수 있습니다.")
+    return workers
+
+
+def cmd_render(args, parser):
+    if args.manifest:
+        if args.photos or args.frame or args.output:
+            parser.error("--manifest는 사진/--frame/--output과 함께 사용할 수 없습니다.")
+        jobs = load_manifest(args.manifest)
+    else:
+        if not args.frame or not args.output or not args.photos:
+            parser.error("--frame, --output, 사진 경로가 필요합니다 (또는 --manifest 사용).")
+        jobs = [RenderJob(frame=args.frame, photos=args.photos, output=args.output,
+                          expand_pixels=args.expand_pixels, profile=args.profile)]
+
+    stats = execute_jobs(jobs, args.frames_json, args.frame_dir, _worker_count(args, parser),
+                         quiet=args.quiet, stop_on_error=args.stop_on_error)
+    return 1 if stats.failed else 0
+
+
+def cmd_rerender(args, parser):
+    from .digest import write_output_digest
+    from .rerender import plan_rerender, scan_sessions
+    from .session import SessionManifest
+    from .settings import SettingsManager
+
+    frame_manager = FrameManager(args.frames_json)
+    frame_data = None
+    if args.frame != NO_FRAME:
+        frame_data = frame_manager.find_frame(args.frame)
+        if frame_data is None:
+            parser.error(f"frames.json에 없는 프레임: {args.frame}")
+
+    expand_pixels = args.expand_pixels
+    if expand_pixels is None:
+        # 지정하지 않으면 GUI 설정값 사용
+        expand_pixels = SettingsManager(args.settings).get("expand_pixels", 0)
+
+    slot_count = None
+    if not args.all_sessions:
+        slot_count = len(frame_data.get('regions', [])) if frame_data else 1
+
+    sessions = scan_sessions(args.root)
+    jobs, skipped = plan_rerender(sessions, frame_data, os.path.abspath(args.frame_dir),
+                                  expand_pixels=expand_pixels, profile=args.profile,
+                                  output_root=args.output_root, force=args.force, slot_count=slot_count)
+
+    print(f"[rerender] 세션 {len(sessions)}개 중 {len(jobs)}개 렌더링, {len(skipped)}개 변경 없음(건너뜀)")
+    if args.dry_run:
+        for job in jobs:
+            print(f"[rerender] 예정 {job.tags['session']} -> {job.output}")
+        return 0
+    if not jobs:
+        return 0
+
+    def record_digest(job, result):
+        # 작업마다 바로 기록해야 중단 후 다시 실행할 때 완료된 세션을 건너뜀
+        if not result.ok:
+            return
+        write_output_digest(job.output, job.tags["digest"])
+
+        # 세션 폴더에 덮어쓴 경우 세션 기록도 갱신 (초기화 시 정리 대상)
+        folder = job.tags["folder"]
+        if os.path.dirname(os.path.abspath(job.output)) == os.path.abspath(folder):
+            manifest = SessionManifest.load(folder)
+            if manifest is not None:
+                manifest.record_output(job.output, frame=job.frame)
+
+    stats = execute_jobs(jobs, args.frames_json, args.frame_dir, _worker_count(args, parser),
+                         quiet=args.quiet, on_result=record_digest, label="rerender")
+    return 1 if stats.failed else 0
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    return args.handler(args, parser)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,203 @@
+"""
+합성 모듈
+프레임의 투명 영역에 사진을 맞춰 넣고 결과 이미지를 저장합니다.
+사진은 영역 사각형이 아니라 프레임 구멍 모양의 슬롯 마스크(core.slot_masks)로, 그 범위 안에서만 합성합니다.
+기울어진 사각형 구멍(폴라로이드 등)에는 사진을 슬롯별 원근 변환 한 번으로 구멍 모양에 맞춰 펼쳐 넣습니다.
+가공 중 먼저 보여 줄 미리보기 등 원하는 크기의 합성(render_at_scale)도 같은 배치로,
+원본 해상도를 거치지 않고 요청한 크기로 바로 만듭니다.
+"""
+
+import os
+from PIL import Image
+from typing import List, Optional, Tuple
+
+from .decode import decode_photo
+from .encoders import DEFAULT_PROFILE, save_image
+from .frame_cache import get_frame_cache
+from .layout import resolve_region
+from .region_detect import warp_photo
+from .slot_masks import paste_through_mask
+
+
+def fit_image_to_region(img: Image.Image, region_size: tuple[int, int]) -> Image.Image:
+    """
+    사진 이미지를 지정된 영역 크기(region_size)에 맞춰 비율 유지하며 확대/축소 후 중앙에서 Crop 합니다.
+    """
+    target_w, target_h = region_size
+    w, h = img.size
+    scale = max(target_w / w, target_h / h)
+    new_size = (int(w * scale), int(h * scale))
+    resized = img.resize(new_size, Image.LANCZOS)
+    left = (new_size[0] - target_w) // 2
+    top = (new_size[1] - target_h) // 2
+    return resized.crop((left, top, left + target_w, top + target_h))
+
+
+def fit_photo_to_slot(photo_path: str, box: Tuple[int, int, int, int], mask_box, warp) -> Tuple[Image.Image, tuple]:
+    """사진을 슬롯에 맞춤 (FrameCache.slot_mask 결과 사용)
+
+    변형이 없으면 영역(box) 크기로 맞추고, 기울어진 사각형 구멍이면 사진을 맞춘 뒤 구멍 모양으로 펼칩니다.
+    Returns: (맞춘 사진, 놓을 위치 - 프레임 좌표)
+    """
+    if warp is None:
+        region_size = (box[2] - box[0], box[3] - box[1])
+        photo = decode_photo(photo_path, [region_size]).convert('RGBA')
+        return fit_image_to_region(photo, region_size), (box[0], box[1])
+
+    fit_size, coefficients = warp
+    photo = decode_photo(photo_path, [fit_size]).convert('RGBA')
+    size = (mask_box[2] - mask_box[0], mask_box[3] - mask_box[1])
+    return warp_photo(fit_image_to_region(photo, fit_size), coefficients, size), (mask_box[0], mask_box[1])
+
+
+def insert_images_into_frame(photo_regions: List[Tuple[str, Tuple[int, int, int, int]]], frame_path: str,
+                             output_path: str, expand_pixels: int = 0, profile: str = DEFAULT_PROFILE) -> None:
+    """
+    프레임 이미지의 투명 영역에 여러 사진을 자동 맞춤 삽입 후, 인코더 프로필에 따라 저장합니다.
+    (기본 프로필: PNG 무손실 또는 JPEG 최고 품질)
+
+    Parameters:
+    - photo_regions: [(photo_path, (left_x, top_y, right_x, bottom_y)), ...] 형태의 리스트
+    - frame_path: 프레임 이미지 경로
+    - output_path: 결과 이미지 저장 경로
+    - expand_pixels: 합성 영역을 확장할 픽셀 수 (기본값: 0)
+    - profile: 인코더 프로필 이름 (core.encoders.ENCODER_PROFILES, 기본값: "default")
+    """
+    print(f"[DEBUG] insert_images_into_frame 시작")
+    print(f"[DEBUG] 프레임 경로: {frame_path}")
+    print(f"[DEBUG] 출력 경로: {output_path}")
+    print(f"[DEBUG] 사진 영역 수: {len(photo_regions)}")
+    print(f"[DEBUG] 확장 픽셀: {expand_pixels}")
+
+    # 프레임 이미지 불러오기 (디코딩 결과와 슬롯 마스크는 캐시에서 재사용)
+    cache = get_frame_cache()
+    frame_assets = cache.get(frame_path)
+    frame_w, frame_h = frame_assets.size
+    print(f"[DEBUG] 프레임 크기: {frame_w}x{frame_h}")
+
+    # 프레임을 캔버스로 사용 (사진은 각 슬롯 마스크 범위 안에서만 합성)
+    base = frame_assets.frame.copy()
+
+    # right_x가 None인 경우 처리 및 영역 확장 적용 (슬롯 마스크가 다른 슬롯의 구멍을 구분하도록 먼저 모두 계산)
+    boxes = [resolve_region(region, (frame_w, frame_h), expand_pixels) for _, region in photo_regions]
+
+    # 각 사진을 해당 영역에 삽입
+    for i, (photo_path, region) in enumerate(photo_regions):
+        print(f"[DEBUG] 사진 {i + 1} 처리: {photo_path}")
+        print(f"[DEBUG] 영역 좌표: {tuple(region)}")
+
+        left_x, top_y, right_x, bottom_y = boxes[i]
+        if expand_pixels > 0:
+            print(f"[DEBUG] 확장된 영역 좌표: ({left_x}, {top_y}, {right_x}, {bottom_y})")
+
+        region_w = right_x - left_x
+        region_h = bottom_y - top_y
+        print(f"[DEBUG] 영역 크기: {region_w}x{region_h}")
+
+        # 프레임 구멍 모양(슬롯 마스크, 기울어진 구멍이면 변형 포함)
+        mask_box, mask, warp = cache.slot_mask(frame_path, boxes[i], others=boxes[:i] + boxes[i + 1:])
+        if warp is not None:
+            print(f"[DEBUG] 기울어진 구멍, 사진 변형 크기: {warp[0]}")
+
+        # 사진 불러오기 (EXIF 방향, sRGB 변환, 영역에 필요한 만큼만 축소 디코딩) 및 크기 맞추기
+        fitted, position = fit_photo_to_slot(photo_path, (left_x, top_y, right_x, bottom_y), mask_box, warp)
+        print(f"[DEBUG] 맞춤 사진 크기: {fitted.size}")
+
+        paste_through_mask(base, fitted, position, mask_box, mask)
+        print(f"[DEBUG] 사진 {i + 1} 삽입 완료 (마스크 범위: {mask_box})")
+
+    # 파일 확장자와 인코더 프로필에 따른 저장 옵션
+    save_image(base, output_path, profile)
+
+    print(f"[DEBUG] 저장 완료: {output_path}")
+
+
+def scaled_size(frame_size: Tuple[int, int], scale: Optional[float] = None,
+                size: Optional[Tuple[int, int]] = None) -> Tuple[Tuple[int, int], float]:
+    """합성 배율과 결과 크기 - scale(원본 대비 배율) 또는 size(이 크기 안에 맞춤, 비율 유지) 중 하나
+
+    Returns: ((width, height), scale)
+    """
+    frame_w, frame_h = frame_size
+    if scale is None:
+        if size is None:
+            raise ValueError("scale 또는 size 중 하나가 필요합니다")
+        scale = min(size[0] / frame_w, size[1] / frame_h)
+    if scale <= 0:
+        raise ValueError(f"배율이 올바르지 않습니다: {scale}")
+    return (max(1, round(frame_w * scale)), max(1, round(frame_h * scale))), scale
+
+
+def render_at_scale(photo_regions: List[Tuple[str, Tuple[int, int, int, int]]], frame_path: str,
+                    scale: Optional[float] = None, size: Optional[Tuple[int, int]] = None,
+                    expand_pixels: int = 0, fitted_cache: Optional[dict] = None) -> Image.Image:
+    """
+    원본 해상도 합성을 만들지 않고 원하는 크기로 바로 합성한 RGBA 이미지를 반환합니다 (저장하지 않음).
+    배치는 insert_images_into_frame과 같고, 영역 좌표(프레임 원본 픽셀 기준)만 배율에 맞춰 변환합니다.
+
+    Parameters:
+    - scale: 프레임 원본 대비 배율 (예: 0.5)
+    - size: 결과가 들어갈 (width, height) - 비율을 유지해 이 안에 맞춤 (scale이 없을 때)
+    - fitted_cache: 영역에 맞춘 사진을 (경로, 수정 시각, 영역 크기)별로 보관해 다시 디코딩하지 않음.
+      이번 합성에 쓰이지 않은 항목은 제거되므로 캐시 크기는 슬롯 수를 넘지 않습니다.
+
+    프레임은 캐시된 해상도 단계(FrameCache.scaled) 중 결과 크기 이상인 가장 작은 것에서 축소하고,
+    사진은 영역 크기만큼만 축소 디코딩합니다.
+    """
+    cache = get_frame_cache()
+    frame_w, frame_h = cache.get(frame_path).size
+    size, scale = scaled_size((frame_w, frame_h), scale, size)
+    frame = cache.scaled(frame_path, size)
+
+    slots = []
+    for photo_path, region in photo_regions:
+        left_x, top_y, right_x, bottom_y = resolve_region(region, (frame_w, frame_h), expand_pixels)
+        left, top = round(left_x * scale), round(top_y * scale)
+        right, bottom = round(right_x * scale), round(bottom_y * scale)
+        if right > left and bottom > top:
+            slots.append((photo_path, (left, top, right, bottom)))
+    boxes = [box for _, box in slots]
+
+    base = frame.copy()
+    used = set()
+    for i, (photo_path, box) in enumerate(slots):
+        region_w, region_h = box[2] - box[0], box[3] - box[1]
+        mask_box, mask, warp = cache.slot_mask(frame_path, box, size, others=boxes[:i] + boxes[i + 1:])
+
+        key = (os.path.abspath(photo_path), os.stat(photo_path).st_mtime_ns, region_w, region_h,
+               mask_box if warp is not None else None)
+        entry = fitted_cache.get(key) if fitted_cache is not None else None
+        if entry is None:
+            entry = fit_photo_to_slot(photo_path, box, mask_box, warp)
+            if fitted_cache is not None:
+                fitted_cache[key] = entry
+        used.add(key)
+        fitted, position = entry
+        paste_through_mask(base, fitted, position, mask_box, mask)
+
+    if fitted_cache is not None:
+        for key in [key for key in fitted_cache if key not in used]:
+            del fitted_cache[key]
+
+    return base
+
+
+def render_preview(photo_regions: List[Tuple[str, Tuple[int, int, int, int]]], frame_path: str,
+                   box_size: Tuple[int, int], expand_pixels: int = 0,
+                   fitted_cache: Optional[dict] = None) -> Image.Image:
+    """
+    미리보기 크기(box_size 안에 맞춘 크기)로 합성한 RGBA 이미지를 반환합니다 (render_at_scale 참고).
+    미리보기 크기에서는 캐시된 프레임 축소본(FrameAssets.preview)을 그대로 사용합니다.
+    """
+    return render_at_scale(photo_regions, frame_path, size=box_size, expand_pixels=expand_pixels,
+                           fitted_cache=fitted_cache)
+
+
+def insert_image_into_frame(photo_path: str, frame_path: str, output_path: str, left_x: int = 30, top_y: int = 30,
+                            right_x: int = None, bottom_y: int = 1050) -> None:
+    """
+    기존 단일 이미지 삽입 함수 (하위 호환성을 위한 래퍼 함수)
+    """
+    # 단일 이미지를 리스트 형태로 변환하여 새 함수 호출
+    photo_regions = [(photo_path, (left_x, top_y, right_x, bottom_y))]
+    insert_images_into_frame(photo_regions, frame_path, output_path)
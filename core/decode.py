@@ -0,0 +1,138 @@
+"""
+사진 디코딩 모듈
+합성, 입력 사본, 미리보기가 공통으로 쓰는 디코딩 단계입니다.
+
+1. 축소 디코딩 - JPEG은 필요한 크기 이상으로만 DCT 단계에서 줄여 읽음 (draft)
+2. 색 변환 - 내장 ICC 프로파일을 sRGB로 변환 (컴파일된 ImageCms 변환을 프로파일 해시별로 캐시)
+3. 방향 적용 - EXIF 방향을 transpose로 적용 (리샘플링 없음)
+
+색 변환과 방향 적용은 축소된 이미지에 하므로 원본 크기의 추가 처리가 없습니다.
+"""
+
+import hashlib
+import io
+import math
+import threading
+
+from PIL import Image
+
+try:
+    from PIL import ImageCms
+except ImportError:  # LittleCMS 없이 빌드된 Pillow - 색 변환 생략
+    ImageCms = None
+
+EXIF_ORIENTATION = 0x0112
+
+# EXIF 방향 -> transpose 연산 (PIL.ImageOps.exif_transpose와 같은 표)
+ORIENTATION_TRANSPOSE = {
+    2: Image.Transpose.FLIP_LEFT_RIGHT,
+    3: Image.Transpose.ROTATE_180,
+    4: Image.Transpose.FLIP_TOP_BOTTOM,
+    5: Image.Transpose.TRANSPOSE,
+    6: Image.Transpose.ROTATE_270,
+    7: Image.Transpose.TRANSVERSE,
+    8: Image.Transpose.ROTATE_90,
+}
+
+# 가로/세로가 바뀌는 방향
+SWAPPED_ORIENTATIONS = (5, 6, 7, 8)
+
+# ImageCms 변환 입력 모드 -> 출력 모드
+_CMS_MODES = {"RGB": "RGB", "RGBA": "RGBA", "CMYK": "RGB", "L": "L"}
+
+# (프로파일 해시, 입력 모드) -> 컴파일된 변환 (None이면 이미 sRGB라 변환 불필요)
+_transforms = {}
+_transforms_lock = threading.Lock()
+_srgb_profile = None
+
+
+def cover_scale(image_size, region_sizes):
+    """모든 영역을 덮을 수 있는(cover) 최소 배율 (1.0 이상이면 원본 크기가 필요)
+
+    합성은 영역을 덮도록 확대/축소하므로 영역마다 max(rw / w, rh / h) 배가 필요합니다.
+    """
+    w, h = image_size
+    if not region_sizes or not w or not h:
+        return 1.0
+    return max(max(rw / w, rh / h) for rw, rh in region_sizes)
+
+
+def orientation_of(image):
+    """EXIF 방향 값 (없거나 잘못되면 1)"""
+    try:
+        orientation = image.getexif().get(EXIF_ORIENTATION, 1)
+    except Exception:
+        return 1
+    return orientation if orientation in ORIENTATION_TRANSPOSE else 1
+
+
+def _srgb():
+    global _srgb_profile
+    if _srgb_profile is None:
+        _srgb_profile = ImageCms.createProfile("sRGB")
+    return _srgb_profile
+
+
+def _transform_for(icc_bytes, mode):
+    """내장 프로파일 -> sRGB 변환 (프로파일 해시별 캐시)"""
+    key = (hashlib.blake2b(icc_bytes, digest_size=16).digest(), mode)
+    with _transforms_lock:
+        if key in _transforms:
+            return _transforms[key]
+
+    transform = None
+    try:
+        profile = ImageCms.ImageCmsProfile(io.BytesIO(icc_bytes))
+        description = ImageCms.getProfileDescription(profile) or ""
+        if "srgb" not in description.lower().replace(" ", ""):
+            transform = ImageCms.buildTransform(profile, _srgb(), mode, _CMS_MODES[mode],
+                                                renderingIntent=ImageCms.Intent.PERCEPTUAL)
+    except (ImageCms.PyCMSError, OSError, ValueError) as e:
+        print(f"[WARNING] ICC 프로파일 변환 생성 실패 ({mode}): {e}")
+        transform = None
+
+    with _transforms_lock:
+        _transforms[key] = transform
+    return transform
+
+
+def to_srgb(image, icc_bytes):
+    """내장 ICC 프로파일 기준으로 sRGB 변환 (프로파일이 없거나 sRGB이면 그대로)"""
+    if ImageCms is None or not icc_bytes or image.mode not in _CMS_MODES:
+        return image.convert("RGB") if image.mode == "CMYK" else image
+    transform = _transform_for(icc_bytes, image.mode)
+    if transform is None:
+        return image.convert("RGB") if image.mode == "CMYK" else image
+    return ImageCms.applyTransform(image, transform)
+
+
+def decode_photo(fp, region_sizes=None):
+    """사진 디코딩 (방향 적용, sRGB 변환, 필요한 만큼만 축소 디코딩)
+
+    Parameters:
+    - fp: 파일 경로 또는 파일 객체
+    - region_sizes: 이 이미지로 덮어야 할 영역 크기 [(w, h), ...] (표시 방향 기준)
+                    주면 JPEG은 모든 영역을 덮을 수 있는 크기 이상으로만 축소해서 읽음
+
+    Returns: 표시 방향의 PIL 이미지 (크기는 요청보다 크거나 같음 - 최종 크기 조정은 호출 측)
+    """
+    image = Image.open(fp)
+    orientation = orientation_of(image)
+    icc_bytes = image.info.get("icc_profile")
+
+    if region_sizes and image.format == "JPEG":
+        w, h = image.size
+        if orientation in SWAPPED_ORIENTATIONS:
+            w, h = h, w
+        scale = cover_scale((w, h), region_sizes)
+        if scale < 1.0:
+            size = (math.ceil(w * scale), math.ceil(h * scale))
+            if orientation in SWAPPED_ORIENTATIONS:
+                size = (size[1], size[0])
+            image.draft(image.mode, size)
+
+    image.load()
+    image = to_srgb(image, icc_bytes)
+    if orientation != 1:
+        image = image.transpose(ORIENTATION_TRANSPOSE[orientation])
+    return image
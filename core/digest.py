@@ -0,0 +1,155 @@
+"""
+다이제스트 모듈
+파일 내용 해시와 렌더 입력 다이제스트(사진, 프레임, 합성 옵션)를 계산하고,
+결과 파일별 기록(cache/renders/outputs)으로 남겨 변경되지 않은 작업을 건너뛸 수 있게 합니다.
+기록은 고객 세션 폴더가 아니라 작업 폴더의 캐시에 두며, 결과 파일의 크기와 수정 시각이
+기록할 때와 같을 때만 유효합니다 (결과 파일이 바뀌거나 지워지면 자동으로 무효).
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+CHUNK_SIZE = 1024 * 1024
+
+# 렌더 결과에 영향을 주는 합성 로직이 바뀌면 올려서 기존 기록을 무효화
+RENDER_DIGEST_VERSION = 5
+
+# 결과 파일별 렌더 다이제스트 기록 위치 (작업 폴더 기준, 렌더 캐시 아래)
+OUTPUT_DIGEST_DIR = os.path.join('cache', 'renders', 'outputs')
+
+# 이전 버전이 결과 파일 옆에 만들던 사이드카 (발견하면 정리)
+LEGACY_SIDECAR_SUFFIX = ".digest"
+
+# 기억해 둘 내용 해시 최대 개수 (초과 시 오래 사용하지 않은 것부터 제거)
+MAX_DIGEST_MEMO = 4096
+
+
+def file_digest(path):
+    """파일 내용 해시 (blake2b 128비트, 16진수)"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# (절대 경로, 크기, 수정 시각) -> 내용 해시 (크기+수정 시각이 같으면 다시 읽지 않음, LRU)
+_digest_memo = OrderedDict()
+_digest_memo_lock = threading.Lock()
+
+
+def _memo_get(key):
+    with _digest_memo_lock:
+        digest = _digest_memo.get(key)
+        if digest is not None:
+            _digest_memo.move_to_end(key)
+        return digest
+
+
+def _memo_put(key, digest):
+    with _digest_memo_lock:
+        _digest_memo[key] = digest
+        _digest_memo.move_to_end(key)
+        while len(_digest_memo) > MAX_DIGEST_MEMO:
+            _digest_memo.popitem(last=False)
+
+
+def cached_file_digest(path):
+    """파일 내용 해시 - 크기와 수정 시각이 기억한 값과 같으면 다시 해시하지 않음 (빠른 경로)"""
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    key = (path, stat.st_size, stat.st_mtime_ns)
+    digest = _memo_get(key)
+    if digest is None:
+        digest = file_digest(path)
+        _memo_put(key, digest)
+    return digest
+
+
+def known_digest(path):
+    """기억해 둔 내용 해시 (파일을 읽지 않음 - 모르거나 파일이 바뀌었으면 None)"""
+    path = os.path.abspath(path)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return _memo_get((path, stat.st_size, stat.st_mtime_ns))
+
+
+def remember_digest(path, digest, stat=None):
+    """다른 경로에서 이미 계산한 내용 해시를 기억 (복사하면서 계산한 경우 등)"""
+    path = os.path.abspath(path)
+    stat = stat or os.stat(path)
+    _memo_put((path, stat.st_size, stat.st_mtime_ns), digest)
+
+
+def render_digest(photo_paths, frame_path, regions, expand_pixels, profile):
+    """렌더 입력 다이제스트 - 사진/프레임 내용, 영역 좌표, 확장 픽셀, 인코더 프로필이 같으면 같은 값"""
+    payload = {
+        "version": RENDER_DIGEST_VERSION,
+        "photos": [cached_file_digest(p) if p else None for p in photo_paths],
+        "frame": cached_file_digest(frame_path) if frame_path else None,
+        "regions": [list(r) for r in regions],
+        "expand_pixels": expand_pixels,
+        "profile": profile,
+    }
+    encoded = json.dumps(payload, sort_keys=True).encode('utf-8')
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def output_record_path(output_path, record_dir=None):
+    """결과 파일의 다이제스트 기록 경로 (결과 파일 절대 경로의 해시로 구분)"""
+    key = hashlib.blake2b(os.path.abspath(output_path).encode('utf-8'), digest_size=16).hexdigest()
+    return os.path.join(record_dir or OUTPUT_DIGEST_DIR, key + ".json")
+
+
+def read_output_digest(output_path, record_dir=None):
+    """결과 파일의 기록된 다이제스트 (결과 파일이 없거나 기록 후 바뀌었으면 None)"""
+    try:
+        stat = os.stat(output_path)
+        with open(output_record_path(output_path, record_dir), 'r', encoding='utf-8') as f:
+            record = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if (record.get("output") != os.path.abspath(output_path) or record.get("size") != stat.st_size
+            or record.get("mtime_ns") != stat.st_mtime_ns):
+        return None
+    return record.get("digest") or None
+
+
+def remove_output_digest(output_path, record_dir=None):
+    """결과 파일이 다시 만들어지기 전에 이전 다이제스트 기록 제거"""
+    try:
+        os.remove(output_record_path(output_path, record_dir))
+    except FileNotFoundError:
+        pass
+
+
+def write_output_digest(output_path, digest, record_dir=None):
+    """다이제스트 기록 - 결과 파일을 다 쓴 뒤 호출 (현재 크기/수정 시각을 함께 기록)
+
+    임시 파일에 쓴 뒤 교체하므로 중단되어도 반쯤 쓴 기록이 남지 않습니다.
+    """
+    stat = os.stat(output_path)
+    target = output_record_path(output_path, record_dir)
+    os.makedirs(os.path.dirname(os.path.abspath(target)), exist_ok=True)
+    record = {"output": os.path.abspath(output_path), "size": stat.st_size,
+              "mtime_ns": stat.st_mtime_ns, "digest": digest}
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(target)), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(record, f)
+        os.replace(tmp_path, target)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def legacy_sidecar_path(output_path):
+    """이전 버전이 결과 파일 옆에 만들던 다이제스트 사이드카 경로"""
+    return output_path + LEGACY_SIDECAR_SUFFIX
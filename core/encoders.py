@@ -0,0 +1,62 @@
+"""
+인코더 프로필 모듈
+결과 이미지 저장 옵션(JPEG 품질/서브샘플링, PNG 압축 수준)을 프로필 이름으로 관리합니다.
+저장 형식은 출력 파일 확장자로 결정하고, 프로필은 형식별 옵션만 정합니다.
+"""
+
+import os
+
+# 프로필별 형식 옵션 ("default"는 기존 GUI 저장 방식과 동일)
+ENCODER_PROFILES = {
+    "default": {
+        "JPEG": {"quality": 100, "subsampling": 0, "optimize": True},
+        "PNG": {"compress_level": 0},
+    },
+    # 인쇄용: 최고 품질, 저장 속도 우선 (optimize 생략)
+    "print": {
+        "JPEG": {"quality": 100, "subsampling": 0},
+        "PNG": {"compress_level": 1},
+    },
+    # 보관용: 무손실 최대 압축
+    "archive": {
+        "JPEG": {"quality": 100, "subsampling": 0, "optimize": True},
+        "PNG": {"compress_level": 9},
+    },
+    # 작업 해상도 입력 사본: 합성 전 중간 파일이므로 높은 품질, 빠른 저장
+    "working": {
+        "JPEG": {"quality": 95, "subsampling": 0},
+        "PNG": {"compress_level": 1},
+    },
+    # 공유/미리보기용: 작은 파일
+    "web": {
+        "JPEG": {"quality": 85, "subsampling": 2, "optimize": True, "progressive": True},
+        "PNG": {"compress_level": 6},
+    },
+}
+
+DEFAULT_PROFILE = "default"
+
+JPEG_EXTENSIONS = ('.jpg', '.jpeg')
+
+
+def output_format(output_path):
+    """출력 파일 확장자로 저장 형식 결정 (JPEG 외에는 PNG)"""
+    ext = os.path.splitext(output_path)[1].lower()
+    return "JPEG" if ext in JPEG_EXTENSIONS else "PNG"
+
+
+def encoder_options(profile, image_format):
+    """프로필의 형식별 저장 옵션 반환"""
+    if profile not in ENCODER_PROFILES:
+        raise ValueError(f"알 수 없는 인코더 프로필: {profile} (사용 가능: {', '.join(ENCODER_PROFILES)})")
+    return dict(ENCODER_PROFILES[profile][image_format])
+
+
+def save_image(image, output_path, profile=DEFAULT_PROFILE, **extra_options):
+    """PIL 이미지를 프로필 옵션으로 저장 (extra_options: icc_profile, exif 등 추가 저장 옵션)"""
+    image_format = output_format(output_path)
+    options = encoder_options(profile, image_format)
+    options.update(extra_options)
+    if image_format == "JPEG" and image.mode != 'RGB':
+        image = image.convert('RGB')
+    image.save(output_path, format=image_format, **options)
@@ -0,0 +1,457 @@
+"""
+프레임 에셋 캐시 모듈
+프레임 PNG의 디코딩 결과(RGBA), 합성용 알파 마스크, 미리보기 이미지를
+메모리 예산 안에서 LRU 방식으로 보관합니다. Qt에 의존하지 않습니다.
+
+원본과 미리보기 사이 크기로 합성할 때(core.compositing.render_at_scale)는 1/2씩 줄인 해상도
+단계(피라미드)를 처음 필요할 때 만들어 두고, 요청 크기 이상인 가장 작은 단계에서 축소합니다.
+합성 영역별 사진 마스크(core.slot_masks)도 처음 필요할 때(또는 사전 로드 때) 만들어 프레임과 함께 보관합니다.
+
+디코딩 결과는 디스크에도 비압축 raw 파일로 저장하여(RawFrameStore),
+재시작이나 다른 프로세스에서는 zlib 디코딩 대신 mmap으로 바로 사용합니다.
+"""
+
+import hashlib
+import mmap
+import os
+import re
+import struct
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from PIL import Image
+
+from .layout import resolve_region
+
+# 미리보기 기본 크기 (메인 윈도우 미리보기 라벨 너비 280px 기준, 비율 유지)
+PREVIEW_SIZE = (280, 280)
+
+DEFAULT_BUDGET_MB = 256
+
+# 프레임 한 장당 보관할 슬롯 마스크 수 (해상도 x 영역 조합, 오래된 것부터 제거)
+MAX_SLOT_MASKS = 32
+
+# 디스크 raw 캐시 위치 (작업 폴더 기준)
+DISK_CACHE_DIR = os.path.join('cache', 'frames')
+
+
+class FrameAssets:
+    """디코딩된 프레임 한 장에 대한 에셋 묶음"""
+
+    def __init__(self, path: str, mtime_ns: int, frame: Image.Image, alpha: Image.Image,
+                 preview: Optional[Image.Image] = None):
+        self.path = path
+        self.mtime_ns = mtime_ns
+        self.frame = frame      # RGBA 원본 해상도
+        self.alpha = alpha      # 합성 마스크 (L, frame의 알파 채널)
+        self.preview = preview  # RGBA 미리보기 (PREVIEW_SIZE 이내)
+        self.levels = None      # 피라미드 단계 [1/2, 1/4, ...] (RGBA, FrameCache.scaled에서 생성)
+        self.slot_masks = OrderedDict()  # (프레임 크기, 영역, 다른 슬롯 영역) -> (마스크 범위, L 마스크, 변형) (FrameCache.slot_mask)
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        return self.frame.size
+
+    @property
+    def nbytes(self) -> int:
+        total = estimate_nbytes(self.frame.size)
+        if self.preview is not None:
+            total += self.preview.size[0] * self.preview.size[1] * 4
+        return total + levels_nbytes(self.levels) + masks_nbytes(self.slot_masks.values())
+
+    def source_for(self, size: Tuple[int, int]) -> Optional[Image.Image]:
+        """size 이상인 가장 작은 해상도 단계 (피라미드가 필요한데 아직 없으면 None)"""
+        candidates = [self.frame] + (self.levels or [])
+        if self.preview is not None:
+            candidates.append(self.preview)
+        fitting = [image for image in candidates if image.size[0] >= size[0] and image.size[1] >= size[1]]
+        source = min(fitting, key=lambda image: image.size[0], default=self.frame)
+        if self.levels is None and source is self.frame and size[0] * 2 <= self.frame.size[0] \
+                and size[1] * 2 <= self.frame.size[1]:
+            return None
+        return source
+
+
+def estimate_nbytes(size: Tuple[int, int]) -> int:
+    """RGBA 프레임 + 알파 마스크의 메모리 사용량 추정"""
+    w, h = size
+    return w * h * 4 + w * h
+
+
+def levels_nbytes(levels) -> int:
+    return sum(image.size[0] * image.size[1] * 4 for image in levels or [])
+
+
+def masks_nbytes(entries) -> int:
+    return sum(mask.size[0] * mask.size[1] for _, mask, _ in entries if mask is not None)
+
+
+def make_levels(frame: Image.Image, min_size: Tuple[int, int] = PREVIEW_SIZE) -> list:
+    """1/2씩 줄인 해상도 단계 목록 (미리보기 크기 근처까지)"""
+    levels = []
+    level = frame
+    while level.size[0] // 2 >= min_size[0] or level.size[1] // 2 >= min_size[1]:
+        level = level.reduce(2)
+        levels.append(level)
+    return levels
+
+
+def make_preview(frame: Image.Image, preview_size: Tuple[int, int] = PREVIEW_SIZE) -> Image.Image:
+    """프레임 미리보기 생성 (비율 유지 축소)"""
+    preview = frame.copy()
+    preview.thumbnail(preview_size, Image.LANCZOS)
+    return preview
+
+
+def decode_frame(path: str, preview_size: Optional[Tuple[int, int]] = PREVIEW_SIZE,
+                 disk_store: Optional['RawFrameStore'] = None) -> FrameAssets:
+    """프레임 PNG를 디코딩하여 에셋 생성 (disk_store가 있으면 raw 캐시 우선 사용)"""
+    mtime_ns = os.stat(path).st_mtime_ns
+
+    if disk_store is not None:
+        assets = disk_store.load(path, mtime_ns)
+        if assets is not None:
+            return assets
+
+    with Image.open(path) as img:
+        frame = img.convert('RGBA')
+    alpha = frame.getchannel('A')
+    preview = make_preview(frame, preview_size) if preview_size else None
+    assets = FrameAssets(path, mtime_ns, frame, alpha, preview)
+
+    if disk_store is not None:
+        disk_store.save(assets)
+    return assets
+
+
+class RawFrameStore:
+    """디코딩된 프레임의 디스크 raw 캐시
+
+    파일 형식 (리틀 엔디언):
+        헤더: magic(4) version(H) width(I) height(I) preview_width(I) preview_height(I)
+        본문: RGBA 프레임 | 알파 마스크(L) | RGBA 미리보기
+
+    파일명은 '<프레임 파일명>-<경로 해시>-<PNG 크기>-<PNG 수정 시각>.raw'로, 원본 PNG가 바뀌면
+    (크기나 수정 시각이 달라지면) 다른 이름이 되어 자동으로 무효화됩니다. 원본 PNG를 읽지 않고 stat만으로
+    찾으므로 시작 시 프레임 전체를 해시하지 않습니다. 읽을 때는 mmap 후 Image.frombuffer로 복사 없이 감쌉니다.
+    """
+
+    MAGIC = b'BTRF'
+    VERSION = 1
+    HEADER = struct.Struct('<4sHIIII')
+
+    # 이전 형식 파일명 ('<프레임 파일명>-<PNG 내용 해시>.raw') - 정리 대상
+    LEGACY_SUFFIX = re.compile(r'-[0-9a-f]{32}\.raw$')
+
+    def __init__(self, cache_dir: str = DISK_CACHE_DIR):
+        self.cache_dir = cache_dir
+
+    @staticmethod
+    def source_prefix(path: str) -> str:
+        """같은 원본 경로의 raw 파일 공통 접두어 (다른 폴더의 같은 파일명과 구분)"""
+        path_hash = hashlib.blake2b(os.path.abspath(path).encode('utf-8'), digest_size=4).hexdigest()
+        return f"{os.path.basename(path)}-{path_hash}-"
+
+    def raw_path(self, path: str, stat: Optional[os.stat_result] = None) -> str:
+        stat = stat or os.stat(path)
+        return os.path.join(self.cache_dir, f"{self.source_prefix(path)}{stat.st_size}-{stat.st_mtime_ns}.raw")
+
+    def load(self, path: str, mtime_ns: int) -> Optional[FrameAssets]:
+        """raw 캐시를 mmap으로 읽어 에셋 반환 (없거나 손상되었으면 None)"""
+        try:
+            raw_path = self.raw_path(path)
+            if not os.path.exists(raw_path):
+                return None
+            with open(raw_path, 'rb') as f:
+                # 파일을 닫아도 매핑은 유지됨 (이미지가 버퍼를 참조하는 동안)
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            print(f"[WARNING] 프레임 raw 캐시 읽기 실패: {path} ({e})")
+            return None
+
+        try:
+            magic, version, w, h, pw, ph = self.HEADER.unpack_from(mapped, 0)
+            if magic != self.MAGIC or version != self.VERSION:
+                return None
+            frame_size = w * h * 4
+            alpha_size = w * h
+            preview_size = pw * ph * 4
+            if len(mapped) != self.HEADER.size + frame_size + alpha_size + preview_size:
+                return None
+
+            view = memoryview(mapped)
+            offset = self.HEADER.size
+            frame = Image.frombuffer('RGBA', (w, h), view[offset:offset + frame_size], 'raw', 'RGBA', 0, 1)
+            offset += frame_size
+            alpha = Image.frombuffer('L', (w, h), view[offset:offset + alpha_size], 'raw', 'L', 0, 1)
+            offset += alpha_size
+            preview = None
+            if pw and ph:
+                preview = Image.frombuffer('RGBA', (pw, ph), view[offset:offset + preview_size], 'raw', 'RGBA', 0, 1)
+        except (struct.error, ValueError) as e:
+            print(f"[WARNING] 프레임 raw 캐시 손상: {path} ({e})")
+            return None
+
+        return FrameAssets(os.path.abspath(path), mtime_ns, frame, alpha, preview)
+
+    def save(self, assets: FrameAssets):
+        """에셋을 raw 파일로 저장 (임시 파일에 쓴 뒤 교체하여 다른 프로세스가 반쯤 쓴 파일을 읽지 않도록)"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            stat = os.stat(assets.path)
+            if stat.st_mtime_ns != assets.mtime_ns:
+                return  # 디코딩하는 동안 원본이 바뀜 (다음 로드 때 다시 저장)
+            raw_path = self.raw_path(assets.path, stat)
+            if os.path.exists(raw_path):
+                return  # 다른 프로세스가 이미 저장함 (매핑 중인 파일을 교체하지 않음)
+
+            w, h = assets.frame.size
+            pw, ph = assets.preview.size if assets.preview is not None else (0, 0)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(self.HEADER.pack(self.MAGIC, self.VERSION, w, h, pw, ph))
+                    f.write(assets.frame.tobytes('raw', 'RGBA'))
+                    f.write(assets.alpha.tobytes('raw', 'L'))
+                    if assets.preview is not None:
+                        f.write(assets.preview.convert('RGBA').tobytes('raw', 'RGBA'))
+                os.replace(tmp_path, raw_path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+
+            self._remove_stale(assets.path, raw_path)
+        except OSError as e:
+            print(f"[WARNING] 프레임 raw 캐시 저장 실패: {assets.path} ({e})")
+
+    def _remove_stale(self, path: str, keep_path: str):
+        """같은 프레임의 이전 버전 raw 파일 (이전 형식 파일명 포함) 삭제"""
+        prefix = self.source_prefix(path)
+        legacy_prefix = os.path.basename(path) + '-'
+        for name in os.listdir(self.cache_dir):
+            candidate = os.path.join(self.cache_dir, name)
+            stale = name.startswith(prefix) or (name.startswith(legacy_prefix)
+                                                and self.LEGACY_SUFFIX.fullmatch(name[len(legacy_prefix) - 1:]))
+            if stale and name.endswith('.raw') and candidate != keep_path:
+                try:
+                    os.remove(candidate)
+                except OSError:
+                    pass
+
+
+class FrameCache:
+    """프레임 에셋 LRU 캐시 (스레드 안전, 메모리 예산 기반)"""
+
+    def __init__(self, budget_bytes: int = DEFAULT_BUDGET_MB * 1024 * 1024,
+                 disk_store: Optional[RawFrameStore] = None):
+        self.budget_bytes = budget_bytes
+        self.disk_store = disk_store
+        self._entries = OrderedDict()
+        self._used_bytes = 0
+        self._lock = threading.Lock()
+
+    # --- 조회 ---
+
+    def _lookup(self, path: str) -> Optional[FrameAssets]:
+        """유효한 캐시 항목 반환 (파일이 변경되었으면 제거) - lock 보유 상태에서 호출"""
+        assets = self._entries.get(path)
+        if assets is None:
+            return None
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        if mtime_ns != assets.mtime_ns:
+            self._remove(path)
+            return None
+        self._entries.move_to_end(path)
+        return assets
+
+    def peek(self, path: str) -> Optional[FrameAssets]:
+        """캐시에 있으면 반환, 없으면 None (디코딩하지 않음)"""
+        path = os.path.abspath(path)
+        with self._lock:
+            return self._lookup(path)
+
+    def get(self, path: str) -> FrameAssets:
+        """프레임 에셋 반환 (캐시에 없으면 디코딩 후 저장)"""
+        path = os.path.abspath(path)
+        with self._lock:
+            assets = self._lookup(path)
+        if assets is not None:
+            return assets
+
+        assets = decode_frame(path, disk_store=self.disk_store)
+        self._store(assets)
+        return assets
+
+    def scaled(self, path: str, size: Tuple[int, int]) -> Image.Image:
+        """프레임을 size 크기로 (RGBA) - 피라미드에서 size 이상인 가장 작은 단계를 축소"""
+        assets = self.get(path)
+        source = assets.source_for(size)
+        if source is None:
+            levels = make_levels(assets.frame)
+            with self._lock:
+                if assets.levels is None:
+                    assets.levels = levels
+                    # 캐시에 남아 있는 항목이면 메모리 사용량에 반영
+                    if self._entries.get(assets.path) is assets:
+                        self._used_bytes += levels_nbytes(levels)
+                        self._evict()
+            source = assets.source_for(size)
+        if source.size == tuple(size):
+            return source
+        return source.resize(tuple(size), Image.LANCZOS)
+
+    def slot_mask(self, path: str, box: Tuple[int, int, int, int], size: Optional[Tuple[int, int]] = None,
+                  others: Sequence[Tuple[int, int, int, int]] = ()):
+        """합성 영역(box, size 크기 프레임 기준 좌표)의 사진 마스크와 변형 - core.slot_masks.build_slot_mask 참고
+
+        size를 생략하면 원본 해상도 기준입니다. others는 같은 프레임의 다른 슬롯 영역(같은 좌표계)으로,
+        그 영역에 속한 구멍은 마스크에서 제외됩니다. 결과(구멍 인식과 변환 계수 포함)는 프레임과 함께 캐시됩니다.
+        Returns: (마스크 범위, L 마스크 또는 None, 변형 또는 None)
+        """
+        from .slot_masks import build_slot_mask
+
+        assets = self.get(path)
+        size = tuple(size or assets.size)
+        key = (size, tuple(box), tuple(tuple(other) for other in others))
+        with self._lock:
+            entry = assets.slot_masks.get(key)
+            if entry is not None:
+                assets.slot_masks.move_to_end(key)
+                return entry
+
+        alpha = assets.alpha if size == assets.size else self.scaled(path, size).getchannel('A')
+        entry = build_slot_mask(alpha, key[1], key[2])
+        with self._lock:
+            if key not in assets.slot_masks:
+                added = masks_nbytes([entry])
+                assets.slot_masks[key] = entry
+                while len(assets.slot_masks) > MAX_SLOT_MASKS:
+                    added -= masks_nbytes([assets.slot_masks.popitem(last=False)[1]])
+                # 캐시에 남아 있는 항목이면 메모리 사용량에 반영
+                if self._entries.get(assets.path) is assets:
+                    self._used_bytes += added
+                    self._evict()
+        return entry
+
+    def __contains__(self, path: str) -> bool:
+        return self.peek(path) is not None
+
+    # --- 저장/제거 ---
+
+    def _store(self, assets: FrameAssets):
+        with self._lock:
+            if assets.path in self._entries:
+                self._remove(assets.path)
+            self._entries[assets.path] = assets
+            self._used_bytes += assets.nbytes
+            self._evict()
+
+    def _remove(self, path: str):
+        assets = self._entries.pop(path, None)
+        if assets is not None:
+            self._used_bytes -= assets.nbytes
+
+    def _evict(self):
+        """예산 초과 시 가장 오래 사용하지 않은 항목부터 제거 (최근 항목 1개는 유지)"""
+        while self._used_bytes > self.budget_bytes and len(self._entries) > 1:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+
+    def set_budget(self, budget_bytes: int):
+        with self._lock:
+            self.budget_bytes = budget_bytes
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._used_bytes = 0
+
+    @property
+    def used_bytes(self) -> int:
+        return self._used_bytes
+
+    # --- 사전 로드 ---
+
+    def warm(self, paths: Iterable[str], should_stop=None, regions: Optional[Dict[str, List]] = None,
+             expand_pixels: int = 0) -> int:
+        """프레임들을 순서대로 미리 디코딩하고 합성 영역별 사진 마스크까지 준비 (예산 안에서만)
+
+        Parameters:
+        - paths: 사전 로드할 프레임 경로 (우선순위 순)
+        - should_stop: 중단 여부를 반환하는 콜백 (선택)
+        - regions: {프레임 경로: 합성 영역 목록 (원본 픽셀 좌표, core.frame_catalog.frame_pixel_regions)}
+                   주면 모든 슬롯이 찬 원본 해상도 합성과 같은 슬롯 마스크를 미리 만듦
+        - expand_pixels: 합성 영역 확장 픽셀 (가공 설정과 같아야 마스크가 재사용됨)
+
+        Returns: 새로 디코딩한 프레임 수
+        """
+        regions = {os.path.abspath(path): value for path, value in (regions or {}).items()}
+        loaded = 0
+        for path in paths:
+            if should_stop and should_stop():
+                break
+            path = os.path.abspath(path)
+            if not os.path.exists(path):
+                continue
+
+            # 헤더만 읽어 크기를 추정하고, 예산을 넘으면 더 이상 로드하지 않음
+            # (우선순위가 높은 프레임을 밀어내지 않기 위해)
+            try:
+                with Image.open(path) as img:
+                    size = img.size
+            except Exception as e:
+                print(f"[WARNING] 프레임 헤더 읽기 실패: {path} ({e})")
+                continue
+            boxes = [resolve_region(region, size, expand_pixels) for region in regions.get(path, [])]
+            masks = sum((b[2] - b[0]) * (b[3] - b[1]) for b in boxes)  # 마스크 크기 상한 (L, 영역 넓이)
+
+            if path not in self:
+                if self._used_bytes + estimate_nbytes(size) + masks > self.budget_bytes:
+                    print(f"[DEBUG] 프레임 캐시 예산 도달, 사전 로드 중단: {path}")
+                    break
+                try:
+                    self._store(decode_frame(path, disk_store=self.disk_store))
+                    loaded += 1
+                    print(f"[DEBUG] 프레임 사전 로드 완료: {path}")
+                except Exception as e:
+                    print(f"[WARNING] 프레임 사전 로드 실패: {path} ({e})")
+                    continue
+            elif self._used_bytes + masks > self.budget_bytes:
+                break
+
+            try:
+                for i, box in enumerate(boxes):
+                    if should_stop and should_stop():
+                        break
+                    self.slot_mask(path, box, others=boxes[:i] + boxes[i + 1:])
+            except Exception as e:
+                print(f"[WARNING] 슬롯 마스크 사전 준비 실패: {path} ({e})")
+        return loaded
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_frame_cache() -> FrameCache:
+    """프로세스 공용 프레임 캐시 반환"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = FrameCache(disk_store=RawFrameStore())
+        return _default_cache
+
+
+def order_frames_for_warmup(frames, recent_filenames) -> list:
+    """최근 사용 프레임을 앞에 두고 나머지는 frames.json 순서로 정렬한 파일명 목록"""
+    filenames = [f.get('filename') for f in frames if f.get('filename')]
+    ordered = [name for name in recent_filenames if name in filenames]
+    ordered += [name for name in filenames if name not in ordered]
+    return ordered
@@ -0,0 +1,161 @@
+"""
+프레임 카탈로그 모듈
+frames.json의 프레임 목록(파일명, 합성 영역 좌표)을 관리합니다.
+
+프레임 항목 형식:
+    {"name": ..., "filename": "01.png", "type": ...,
+     "size": [3496, 2363],                      # regions 기준 프레임 PNG 크기
+     "regions": [[105, 100, 1350, 930], ...],   # 픽셀 좌표 (이전 버전 호환)
+     "norm_regions": [[0.030034, ...], ...]}    # 정규화 좌표 (합성에 사용, core.layout.frame_regions)
+
+norm_regions가 없는 이전 형식 항목은 로드할 때 프레임 PNG 크기로 정규화 좌표를 만들어 두고(migrated),
+GUI에서 저장할 때 파일에 반영합니다. 정규화 좌표가 있는 항목은 그 값이 기준이며, 설정 화면에서
+영역을 편집한 항목(편집하면 norm_regions 없이 픽셀 좌표로 다시 만들어짐)만 현재 PNG 크기로 다시 정규화합니다.
+프레임 PNG를 다른 해상도로 바꿔도 편집하지 않은 항목의 영역은 그대로 비율을 유지합니다.
+"""
+
+import json
+import os
+import struct
+
+from .layout import frame_regions, normalize_region
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+
+def frame_image_size(path):
+    """프레임 이미지 크기 (PNG는 IHDR 헤더만 읽음, 그 외 형식은 PIL로 헤더 읽기)
+
+    Returns: (width, height) 또는 None (파일이 없거나 읽을 수 없음)
+    """
+    try:
+        with open(path, 'rb') as f:
+            header = f.read(24)
+        if header[:8] == PNG_SIGNATURE and header[12:16] == b'IHDR':
+            return struct.unpack('>II', header[16:24])
+
+        from PIL import Image
+        with Image.open(path) as image:
+            return image.size
+    except Exception:
+        return None
+
+
+def frame_pixel_regions(frame, frame_path):
+    """frame_path 프레임 PNG의 실제 크기 기준 합성 영역 (픽셀 좌표)
+
+    PNG를 읽을 수 없으면 저장된 기준 크기(size)를, 그것도 없으면 픽셀 좌표(regions)를 그대로 사용합니다.
+    """
+    size = (frame_image_size(frame_path) if frame_path else None) or frame.get('size')
+    if not size:
+        return [tuple(r) for r in frame.get('regions', [])]
+    return frame_regions(frame, tuple(size))
+
+
+class FrameManager:
+    """프레임 데이터 관리 클래스 (JSON 연동)"""
+    def __init__(self, filepath='frames.json', autoload=True, frame_dir=None):
+        self.filepath = filepath
+        # 프레임 PNG 폴더 (기본: frames.json과 같은 폴더의 frame/)
+        self.frame_dir = frame_dir or os.path.join(os.path.dirname(os.path.abspath(filepath)), 'frame')
+        self.frames = []
+        self.migrated = False  # 이전 형식 항목에 정규화 좌표를 추가함 (저장 필요)
+        # autoload=False: 첫 화면 표시 이후 load_frames()를 직접 호출 (시작 속도)
+        if autoload:
+            self.load_frames()
+
+    def load_frames(self):
+        """JSON 파일에서 프레임 데이터 로드 (정규화 좌표가 없는 항목은 메모리에서 변환)"""
+        self.migrated = False
+        if os.path.exists(self.filepath):
+            try:
+                with open(self.filepath, 'r', encoding='utf-8') as f:
+                    self.frames = json.load(f)
+            except Exception as e:
+                print(f"프레임 데이터 로드 실패: {e}")
+                self.frames = []
+        else:
+            self.frames = []
+
+        for frame in self.frames:
+            if frame.get('regions') and not frame.get('norm_regions') and self.normalize(frame):
+                self.migrated = True
+        if self.migrated:
+            print(f"[DEBUG] 이전 형식 프레임 영역을 정규화 좌표로 변환: {self.filepath}")
+
+    def frame_size(self, frame):
+        """프레임 PNG의 실제 크기 (없으면 None)"""
+        filename = frame.get('filename')
+        return frame_image_size(os.path.join(self.frame_dir, filename)) if filename else None
+
+    def normalize(self, frame):
+        """픽셀 영역(regions)으로 정규화 좌표(norm_regions)와 기준 크기(size) 갱신
+
+        Returns: 갱신 여부 (프레임 PNG를 읽을 수 없으면 False - 픽셀 좌표만 사용)
+        """
+        size = self.frame_size(frame)
+        if size is None:
+            return False
+        frame['size'] = list(size)
+        frame['norm_regions'] = [list(normalize_region(r, size)) for r in frame.get('regions', [])]
+        return True
+
+    def _normalize_edited(self, frame):
+        """편집된 항목(정규화 좌표 없음)만 정규화 - 기존 정규화 좌표는 저장된 픽셀 좌표로 덮어쓰지 않음"""
+        if not frame.get('norm_regions'):
+            self.normalize(frame)
+
+    def pixel_regions(self, frame):
+        """프레임 PNG 실제 크기 기준 합성 영역 (설정 화면 편집용)"""
+        filename = frame.get('filename')
+        return frame_pixel_regions(frame, os.path.join(self.frame_dir, filename) if filename else None)
+
+    def save_frames(self):
+        """프레임 데이터를 JSON 파일로 저장"""
+        try:
+            with open(self.filepath, 'w', encoding='utf-8') as f:
+                json.dump(self.frames, f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            print(f"프레임 데이터 저장 실패: {e}")
+
+    def get_all_frames(self):
+        return self.frames
+
+    def get_frame_by_filename(self, filename):
+        """프레임 파일명(예: 01.png)으로 프레임 데이터 조회"""
+        for frame in self.frames:
+            if frame.get('filename') == filename:
+                return frame
+        return None
+
+    def find_frame(self, key):
+        """파일명 또는 표시 이름으로 프레임 데이터 조회 (CLI/매니페스트용)"""
+        return self.get_frame_by_filename(key) or self.get_frame_by_name(key)
+
+    def get_frame_by_name(self, name):
+        for frame in self.frames:
+            if frame.get('name') == name:
+                return frame
+        return None
+
+    def add_frame(self, frame_data):
+        self._normalize_edited(frame_data)
+        self.frames.append(frame_data)
+        # self.save_frames() # 자동 저장 제거
+
+    def update_frame(self, index, frame_data):
+        if 0 <= index < len(self.frames):
+            self._normalize_edited(frame_data)
+            self.frames[index] = frame_data
+            # self.save_frames() # 자동 저장 제거
+
+    def delete_frame(self, index):
+        if 0 <= index < len(self.frames):
+            del self.frames[index]
+            # self.save_frames() # 자동 저장 제거
+
+    def set_frames(self, frames):
+        """프레임 리스트 전체 업데이트 (편집된 항목만 픽셀 영역 기준으로 정규화 좌표 갱신)"""
+        for frame in frames:
+            self._normalize_edited(frame)
+        self.frames = frames
@@ -0,0 +1,64 @@
+"""
+이미지 로드 유틸리티 모듈 (Qt 비의존)
+PIL을 이용한 이미지 로드, 파일 형식 확인, 기본 정보 조회를 제공합니다.
+"""
+
+import os
+
+VALID_IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp')
+
+
+def load_image_with_pil(image_path, target_width=None, target_height=None):
+    """PIL을 통해 이미지를 로드하고 선택적으로 크기 조정"""
+    from PIL import Image as PILImage
+
+    try:
+        print(f"[ImageUtils] PIL로 이미지 로드 시작: {image_path}")
+
+        if not os.path.exists(image_path):
+            print(f"[ImageUtils] 파일이 존재하지 않음: {image_path}")
+            return None
+
+        # PIL로 이미지 로드
+        pil_image = PILImage.open(image_path)
+        print(f"[ImageUtils] PIL 이미지 로드 성공, 원본 크기: {pil_image.size}")
+
+        # 크기 조정이 요청된 경우
+        if target_width and target_height:
+            # 비율 유지하며 크기 조정
+            pil_image.thumbnail((target_width, target_height), PILImage.Resampling.LANCZOS)
+            print(f"[ImageUtils] PIL 리사이즈 완료: {pil_image.size}")
+
+        return pil_image
+
+    except Exception as e:
+        print(f"[ImageUtils] 이미지 로드 오류: {e}")
+        return None
+
+
+def is_valid_image_file(file_path):
+    """유효한 이미지 파일인지 확인"""
+    if not file_path or not os.path.exists(file_path):
+        return False
+
+    return file_path.lower().endswith(VALID_IMAGE_EXTENSIONS)
+
+
+def get_image_info(image_path):
+    """이미지 파일의 기본 정보 반환"""
+    from PIL import Image as PILImage
+
+    try:
+        if not is_valid_image_file(image_path):
+            return None
+
+        with PILImage.open(image_path) as img:
+            return {
+                'size': img.size,
+                'mode': img.mode,
+                'format': img.format,
+                'filename': os.path.basename(image_path)
+            }
+    except Exception as e:
+        print(f"[ImageUtils] 이미지 정보 조회 오류: {e}")
+        return None
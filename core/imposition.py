@@ -0,0 +1,93 @@
+"""
+인쇄 배치(imposition) 모듈
+한 장의 인쇄 용지에 가공 결과 N개를 격자로 배치하고 재단선(cut mark) 위치를 계산합니다.
+(예: 네컷 스트립 두 장을 4x6 용지 한 장에 인쇄한 뒤 재단)
+
+배치 계산만 담당하며 그리기는 호출 측(ui.print_manager)에서 합니다. 셀은 서로 붙여 배치해
+이웃한 셀이 재단선을 공유하고, 재단선은 배치 영역 바깥 여백에 짧은 선으로 표시합니다.
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Tuple
+
+Box = Tuple[int, int, int, int]    # (x, y, w, h)
+Line = Tuple[int, int, int, int]   # (x1, y1, x2, y2)
+
+# 배치 이름 -> 용지 한 장당 결과 수
+IMPOSITION_LAYOUTS = {
+    "1up": 1,
+    "2up": 2,
+    "4up": 4,
+}
+
+DEFAULT_LAYOUT = "1up"
+
+# 재단선 길이/간격 (용지 짧은 변 대비 비율, 최소 픽셀)
+CUT_MARK_RATIO = 0.02
+CUT_MARK_MIN = 8
+
+
+@dataclass
+class PagePlan:
+    """용지 한 장의 배치 결과 (모두 장치 픽셀)"""
+    grid: Tuple[int, int]                              # (열, 행)
+    cells: List[Box] = field(default_factory=list)     # 행 우선 순서
+    cut_marks: List[Line] = field(default_factory=list)
+
+
+def layout_count(layout):
+    if layout not in IMPOSITION_LAYOUTS:
+        raise ValueError(f"알 수 없는 인쇄 배치: {layout} (사용 가능: {', '.join(IMPOSITION_LAYOUTS)})")
+    return IMPOSITION_LAYOUTS[layout]
+
+
+def _fit(image_size, box_size):
+    w, h = image_size
+    scale = min(box_size[0] / w, box_size[1] / h)
+    return max(1, int(w * scale)), max(1, int(h * scale))
+
+
+def plan_page(page_size, image_size, count):
+    """N개 배치 계획
+
+    용지와 결과 이미지 비율에 맞춰 셀이 가장 커지는 격자(열 x 행)를 고르고, 격자 전체를
+    용지 가운데에 둡니다. N이 1이면 여백과 재단선 없이 용지에 맞춥니다.
+
+    Parameters:
+    - page_size: 인쇄 영역 크기 (장치 픽셀)
+    - image_size: 결과 이미지 크기 (비율 계산용)
+    - count: 배치할 결과 수
+    """
+    page_w, page_h = page_size
+    if count <= 1:
+        w, h = _fit(image_size, page_size)
+        return PagePlan((1, 1), [(0, 0, w, h)])
+
+    mark = max(CUT_MARK_MIN, round(min(page_w, page_h) * CUT_MARK_RATIO))
+    gap = mark // 2
+    margin = mark + gap
+    area_w, area_h = page_w - 2 * margin, page_h - 2 * margin
+
+    best = None
+    for cols in range(1, count + 1):
+        if count % cols:
+            continue
+        rows = count // cols
+        cell = _fit(image_size, (area_w // cols, area_h // rows))
+        if best is None or cell[0] * cell[1] > best[2][0] * best[2][1]:
+            best = (cols, rows, cell)
+    cols, rows, (cell_w, cell_h) = best
+
+    left = (page_w - cols * cell_w) // 2
+    top = (page_h - rows * cell_h) // 2
+    cells = [(left + c * cell_w, top + r * cell_h, cell_w, cell_h) for r in range(rows) for c in range(cols)]
+
+    right, bottom = left + cols * cell_w, top + rows * cell_h
+    marks = []
+    for x in (left + c * cell_w for c in range(cols + 1)):
+        marks.append((x, top - gap - mark, x, top - gap))
+        marks.append((x, bottom + gap, x, bottom + gap + mark))
+    for y in (top + r * cell_h for r in range(rows + 1)):
+        marks.append((left - gap - mark, y, left - gap, y))
+        marks.append((right + gap, y, right + gap + mark, y))
+    return PagePlan((cols, rows), cells, marks)
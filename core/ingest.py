@@ -0,0 +1,315 @@
+"""
+사진 가져오기(ingest) 모듈
+선택/드롭한 원본 사진을 세션 폴더로 가져옵니다. 가능한 가장 저렴한 방법부터 시도합니다.
+
+1. 하드 링크 (os.link) - 같은 파일 시스템이면 데이터를 복사하지 않음
+2. 클론(reflink, FICLONE) / copy_file_range - 커널 안에서 복사 (지원하는 파일 시스템/OS만)
+3. 청크 복사 - 복사하면서 내용 해시를 함께 계산
+
+같은 사진(내용 해시)을 여러 슬롯, 세션, 재시도에서 다시 가져오면 원본을 다시 읽지 않고
+이미 가져온 사본에서 링크합니다. 세션 폴더의 입력 사본은 수정되지 않고 삭제만 되므로
+링크를 공유해도 안전합니다.
+
+작업 해상도 모드(설정 ingest_mode = "working")에서는 원본 대신, 어떤 프레임 영역에도
+충분한 크기로 축소하고 EXIF 방향과 sRGB 변환을 적용한 사본을 저장합니다 (원본은 원래 위치에 그대로).
+"""
+
+import hashlib
+import io
+import math
+import os
+import tempfile
+import threading
+from dataclasses import dataclass
+
+from .digest import CHUNK_SIZE, cached_file_digest, file_digest, known_digest, remember_digest
+from .frame_catalog import frame_pixel_regions
+from .layout import resolve_region
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# linux/fs.h: _IOW(0x94, 9, int)
+FICLONE = 0x40049409
+
+METHOD_LINK = "link"
+METHOD_CLONE = "clone"
+METHOD_COPY_RANGE = "copy_file_range"
+METHOD_COPY = "copy"
+METHOD_WORKING = "working"
+
+# 작업 해상도 사본: 인코더 프로필과 대상 형식 (그 외 형식은 원본 그대로 가져옴)
+WORKING_PROFILE = "working"
+WORKING_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+
+
+@dataclass
+class IngestResult:
+    """가져오기 결과"""
+    source: str
+    path: str       # 세션 폴더에 만들어진 파일
+    method: str     # link / clone / copy_file_range / copy / working
+    digest: str     # 내용 해시 (core.digest.file_digest와 같은 값)
+    reused: bool = False  # 이전에 가져온 같은 내용의 사본에서 만들었는지
+
+
+def _link(source, target):
+    os.link(source, target)
+
+
+def _clone(source, target):
+    if fcntl is None:
+        raise OSError("FICLONE 미지원")
+    with open(source, 'rb') as src, open(target, 'wb') as dst:
+        fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+
+
+def _copy_range(source, target):
+    if not hasattr(os, "copy_file_range"):
+        raise OSError("copy_file_range 미지원")
+    with open(source, 'rb') as src, open(target, 'wb') as dst:
+        remaining = os.fstat(src.fileno()).st_size
+        while remaining > 0:
+            copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+            if copied == 0:
+                raise OSError("copy_file_range 중단")
+            remaining -= copied
+
+
+def _chunked_copy(source, target):
+    """청크 단위 복사 - 복사한 내용의 해시 반환"""
+    digest = hashlib.blake2b(digest_size=16)
+    buffer = bytearray(CHUNK_SIZE)
+    view = memoryview(buffer)
+    with open(source, 'rb') as src, open(target, 'wb') as dst:
+        while True:
+            size = src.readinto(buffer)
+            if not size:
+                break
+            digest.update(view[:size])
+            dst.write(view[:size])
+    return digest.hexdigest()
+
+
+def _discard(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+# 시도 순서 (실패하면 다음 방법으로)
+_STRATEGIES = (
+    (METHOD_LINK, _link),
+    (METHOD_CLONE, _clone),
+    (METHOD_COPY_RANGE, _copy_range),
+)
+
+
+def working_region_sizes(frames, frame_dir, expand_pixels=0):
+    """프레임들의 합성 영역 크기 목록 [(w, h), ...] (작업 해상도 계산용, 중복 제거)"""
+    sizes = set()
+    for frame in frames:
+        frame_path = os.path.join(frame_dir, frame['filename']) if frame.get('filename') else None
+        regions = frame_pixel_regions(frame, frame_path)
+        frame_size = None
+        if any(region[2] is None for region in regions):
+            # 좌우 대칭 영역은 프레임 너비가 필요 - 헤더만 읽음
+            from PIL import Image
+            try:
+                with Image.open(os.path.join(frame_dir, frame['filename'])) as image:
+                    frame_size = image.size
+            except (OSError, KeyError):
+                continue
+        for region in regions:
+            size = frame_size or (region[2] + expand_pixels, region[3] + expand_pixels)
+            left, top, right, bottom = resolve_region(tuple(region), size, expand_pixels)
+            sizes.add((right - left, bottom - top))
+    return sorted(sizes)
+
+
+def make_working_image(fp, region_sizes):
+    """작업 해상도 이미지 생성 (core.decode 디코딩 단계 후 축소) - 바꿀 것이 없으면 None
+
+    Returns: (PIL 이미지, 저장 옵션 dict) 또는 None
+    """
+    from PIL import Image
+
+    from .decode import EXIF_ORIENTATION, cover_scale, decode_photo, orientation_of
+
+    with Image.open(fp) as header:
+        orientation = orientation_of(header)
+        has_icc = bool(header.info.get('icc_profile'))
+        exif = header.getexif()
+        w, h = header.size
+    if orientation in (5, 6, 7, 8):
+        w, h = h, w
+    scale = min(1.0, cover_scale((w, h), region_sizes))
+    if scale >= 1.0 and orientation == 1 and not has_icc:
+        return None
+
+    fp.seek(0)
+    image = decode_photo(fp, region_sizes)
+    size = (max(1, math.ceil(w * scale)), max(1, math.ceil(h * scale)))
+    if image.size != size:
+        image = image.resize(size, Image.LANCZOS)
+
+    # 방향은 이미 적용했고 색은 sRGB로 변환했으므로 방향 태그와 ICC 프로파일은 저장하지 않음
+    options = {}
+    if exif:
+        exif.pop(EXIF_ORIENTATION, None)
+        options['exif'] = exif.tobytes()
+    return image, options
+
+
+class Ingestor:
+    """원본 -> 세션 폴더 가져오기 (내용 해시로 중복 제거, 여러 스레드에서 사용 가능)"""
+
+    def __init__(self):
+        self._by_digest = {}  # 내용 해시 -> 이미 가져온 사본 경로
+        self._working = {}    # (원본 내용 해시, 영역 크기) -> (작업 사본 경로, 작업 사본 해시)
+        self._lock = threading.Lock()
+
+    def _existing_copy(self, digest):
+        """같은 내용으로 가져온 사본 중 아직 남아 있고 바뀌지 않은 것"""
+        with self._lock:
+            path = self._by_digest.get(digest)
+        if path and os.path.exists(path) and known_digest(path) == digest:
+            return path
+        return None
+
+    def _remember_copy(self, digest, path):
+        with self._lock:
+            previous = self._by_digest.get(digest)
+            if not previous or not os.path.exists(previous):
+                self._by_digest[digest] = path
+
+    def ingest(self, source, target, region_sizes=None):
+        """source를 target 경로로 가져옴 (target이 있으면 교체)
+
+        region_sizes를 주면 원본 대신 작업 해상도 사본을 만듭니다 (ingest_working 참고).
+
+        Returns: IngestResult
+        """
+        if region_sizes and os.path.splitext(target)[1].lower() in WORKING_EXTENSIONS:
+            return self.ingest_working(source, target, region_sizes)
+
+        source = os.path.abspath(source)
+        target = os.path.abspath(target)
+
+        digest = known_digest(source)
+        existing = self._existing_copy(digest) if digest else None
+        method, copied_digest = _place(existing or source, target)
+        if digest is None:
+            digest = copied_digest or cached_file_digest(target)
+            remember_digest(source, digest)
+        remember_digest(target, digest)
+        self._remember_copy(digest, target)
+
+        print(f"[DEBUG] 가져오기 ({method}{', 재사용' if existing else ''}): {source} -> {target}")
+        return IngestResult(source, target, method, digest, reused=existing is not None)
+
+    def ingest_working(self, source, target, region_sizes):
+        """작업 해상도 사본으로 가져오기
+
+        모든 영역 크기(region_sizes)를 화질 손실 없이 채울 수 있는 크기로 축소하고 EXIF 방향을
+        적용해 저장합니다. 원본은 원래 위치(카드 등)에 그대로 두며, 원본은 한 번만 읽습니다.
+        """
+        source = os.path.abspath(source)
+        target = os.path.abspath(target)
+        region_sizes = tuple(sorted(tuple(size) for size in region_sizes))
+
+        data = None
+        source_digest = known_digest(source)
+        if source_digest is None:
+            with open(source, 'rb') as f:
+                data = f.read()
+            source_digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+            remember_digest(source, source_digest)
+
+        key = (source_digest, region_sizes)
+        with self._lock:
+            existing, digest = self._working.get(key, (None, None))
+        if existing and not (os.path.exists(existing) and known_digest(existing) == digest):
+            existing = None
+
+        if existing:
+            method, _ = _place(existing, target)
+            reused = True
+        else:
+            if data is None:
+                with open(source, 'rb') as f:
+                    data = f.read()
+            working = make_working_image(io.BytesIO(data), region_sizes)
+            if working is None:
+                # 이미 충분히 작고 방향도 맞음 - 원본 그대로 (같은 원본 사본이 있으면 링크)
+                return self.ingest(source, target)
+            image, options = working
+            method, digest = METHOD_WORKING, _save_working(image, target, options)
+            reused = False
+
+        remember_digest(target, digest)
+        with self._lock:
+            self._working[key] = (target, digest)
+
+        print(f"[DEBUG] 가져오기 ({method}{', 재사용' if reused else ''}): {source} -> {target}")
+        return IngestResult(source, target, method, digest, reused=reused)
+
+
+def _place(origin, target):
+    """origin을 target으로 배치 (링크 -> 클론 -> copy_file_range -> 청크 복사)
+
+    임시 이름으로 만든 뒤 교체하므로 중단되어도 반쯤 복사된 사본이 남지 않습니다.
+    Returns: (사용한 방법, 청크 복사 중 계산한 내용 해시 또는 None)
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(target), prefix='.ingest-', suffix='.tmp')
+    os.close(fd)
+    try:
+        for name, strategy in _STRATEGIES:
+            _discard(tmp_path)
+            try:
+                strategy(origin, tmp_path)
+                os.replace(tmp_path, target)
+                return name, None
+            except OSError:
+                continue
+        _discard(tmp_path)
+        copied_digest = _chunked_copy(origin, tmp_path)
+        os.replace(tmp_path, target)
+        return METHOD_COPY, copied_digest
+    except BaseException:
+        _discard(tmp_path)
+        raise
+
+
+def _save_working(image, target, options):
+    """작업 사본 저장 (임시 파일에 쓴 뒤 교체) - 저장된 파일의 내용 해시 반환"""
+    from .encoders import save_image
+
+    # 확장자로 저장 형식을 정하므로 임시 파일도 같은 확장자 사용
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(target), prefix='.ingest-',
+                                    suffix=os.path.splitext(target)[1])
+    os.close(fd)
+    try:
+        save_image(image, tmp_path, WORKING_PROFILE, **options)
+        digest = file_digest(tmp_path)
+        os.replace(tmp_path, target)
+        return digest
+    except BaseException:
+        _discard(tmp_path)
+        raise
+
+
+_default_ingestor = None
+_default_ingestor_lock = threading.Lock()
+
+
+def get_ingestor() -> Ingestor:
+    """프로세스 공용 Ingestor 반환"""
+    global _default_ingestor
+    with _default_ingestor_lock:
+        if _default_ingestor is None:
+            _default_ingestor = Ingestor()
+        return _default_ingestor
@@ -0,0 +1,132 @@
+"""
+렌더 작업 모듈
+GUI 없이 합성 작업(프레임 + 사진 목록 + 출력 경로)을 정의하고 실행합니다.
+매니페스트(JSON/CSV)에서 여러 작업을 읽을 수 있습니다.
+
+JSON 매니페스트:
+    [{"frame": "01.png", "photos": ["a.jpg", "b.jpg"], "output": "out.jpg",
+      "expand_pixels": 0, "profile": "default"}, ...]
+    (또는 {"jobs": [...]} 형태)
+
+CSV 매니페스트 (헤더 필수):
+    frame,output,photos,expand_pixels,profile
+    01.png,out.jpg,a.jpg;b.jpg;c.jpg;d.jpg,0,default
+    (photos 대신 photo1, photo2, ... 열을 사용해도 됨)
+
+매니페스트 안의 상대 경로는 매니페스트 파일 위치 기준입니다.
+"""
+
+import csv
+import json
+import os
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from .encoders import DEFAULT_PROFILE
+from .frame_catalog import frame_pixel_regions
+from .layout import plan_photo_regions
+
+NO_FRAME = "none"
+
+
+@dataclass
+class RenderJob:
+    """합성 작업 하나"""
+    frame: str                      # frames.json의 파일명 또는 이름 ("none"이면 프레임 없이 저장)
+    photos: List[Optional[str]]     # 슬롯 순서대로의 사진 경로 (빈 슬롯은 None)
+    output: str
+    expand_pixels: int = 0
+    profile: str = DEFAULT_PROFILE
+    tags: dict = field(default_factory=dict)  # 호출자가 붙이는 부가 정보 (결과 보고용)
+
+
+def _resolve(path, base_dir):
+    if not path:
+        return None
+    return path if os.path.isabs(path) else os.path.join(base_dir, path)
+
+
+def _job_from_record(record, base_dir, index):
+    """매니페스트 레코드(dict)를 RenderJob으로 변환"""
+    frame = (record.get('frame') or '').strip()
+    output = (record.get('output') or '').strip()
+    if not frame or not output:
+        raise ValueError(f"매니페스트 {index + 1}번째 작업: 'frame'과 'output'은 필수입니다.")
+
+    photos = record.get('photos')
+    if isinstance(photos, str):
+        photos = photos.split(';')
+    if photos is None:
+        # CSV의 photo1, photo2, ... 열
+        numbered = sorted((k for k in record if k and k.startswith('photo') and k[5:].isdigit()),
+                          key=lambda k: int(k[5:]))
+        photos = [record[k] for k in numbered]
+    photos = [_resolve((p or '').strip(), base_dir) for p in photos]
+
+    return RenderJob(
+        frame=frame,
+        photos=photos,
+        output=_resolve(output, base_dir),
+        expand_pixels=int(record.get('expand_pixels') or 0),
+        profile=(record.get('profile') or DEFAULT_PROFILE).strip(),
+    )
+
+
+def load_manifest(path):
+    """JSON 또는 CSV 매니페스트에서 작업 목록 로드"""
+    base_dir = os.path.dirname(os.path.abspath(path))
+    if path.lower().endswith('.csv'):
+        with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+            records = list(csv.DictReader(f))
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            records = json.load(f)
+        if isinstance(records, dict):
+            records = records.get('jobs', [])
+
+    return [_job_from_record(record, base_dir, i) for i, record in enumerate(records)]
+
+
+def run_render_job(job, frame_manager, frame_dir):
+    """작업 실행 후 출력 경로 반환
+
+    Raises:
+        FileNotFoundError: 프레임 이미지나 사진이 없을 때
+        ValueError: 프레임을 카탈로그에서 찾을 수 없거나 합성할 사진이 없을 때
+    """
+    from .compositing import insert_images_into_frame
+    from .decode import decode_photo
+    from .encoders import save_image, encoder_options, output_format
+
+    encoder_options(job.profile, output_format(job.output))  # 알 수 없는 프로필은 합성 전에 실패
+
+    output_dir = os.path.dirname(os.path.abspath(job.output))
+    os.makedirs(output_dir, exist_ok=True)
+
+    if job.frame == NO_FRAME:
+        photo = next((p for p in job.photos if p), None)
+        if not photo or not os.path.exists(photo):
+            raise FileNotFoundError(f"사진을 찾을 수 없음: {photo}")
+        # 미리보기와 같은 방향으로 저장 (EXIF 방향 적용, sRGB 변환)
+        save_image(decode_photo(photo), job.output, job.profile)
+        return job.output
+
+    frame_data = frame_manager.find_frame(job.frame)
+    if frame_data is None:
+        raise ValueError(f"frames.json에 없는 프레임: {job.frame}")
+
+    frame_path = os.path.join(frame_dir, frame_data['filename'])
+    if not os.path.exists(frame_path):
+        raise FileNotFoundError(f"프레임 이미지를 찾을 수 없음: {frame_path}")
+
+    missing = [p for p in job.photos if p and not os.path.exists(p)]
+    if missing:
+        raise FileNotFoundError(f"사진을 찾을 수 없음: {', '.join(missing)}")
+
+    photo_regions = plan_photo_regions(job.photos, frame_pixel_regions(frame_data, frame_path))
+    if not photo_regions:
+        raise ValueError(f"합성할 사진이 없습니다: {job.output}")
+
+    insert_images_into_frame(photo_regions, frame_path, job.output,
+                             expand_pixels=job.expand_pixels, profile=job.profile)
+    return job.output
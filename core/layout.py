@@ -0,0 +1,76 @@
+"""
+레이아웃 계획 모듈
+프레임의 합성 영역 좌표와 입력 사진을 짝지어, 실제로 사진을 붙일 영역 목록을 만듭니다.
+
+frames.json의 영역은 프레임 PNG 픽셀 좌표(regions)와 함께 해상도와 무관한 정규화 좌표
+(norm_regions, 프레임 너비/높이 대비 0~1)를 가집니다. 정규화 좌표가 있으면 실제 프레임 크기에 맞춰
+픽셀 좌표로 변환해 쓰므로, 프레임 PNG를 다른 해상도로 바꾸거나 임의의 크기로 합성해도 영역이 맞습니다.
+"""
+
+import os
+from typing import List, Optional, Sequence, Tuple
+
+Region = Tuple[int, int, Optional[int], int]
+Box = Tuple[int, int, int, int]
+NormRegion = Tuple[float, float, float, float]
+
+# 정규화 좌표 저장 자릿수 (8000px 프레임에서도 1px 미만 오차)
+NORM_PRECISION = 6
+
+
+def resolve_region(region: Region, frame_size: Tuple[int, int], expand_pixels: int = 0) -> Box:
+    """영역 좌표를 프레임 크기 안의 실제 박스로 변환
+
+    Parameters:
+    - region: (left_x, top_y, right_x, bottom_y), right_x가 None이면 좌우 대칭으로 계산 (기존 호환성)
+    - frame_size: (frame_w, frame_h)
+    - expand_pixels: 합성 영역을 확장할 픽셀 수
+    """
+    frame_w, frame_h = frame_size
+    left_x, top_y, right_x, bottom_y = region
+
+    if right_x is None:
+        right_x = frame_w - left_x
+
+    if expand_pixels > 0:
+        left_x = max(0, left_x - expand_pixels)
+        top_y = max(0, top_y - expand_pixels)
+        right_x = min(frame_w, right_x + expand_pixels)
+        bottom_y = min(frame_h, bottom_y + expand_pixels)
+
+    return left_x, top_y, right_x, bottom_y
+
+
+def normalize_region(region: Region, frame_size: Tuple[int, int]) -> NormRegion:
+    """픽셀 영역 -> 정규화 좌표 (right_x가 None이면 좌우 대칭으로 계산)"""
+    left_x, top_y, right_x, bottom_y = resolve_region(tuple(region), frame_size)
+    frame_w, frame_h = frame_size
+    return (round(left_x / frame_w, NORM_PRECISION), round(top_y / frame_h, NORM_PRECISION),
+            round(right_x / frame_w, NORM_PRECISION), round(bottom_y / frame_h, NORM_PRECISION))
+
+
+def denormalize_region(norm_region: NormRegion, frame_size: Tuple[int, int]) -> Box:
+    """정규화 좌표 -> frame_size 기준 픽셀 영역"""
+    frame_w, frame_h = frame_size
+    left, top, right, bottom = norm_region
+    return round(left * frame_w), round(top * frame_h), round(right * frame_w), round(bottom * frame_h)
+
+
+def frame_regions(frame_data: dict, frame_size: Tuple[int, int]) -> List[Region]:
+    """프레임 데이터의 합성 영역 (frame_size 픽셀 기준)
+
+    정규화 좌표(norm_regions)가 있으면 frame_size에 맞춰 변환하고, 없으면(이전 형식) 픽셀 좌표 그대로.
+    """
+    norm_regions = frame_data.get('norm_regions')
+    if norm_regions:
+        return [denormalize_region(r, frame_size) for r in norm_regions]
+    return [tuple(r) for r in frame_data.get('regions', [])]
+
+
+def plan_photo_regions(files: Sequence[Optional[str]], regions: Sequence[Region]) -> List[Tuple[str, Region]]:
+    """슬롯 순서대로 사진과 영역을 짝지음 (비어 있거나 없는 파일, 영역이 없는 슬롯은 제외)"""
+    photo_regions = []
+    for i, file_path in enumerate(files):
+        if file_path and os.path.exists(file_path) and i < len(regions):
+            photo_regions.append((file_path, tuple(regions[i])))
+    return photo_regions
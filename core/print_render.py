@@ -0,0 +1,141 @@
+"""
+인쇄 래스터 모듈
+가공 결과를 프린터 인쇄 영역의 장치 픽셀 크기로 한 번만 리샘플링한 RGB 래스터를 만듭니다.
+인쇄 시 QPainter가 다시 확대/축소하지 않도록 장치 픽셀 1:1로 그릴 수 있는 크기이며,
+크기가 이미 맞으면 리샘플링 없이 그대로 사용합니다. 인쇄 영역이 결과보다 크면(고해상도 PDF 등)
+확대한 래스터를 만들지 않고 원본 픽셀을 그대로 두어 프린터 쪽에서 확대합니다.
+
+래스터는 세션 폴더의 .print/ 아래에 (결과 내용 해시, 인쇄 영역 크기)별로 저장되어
+다시 인쇄할 때는 디코딩/리샘플링 없이 바로 읽습니다.
+
+파일 형식 (.rgb):
+    헤더  <4sHII  magic b'BTRP', version, width, height
+    본문  RGB888 (행 단위, 패딩 없음)
+"""
+
+import os
+import struct
+import tempfile
+from dataclasses import dataclass
+
+from .digest import cached_file_digest
+
+PRINT_CACHE_DIR = ".print"
+
+_MAGIC = b'BTRP'
+_VERSION = 1
+_HEADER = struct.Struct('<4sHII')
+
+
+@dataclass
+class PrintRaster:
+    """장치 픽셀 크기의 RGB 래스터"""
+    width: int
+    height: int
+    data: bytes
+    path: str
+    cached: bool = False  # 캐시에서 읽었는지
+
+    @property
+    def bytes_per_line(self):
+        return self.width * 3
+
+    def target_size(self, page_size):
+        """인쇄 영역 안에서 그릴 크기 (장치 픽셀 - 래스터 크기와 같으면 1:1)"""
+        return fit_size((self.width, self.height), page_size)
+
+
+def fit_size(image_size, box_size):
+    """비율을 유지하며 box_size 안에 들어가는 최대 크기"""
+    w, h = image_size
+    box_w, box_h = box_size
+    scale = min(box_w / w, box_h / h)
+    return max(1, round(w * scale)), max(1, round(h * scale))
+
+
+def image_size(image_path):
+    """이미지 크기 (헤더만 읽음)"""
+    from PIL import Image
+
+    with Image.open(image_path) as image:
+        return image.size
+
+
+def raster_path(image_path, page_size, cache_dir=None):
+    """래스터 캐시 경로 (기본: 결과 파일 폴더의 .print/)"""
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.dirname(os.path.abspath(image_path)), PRINT_CACHE_DIR)
+    digest = cached_file_digest(image_path)
+    return os.path.join(cache_dir, f"{digest}-{page_size[0]}x{page_size[1]}.rgb")
+
+
+def load_raster(path):
+    """캐시된 래스터 로드 (없거나 형식이 맞지 않으면 None)"""
+    try:
+        with open(path, 'rb') as f:
+            header = f.read(_HEADER.size)
+            if len(header) != _HEADER.size:
+                return None
+            magic, version, width, height = _HEADER.unpack(header)
+            if magic != _MAGIC or version != _VERSION:
+                return None
+            data = f.read()
+    except OSError:
+        return None
+    if len(data) != width * height * 3:
+        return None
+    return PrintRaster(width, height, data, path, cached=True)
+
+
+def _save_raster(raster):
+    os.makedirs(os.path.dirname(raster.path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(raster.path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, raster.width, raster.height))
+            f.write(raster.data)
+        os.replace(tmp_path, raster.path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def render_print_raster(image_path, page_size, cache_dir=None):
+    """인쇄 영역(page_size, 장치 픽셀)에 맞춘 RGB 래스터 (캐시가 있으면 그대로 사용)
+
+    Returns: PrintRaster
+    """
+    page_size = (int(page_size[0]), int(page_size[1]))
+    path = raster_path(image_path, page_size, cache_dir)
+    raster = load_raster(path)
+    if raster is not None:
+        print(f"[DEBUG] 인쇄 래스터 캐시 적중: {path}")
+        return raster
+
+    from PIL import Image
+
+    from .decode import decode_photo
+
+    with Image.open(image_path) as header:
+        size = fit_size(header.size, page_size)
+        if size[0] > header.size[0]:
+            size = header.size  # 확대는 하지 않음
+    image = decode_photo(image_path, [size])
+    if image.mode in ('RGBA', 'LA', 'P'):
+        image = image.convert('RGBA')
+        background = Image.new('RGB', image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel('A'))
+        image = background
+    elif image.mode != 'RGB':
+        image = image.convert('RGB')
+    if image.size != size:
+        image = image.resize(size, Image.LANCZOS)
+
+    raster = PrintRaster(size[0], size[1], image.tobytes(), path)
+    try:
+        _save_raster(raster)
+    except OSError as e:
+        print(f"[WARNING] 인쇄 래스터 캐시 저장 실패: {path} ({e})")
+    print(f"[DEBUG] 인쇄 래스터 생성: {size[0]}x{size[1]} (인쇄 영역 {page_size[0]}x{page_size[1]})")
+    return raster
@@ -0,0 +1,149 @@
+"""
+이미지 가공 모듈
+선택된 사진과 프레임 정보를 받아 합성 결과 파일을 만듭니다.
+PIL과 합성 모듈은 첫 가공 시 로드합니다 (GUI 시작 속도).
+
+입력(사진, 프레임, 영역, 확장 픽셀, 인코더 프로필)이 이전 가공과 같으면 다시 인코딩하지 않고
+기존 결과 또는 렌더 캐시(core.render_cache)의 결과를 사용합니다.
+
+render_preview/render_at_scale은 원본 해상도 가공을 거치지 않고 원하는 크기의 합성을 바로 만듭니다
+(원본 해상도 가공이 끝나기 전에 보여 줄 미리보기 등).
+"""
+
+import os
+import shutil
+
+from .digest import read_output_digest, remove_output_digest, render_digest, write_output_digest
+from .encoders import DEFAULT_PROFILE
+from .frame_catalog import frame_pixel_regions
+from .layout import plan_photo_regions
+
+
+class ImageProcessor:
+    """이미지 처리 클래스: 가공 로직 연결"""
+
+    def __init__(self, frame_dir=None, render_cache=None, profile=DEFAULT_PROFILE):
+        self.frame_dir = frame_dir
+        self.render_cache = render_cache  # core.render_cache.RenderCache (None이면 사용 안 함)
+        self.profile = profile
+
+    def frame_path(self, frame_name):
+        return os.path.join(self.frame_dir or os.path.join(os.getcwd(), 'frame'), frame_name)
+
+    @staticmethod
+    def output_path(files, output_folder):
+        """가공 결과 파일 경로 (processed_ + 첫 슬롯 파일명)"""
+        base_name = os.path.basename(files[0]) if files and files[0] else "image.jpg"
+        return os.path.join(output_folder, "processed_" + base_name)
+
+    def _reuse_previous(self, digest, output_path):
+        """같은 입력의 이전 결과가 있으면 True (결과 파일 그대로 또는 렌더 캐시에서 복원)"""
+        if read_output_digest(output_path) == digest:
+            print(f"[DEBUG] 입력 변경 없음, 이전 가공 결과 사용: {output_path}")
+            return True
+        if self.render_cache is not None and self.render_cache.restore(digest, output_path):
+            write_output_digest(output_path, digest)
+            return True
+        return False
+
+    def _finish(self, digest, output_path):
+        """새로 가공한 결과의 다이제스트 기록 및 캐시 보관"""
+        write_output_digest(output_path, digest)
+        if self.render_cache is not None:
+            self.render_cache.store(digest, output_path)
+
+    def render_preview(self, files, frame_name, frame_manager, box_size, expand_pixels=0, fitted_cache=None):
+        """미리보기 크기(box_size 안에 맞춤) 합성 - process_images와 같은 입력, 파일로 저장하지 않음
+
+        비어 있는 슬롯은 건너뛰므로 사진을 넣는 도중의 실시간 미리보기에도 사용합니다.
+        fitted_cache는 core.compositing.render_at_scale 참고.
+
+        Returns: PIL 이미지 (미리보기로 보여 줄 것이 없으면 None)
+        """
+        return self.render_at_scale(files, frame_name, frame_manager, size=box_size,
+                                    expand_pixels=expand_pixels, fitted_cache=fitted_cache)
+
+    def render_at_scale(self, files, frame_name, frame_manager, scale=None, size=None, expand_pixels=0,
+                        fitted_cache=None):
+        """원하는 배율(scale) 또는 크기(size 안에 맞춤)로 합성 - 원본 해상도 합성 없이 바로 생성
+
+        Returns: PIL 이미지 (합성할 사진이 없으면 None)
+        """
+        from PIL import Image as PILImage
+        from .compositing import render_at_scale, scaled_size
+        from .decode import SWAPPED_ORIENTATIONS, decode_photo, orientation_of
+
+        frame_path = self.frame_path(frame_name) if frame_name != "none" else None
+        if frame_path is None or not os.path.exists(frame_path):
+            # 프레임 없이 저장하는 경우 첫 사진 그대로
+            if not files or not files[0]:
+                return None
+            if size is None:
+                with PILImage.open(files[0]) as image:
+                    w, h = image.size
+                    if orientation_of(image) in SWAPPED_ORIENTATIONS:
+                        w, h = h, w  # 표시 방향 기준
+                    size, _ = scaled_size((w, h), scale)
+            image = decode_photo(files[0], [size])
+            image.thumbnail(size, PILImage.LANCZOS)
+            return image
+
+        frame_data = frame_manager.get_frame_by_filename(frame_name)
+        regions = frame_pixel_regions(frame_data, frame_path) if frame_data else []
+        photo_regions = plan_photo_regions(files, regions)
+        if not photo_regions:
+            return None
+        return render_at_scale(photo_regions, frame_path, scale=scale, size=size, expand_pixels=expand_pixels,
+                               fitted_cache=fitted_cache)
+
+    def process_images(self, files, frame_name, frame_manager, output_folder, expand_pixels=0):
+        """이미지 가공 실행"""
+        try:
+            from .compositing import insert_images_into_frame
+            from .decode import decode_photo
+
+            processed_image_path = self.output_path(files, output_folder)
+
+            if frame_name == "none":
+                if files[0]:
+                    digest = render_digest(files[:1], None, [], 0, "original")
+                    if self._reuse_previous(digest, processed_image_path):
+                        return processed_image_path
+                    remove_output_digest(processed_image_path)
+                    # 미리보기와 같은 방향으로 저장 (EXIF 방향 적용, sRGB 변환 - core.decode)
+                    decode_photo(files[0]).save(processed_image_path, quality=100)
+                    self._finish(digest, processed_image_path)
+                return processed_image_path
+
+            frame_path = self.frame_path(frame_name)
+            os.makedirs(os.path.dirname(frame_path), exist_ok=True)
+
+            if not os.path.exists(frame_path):
+                print(f"[WARNING] 프레임 이미지를 찾을 수 없음: {frame_path}")
+                remove_output_digest(processed_image_path)
+                if files[0]:
+                    shutil.copy(files[0], processed_image_path)
+                return processed_image_path
+
+            # frame_name은 파일명(01.png)이므로 파일명으로 영역 정보를 찾음
+            frame_data = frame_manager.get_frame_by_filename(frame_name)
+            regions = frame_pixel_regions(frame_data, frame_path) if frame_data else []
+
+            photo_regions = plan_photo_regions(files, regions)
+            if photo_regions:
+                digest = render_digest(files, frame_path, regions, expand_pixels, self.profile)
+                if self._reuse_previous(digest, processed_image_path):
+                    return processed_image_path
+
+                # 가공 중 실패해도 이전 다이제스트가 남지 않도록 먼저 제거
+                remove_output_digest(processed_image_path)
+                insert_images_into_frame(photo_regions, frame_path, processed_image_path,
+                                         expand_pixels=expand_pixels, profile=self.profile)
+                self._finish(digest, processed_image_path)
+                return processed_image_path
+            else:
+                return None
+
+        except Exception as e:
+            print(f"[ERROR] 이미지 가공 중 오류: {e}")
+            raise e
@@ -0,0 +1,328 @@
+"""
+투명 영역 인식 모듈
+프레임 알파 채널에서 투명한 구멍(연결 요소)을 원본 해상도로 찾고, 구멍마다 축 정렬 사각형,
+최소 면적 회전 사각형, 볼록 다각형(볼록 껍질)과 사진을 붙일 사각형(quad)을 계산합니다. Qt에 의존하지 않습니다.
+
+픽셀 단위 탐색 대신 행별 연속 구간(run, bytes.find로 C 수준에서 추출)을 위아래로 이어 붙이는
+run-length union-find를 사용하므로, 큰 프레임도 픽셀 수가 아니라 구간 수에 비례하는 파이썬 반복으로 처리됩니다.
+설정 화면의 투명 영역 자동 인식과 합성 시 슬롯 마스크(core.slot_masks)가 같은 인식을 사용합니다.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+from PIL import Image
+
+# 자동 인식에서 구멍으로 보는 알파 값 상한 (이 값 미만)
+DETECT_ALPHA_THRESHOLD = 10
+# 이보다 작은 구멍은 무시 (가로, 세로 px)
+MIN_OPENING_SIZE = 50
+# 꼭짓점 좌표가 이 값(px) 이내로 어긋나면 축 정렬 사각형으로 취급
+AXIS_TOLERANCE = 1.5
+# 구멍 면적 / 볼록 껍질 면적, 볼록 껍질 면적 / 사각형 면적이 이 값 이상이면 사각형 구멍 (원형/하트 등과 구분)
+QUAD_FILL_RATIO = 0.97
+
+KIND_RECT = "rect"          # 축 정렬 사각형
+KIND_ROTATED = "rotated"    # 회전된 사각형
+KIND_POLYGON = "polygon"    # 사각형이지만 평행사변형이 아님 (원근 등)
+KIND_SHAPE = "shape"        # 사각형이 아닌 모양 (원형, 하트 등 - 축 정렬 박스 + 마스크로 합성)
+
+Point = Tuple[float, float]
+Run = Tuple[int, int, int]  # (y, x_start, x_end)
+
+
+@dataclass
+class Opening:
+    """투명 구멍 하나의 인식 결과 (좌표는 이미지 픽셀 모서리 기준)"""
+    box: Tuple[int, int, int, int]          # 축 정렬 경계 (left, top, right, bottom)
+    area: int                               # 구멍 픽셀 수
+    hull: List[Point]                       # 볼록 껍질 (시계 방향)
+    rect: List[Point]                       # 최소 면적 회전 사각형 꼭짓점 (좌상단부터 시계 방향)
+    angle: float                            # 회전 사각형 기울기 (도, -45 ~ 45)
+    quad: Optional[List[Point]]             # 사진을 붙일 사각형 (좌상단부터 시계 방향, 사각형 구멍이 아니면 None)
+    kind: str
+
+    @property
+    def warped(self) -> bool:
+        """사진을 변형해 붙여야 하는 구멍인지 (축 정렬 사각형과 일반 모양은 변형 없이 박스에 맞춤)"""
+        return self.kind in (KIND_ROTATED, KIND_POLYGON)
+
+
+def opening_runs(binary: Image.Image) -> List[Run]:
+    """이진 이미지(L, 구멍 255, 나머지 0)의 행별 연속 구간 목록 (행 순서)
+
+    픽셀 버퍼 전체에서 bytes.find(memchr)로 구간 시작(255)과 끝(0)만 찾아 건너뛰므로, 파이썬 반복은
+    픽셀 수가 아니라 구간 수에 비례합니다. 행 끝을 넘어 이어진 구간은 행별로 나눕니다.
+    """
+    width = binary.size[0]
+    data = binary.tobytes()
+    find = data.find
+    runs = []
+    start = find(b'\xff')
+    while start >= 0:
+        end = find(b'\x00', start)
+        if end < 0:
+            end = len(data)
+        y, x0 = divmod(start, width)
+        while x0 + end - start > width:
+            runs.append((y, x0, width))
+            start += width - x0
+            y, x0 = y + 1, 0
+        runs.append((y, x0, x0 + end - start))
+        start = find(b'\xff', end)
+    return runs
+
+
+def label_runs(runs: List[Run]) -> List[int]:
+    """위아래 행에서 가로로 겹치는 구간을 같은 구멍으로 묶은 대표 번호 목록 (4-연결)"""
+    parent = list(range(len(runs)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    previous, current, current_y = [], [], None
+    for i, (y, x0, x1) in enumerate(runs):
+        if y != current_y:
+            previous = current if current_y == y - 1 else []
+            current, current_y = [], y
+        for j in previous:
+            _, px0, px1 = runs[j]
+            if px0 < x1 and x0 < px1:
+                root_i, root_j = find(i), find(j)
+                if root_i != root_j:
+                    parent[root_i] = root_j
+        current.append(i)
+    return [find(i) for i in range(len(runs))]
+
+
+def group_runs(runs: List[Run], labels: List[int]) -> List[List[Run]]:
+    """대표 번호별 구간 목록 (처음 나타난 순서)"""
+    groups = {}
+    for label, run in zip(labels, runs):
+        groups.setdefault(label, []).append(run)
+    return list(groups.values())
+
+
+# --- 기하 ---
+
+def polygon_area(points: Sequence[Point]) -> float:
+    area = 0.0
+    for (x0, y0), (x1, y1) in zip(points, list(points[1:]) + [points[0]]):
+        area += x0 * y1 - x1 * y0
+    return abs(area) / 2
+
+
+def convex_hull(points: Sequence[Point]) -> List[Point]:
+    """볼록 껍질 (monotone chain, 이미지 좌표에서 시계 방향)"""
+    points = sorted(set(points))
+    if len(points) <= 2:
+        return list(points)
+
+    def cross(o, a, b):
+        return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+    lower, upper = [], []
+    for p in points:
+        while len(lower) >= 2 and cross(lower[-2], lower[-1], p) <= 0:
+            lower.pop()
+        lower.append(p)
+    for p in reversed(points):
+        while len(upper) >= 2 and cross(upper[-2], upper[-1], p) <= 0:
+            upper.pop()
+        upper.append(p)
+    return lower[:-1] + upper[:-1]
+
+
+def order_corners(corners: Sequence[Point]) -> List[Point]:
+    """사각형 꼭짓점을 좌상단부터 시계 방향으로 정렬 (이미지 좌표)"""
+    cx = sum(p[0] for p in corners) / len(corners)
+    cy = sum(p[1] for p in corners) / len(corners)
+    ordered = sorted(corners, key=lambda p: math.atan2(p[1] - cy, p[0] - cx))
+    start = min(range(len(ordered)), key=lambda i: ordered[i][0] + ordered[i][1])
+    return ordered[start:] + ordered[:start]
+
+
+def min_area_rect(hull: Sequence[Point]) -> Tuple[List[Point], float]:
+    """최소 면적 회전 사각형 (rotating calipers - 껍질의 각 변 방향마다 투영 범위 비교)
+
+    Returns: (꼭짓점 - 좌상단부터 시계 방향, 기울기 도 -45 ~ 45)
+    """
+    best = None
+    for i in range(len(hull)):
+        (x0, y0), (x1, y1) = hull[i], hull[(i + 1) % len(hull)]
+        length = math.hypot(x1 - x0, y1 - y0)
+        if length == 0:
+            continue
+        ux, uy = (x1 - x0) / length, (y1 - y0) / length
+        us = [x * ux + y * uy for x, y in hull]
+        vs = [-x * uy + y * ux for x, y in hull]
+        area = (max(us) - min(us)) * (max(vs) - min(vs))
+        if best is None or area < best[0]:
+            best = (area, ux, uy, min(us), max(us), min(vs), max(vs))
+
+    _, ux, uy, u0, u1, v0, v1 = best
+    corners = [(u * ux - v * uy, u * uy + v * ux) for u, v in ((u0, v0), (u1, v0), (u1, v1), (u0, v1))]
+    angle = math.degrees(math.atan2(uy, ux))
+    angle = (angle + 45) % 90 - 45
+    return order_corners(corners), angle
+
+
+def fit_quad(hull: Sequence[Point], rect: Sequence[Point]) -> List[Point]:
+    """회전 사각형 꼭짓점마다 가장 가까운 껍질 꼭짓점 (원근 등으로 평행사변형이 아닌 사각형 구멍)"""
+    return order_corners([min(hull, key=lambda p: (p[0] - cx) ** 2 + (p[1] - cy) ** 2) for cx, cy in rect])
+
+
+def _band_corners(band, ox, oy) -> List[Point]:
+    top, bottom, x0, x1 = band
+    return [(x0 + ox, top + oy), (x1 + ox, top + oy), (x0 + ox, bottom + oy), (x1 + ox, bottom + oy)]
+
+
+def describe_opening(runs: List[Run], offset: Tuple[int, int] = (0, 0)) -> Opening:
+    """한 구멍의 구간 목록 -> 인식 결과 (offset: 구간 좌표에 더할 이미지 좌표)"""
+    ox, oy = offset
+    rows = {}
+    area = 0
+    for y, x0, x1 in runs:
+        area += x1 - x0
+        lo, hi = rows.get(y, (x0, x1))
+        rows[y] = (min(lo, x0), max(hi, x1))
+    # 행별 양 끝 픽셀의 모서리 점만으로 볼록 껍질 계산 - 양 끝이 같은 연속 행은 한 띠로 묶음
+    # (띠 중간의 점은 세로 변 위에 있어 껍질 꼭짓점이 되지 않으므로, 사각형 구멍은 점 몇 개로 끝남)
+    points = []
+    band = None  # (위 y, 아래 y, x0, x1)
+    for y in sorted(rows):
+        x0, x1 = rows[y]
+        if band is not None and band[1] == y and band[2:] == (x0, x1):
+            band = (band[0], y + 1, x0, x1)
+            continue
+        if band is not None:
+            points += _band_corners(band, ox, oy)
+        band = (y, y + 1, x0, x1)
+    points += _band_corners(band, ox, oy)
+    hull = convex_hull(points)
+    box = (min(p[0] for p in hull), min(p[1] for p in hull), max(p[0] for p in hull), max(p[1] for p in hull))
+    box = tuple(int(v) for v in box)
+
+    rect, angle = min_area_rect(hull)
+    hull_area = polygon_area(hull)
+    quad = None
+    if hull_area and area / hull_area >= QUAD_FILL_RATIO:
+        candidate = fit_quad(hull, rect)
+        if len(set(candidate)) == 4 and polygon_area(candidate) / hull_area >= QUAD_FILL_RATIO:
+            quad = candidate
+
+    if quad is None:
+        kind = KIND_SHAPE
+    elif is_axis_aligned(quad):
+        kind = KIND_RECT
+    elif is_parallelogram(quad):
+        kind = KIND_ROTATED
+    else:
+        kind = KIND_POLYGON
+    return Opening(box, area, hull, rect, angle, quad, kind)
+
+
+def is_axis_aligned(quad: Sequence[Point], tolerance: float = AXIS_TOLERANCE) -> bool:
+    (x0, y0), (x1, y1), (x2, y2), (x3, y3) = quad
+    return (abs(y0 - y1) <= tolerance and abs(y2 - y3) <= tolerance
+            and abs(x0 - x3) <= tolerance and abs(x1 - x2) <= tolerance)
+
+
+def is_parallelogram(quad: Sequence[Point], tolerance: float = 2.0) -> bool:
+    (x0, y0), (x1, y1), (x2, y2), (x3, y3) = quad
+    return abs((x0 + x2) - (x1 + x3)) <= tolerance and abs((y0 + y2) - (y1 + y3)) <= tolerance
+
+
+def detect_openings(image: Image.Image, threshold: int = DETECT_ALPHA_THRESHOLD,
+                    min_size: int = MIN_OPENING_SIZE) -> List[Opening]:
+    """프레임 이미지(또는 알파 채널 L)의 투명 구멍 목록 (원본 해상도, 위에서 아래 행 순서 후 왼쪽부터)"""
+    alpha = image if image.mode == 'L' else image.convert('RGBA').getchannel('A')
+    binary = alpha.point(lambda a: 255 if a < threshold else 0)
+    runs = opening_runs(binary)
+    openings = [describe_opening(group) for group in group_runs(runs, label_runs(runs))]
+    openings = [o for o in openings if o.box[2] - o.box[0] > min_size and o.box[3] - o.box[1] > min_size]
+    return sort_reading_order(openings)
+
+
+def sort_reading_order(openings: List[Opening]) -> List[Opening]:
+    """세로 중심이 비슷한 구멍끼리 한 줄로 묶어 위 줄부터, 줄 안에서는 왼쪽부터"""
+    openings = sorted(openings, key=lambda o: (o.box[1], o.box[0]))
+    rows = []
+    for opening in openings:
+        if rows:
+            prev = rows[-1][-1].box
+            if abs((opening.box[1] + opening.box[3]) / 2 - (prev[1] + prev[3]) / 2) < (prev[3] - prev[1]) / 2:
+                rows[-1].append(opening)
+                continue
+        rows.append([opening])
+    return [opening for row in rows for opening in sorted(row, key=lambda o: o.box[0])]
+
+
+# --- 사진 변형 ---
+
+def quad_fit_size(quad: Sequence[Point]) -> Tuple[int, int]:
+    """사각형 구멍에 붙일 사진 크기 (마주 보는 변 길이의 평균)"""
+    (x0, y0), (x1, y1), (x2, y2), (x3, y3) = quad
+    width = (math.hypot(x1 - x0, y1 - y0) + math.hypot(x2 - x3, y2 - y3)) / 2
+    height = (math.hypot(x3 - x0, y3 - y0) + math.hypot(x2 - x1, y2 - y1)) / 2
+    return max(1, round(width)), max(1, round(height))
+
+
+def expand_quad(quad: Sequence[Point], pixels: float) -> List[Point]:
+    """꼭짓점을 중심에서 바깥으로 pixels만큼 밀어냄 (변형한 사진이 마스크 가장자리까지 덮도록)"""
+    cx = sum(p[0] for p in quad) / 4
+    cy = sum(p[1] for p in quad) / 4
+    expanded = []
+    for x, y in quad:
+        d = math.hypot(x - cx, y - cy) or 1.0
+        expanded.append((x + (x - cx) / d * pixels, y + (y - cy) / d * pixels))
+    return expanded
+
+
+def perspective_coefficients(dst: Sequence[Point], src: Sequence[Point]) -> List[float]:
+    """dst(결과 좌표) -> src(사진 좌표) 원근 변환 계수 8개 (PIL Image.PERSPECTIVE 형식)"""
+    matrix, values = [], []
+    for (x, y), (u, v) in zip(dst, src):
+        matrix.append([x, y, 1, 0, 0, 0, -u * x, -u * y])
+        values.append(u)
+        matrix.append([0, 0, 0, x, y, 1, -v * x, -v * y])
+        values.append(v)
+    return _solve(matrix, values)
+
+
+def _solve(matrix: List[List[float]], values: List[float]) -> List[float]:
+    """가우스 소거 (부분 피벗)"""
+    n = len(values)
+    rows = [row[:] + [value] for row, value in zip(matrix, values)]
+    for col in range(n):
+        pivot = max(range(col, n), key=lambda r: abs(rows[r][col]))
+        if abs(rows[pivot][col]) < 1e-12:
+            raise ValueError("변환 계수를 구할 수 없습니다 (사각형이 한 직선 위에 있음)")
+        rows[col], rows[pivot] = rows[pivot], rows[col]
+        for r in range(n):
+            if r != col:
+                factor = rows[r][col] / rows[col][col]
+                if factor:
+                    rows[r] = [a - factor * b for a, b in zip(rows[r], rows[col])]
+    return [rows[i][n] / rows[i][i] for i in range(n)]
+
+
+def quad_warp(quad: Sequence[Point], origin: Tuple[int, int], overscan: float = 2.0):
+    """사진을 quad에 붙이는 변환 - origin은 결과 이미지 좌상단의 프레임 좌표
+
+    Returns: (사진 맞춤 크기, 원근 변환 계수)
+    """
+    fit_size = quad_fit_size(quad)
+    w, h = fit_size
+    # 사진을 구멍보다 overscan만큼 크게 펼쳐 안티앨리어싱 가장자리까지 덮음
+    dst = [(x - origin[0], y - origin[1]) for x, y in expand_quad(quad, overscan)]
+    return fit_size, perspective_coefficients(dst, [(0, 0), (w, 0), (w, h), (0, h)])
+
+
+def warp_photo(fitted: Image.Image, coefficients: Sequence[float], size: Tuple[int, int]) -> Image.Image:
+    """맞춘 사진을 size 크기 결과 좌표로 변형 (원근/회전)"""
+    return fitted.transform(size, Image.PERSPECTIVE, tuple(coefficients), Image.BICUBIC)
@@ -0,0 +1,89 @@
+"""
+렌더 결과 캐시 모듈
+렌더 입력 다이제스트(core.digest.render_digest)를 키로 결과 파일을 보관합니다 (내용 주소 방식).
+같은 입력으로 다시 가공하면 인코더를 거치지 않고 보관된 결과를 그대로 복사합니다.
+설정을 바꿨다가 되돌린 경우처럼 이전 결과가 덮어써진 뒤에도 재사용할 수 있습니다.
+"""
+
+import os
+import shutil
+import tempfile
+
+# 캐시 위치 (작업 폴더 기준)
+RENDER_CACHE_DIR = os.path.join('cache', 'renders')
+
+DEFAULT_MAX_MB = 1024
+
+
+class RenderCache:
+    """다이제스트 -> 결과 파일 캐시 (용량 초과 시 오래 사용하지 않은 항목부터 삭제)"""
+
+    def __init__(self, cache_dir=RENDER_CACHE_DIR, max_bytes=DEFAULT_MAX_MB * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    def entry_path(self, digest, ext):
+        return os.path.join(self.cache_dir, digest + ext.lower())
+
+    def restore(self, digest, output_path):
+        """캐시된 결과가 있으면 output_path로 복사 후 True
+
+        하드 링크 대신 복사하므로, 이후 결과 파일을 덮어써도 캐시 항목은 바뀌지 않습니다.
+        """
+        entry = self.entry_path(digest, os.path.splitext(output_path)[1])
+        if not os.path.exists(entry):
+            return False
+        try:
+            _copy_atomic(entry, output_path)
+            os.utime(entry)  # 최근 사용 표시 (정리 순서)
+            print(f"[DEBUG] 렌더 캐시 적중: {digest}")
+            return True
+        except OSError as e:
+            print(f"[WARNING] 렌더 캐시 복원 실패: {entry} ({e})")
+            return False
+
+    def store(self, digest, output_path):
+        """렌더 결과를 캐시에 보관"""
+        entry = self.entry_path(digest, os.path.splitext(output_path)[1])
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            if not os.path.exists(entry):
+                _copy_atomic(output_path, entry)
+            self.prune()
+        except OSError as e:
+            print(f"[WARNING] 렌더 캐시 저장 실패: {entry} ({e})")
+
+    def prune(self):
+        """용량 한도를 넘으면 가장 오래 사용하지 않은 항목부터 삭제"""
+        if not os.path.isdir(self.cache_dir):
+            return
+        entries = []
+        total = 0
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.is_file() and not entry.name.endswith('.tmp'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                    total += stat.st_size
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+
+def _copy_atomic(src, dst):
+    """임시 파일로 복사한 뒤 교체 (중단되어도 반쯤 복사된 파일이 남지 않음)"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(dst)), suffix='.tmp')
+    os.close(fd)
+    try:
+        shutil.copyfile(src, tmp_path)
+        os.replace(tmp_path, dst)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
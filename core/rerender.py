@@ -0,0 +1,124 @@
+"""
+세션 재렌더링 모듈
+루트 폴더 아래의 세션 폴더(FolderManager가 만든 폴더)를 찾아, 세션 기록(SessionManifest)
+또는 copy{N}_ 입력 사진으로 슬롯 순서를 복원하고 지정한 프레임으로 다시 합성하는 작업을 만듭니다.
+
+결과별 입력 다이제스트를 cache/renders/outputs에 기록(core.digest)하므로, 입력이 바뀌지 않은
+세션은 건너뛰어 중단된 실행을 저렴하게 이어서 할 수 있습니다.
+"""
+
+import os
+import re
+from dataclasses import dataclass
+from typing import List, Optional
+
+from .digest import read_output_digest, render_digest
+from .frame_catalog import frame_pixel_regions
+from .jobs import NO_FRAME, RenderJob
+from .session import SessionManifest
+
+COPY_PATTERN = re.compile(r'^copy(\d+)_(.+)$')
+OUTPUT_PREFIX = "processed_"
+
+
+@dataclass
+class Session:
+    """세션 폴더 하나 (슬롯 순서대로의 입력 사진)"""
+    folder: str
+    slots: List[Optional[str]]
+
+    @property
+    def name(self):
+        return os.path.basename(self.folder)
+
+    @property
+    def photo_count(self):
+        return sum(1 for p in self.slots if p)
+
+    def output_name(self):
+        """GUI와 같은 결과 파일명 (processed_ + 첫 슬롯 파일명)"""
+        first = self.slots[0] if self.slots and self.slots[0] else next((p for p in self.slots if p), "image.jpg")
+        return OUTPUT_PREFIX + os.path.basename(first)
+
+
+def read_session(folder):
+    """세션 슬롯 복원 (입력 사진이 없으면 None)
+
+    세션 기록(.session.json)이 있으면 기록된 입력 사본을 사용하고, 없는 이전 폴더는
+    copy{N}_ 파일명으로 복원합니다 (같은 슬롯에 여러 개면 가장 최근에 수정된 파일).
+    """
+    manifest = SessionManifest.load(folder)
+    if manifest is not None:
+        slots = manifest.input_slots()
+        return Session(folder, slots) if any(slots) else None
+
+    found = {}
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            match = COPY_PATTERN.match(entry.name)
+            if not match or not entry.is_file():
+                continue
+            slot = int(match.group(1)) - 1
+            if slot < 0:
+                continue
+            mtime = entry.stat().st_mtime_ns
+            if slot not in found or mtime > found[slot][0]:
+                found[slot] = (mtime, entry.path)
+
+    if not found:
+        return None
+    slots = [None] * (max(found) + 1)
+    for slot, (_, path) in found.items():
+        slots[slot] = path
+    return Session(folder, slots)
+
+
+def scan_sessions(root):
+    """루트 바로 아래의 세션 폴더 목록 (이름순)"""
+    sessions = []
+    with os.scandir(root) as entries:
+        folders = sorted((e.path for e in entries if e.is_dir() and not e.name.startswith('.')))
+    for folder in folders:
+        session = read_session(folder)
+        if session is not None:
+            sessions.append(session)
+    return sessions
+
+
+def plan_rerender(sessions, frame_data, frame_dir, expand_pixels=0, profile="default",
+                  output_root=None, force=False, slot_count=None):
+    """재렌더링 작업 계획
+
+    Parameters:
+    - frame_data: frames.json의 프레임 데이터 (None이면 프레임 없이 저장)
+    - output_root: 결과를 둘 루트 (None이면 각 세션 폴더에 덮어씀)
+    - force: 다이제스트가 같아도 다시 렌더링
+    - slot_count: 이 사진 수의 세션만 대상 (None이면 제한 없음)
+
+    Returns: (작업 목록, 건너뛴 세션 목록)
+             작업의 tags에는 "session", "folder", "digest"가 담김 (완료 후 cache/renders/outputs 다이제스트 기록/세션 기록용)
+    """
+    if frame_data is None:
+        frame_name, frame_path, regions = NO_FRAME, None, []
+    else:
+        frame_name = frame_data['filename']
+        frame_path = os.path.join(frame_dir, frame_name)
+        regions = frame_pixel_regions(frame_data, frame_path)
+
+    jobs, skipped = [], []
+    for session in sessions:
+        if slot_count is not None and session.photo_count != slot_count:
+            continue
+
+        output_dir = session.folder if output_root is None else os.path.join(output_root, session.name)
+        output = os.path.join(output_dir, session.output_name())
+
+        digest = render_digest(session.slots, frame_path, regions, expand_pixels, profile)
+        if not force and read_output_digest(output) == digest:
+            skipped.append(session)
+            continue
+
+        jobs.append(RenderJob(frame=frame_name, photos=list(session.slots), output=output,
+                              expand_pixels=expand_pixels, profile=profile,
+                              tags={"session": session.name, "folder": session.folder, "digest": digest}))
+    return jobs, skipped
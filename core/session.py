@@ -0,0 +1,379 @@
+"""
+세션 폴더 모듈
+폴더 번호로 작업(세션) 폴더 이름을 정하고, 중복을 확인하고, 생성합니다 (FolderAllocator).
+세션 폴더에 앱이 만든 파일은 SessionManifest(.session.json)에 기록합니다.
+"""
+
+import os
+import re
+import json
+import datetime
+import tempfile
+import threading
+
+from .digest import file_digest, legacy_sidecar_path
+
+
+class FolderAllocator:
+    """세션 폴더 이름 할당기
+
+    루트 폴더를 os.scandir로 한 번 훑어 이름 색인(기본 이름별 최대 접미사)을 만들고,
+    루트 폴더의 수정 시각이 바뀌었을 때만 다시 훑습니다. 다음 이름은 색인에서 O(1)로 계산하고,
+    후보는 stat으로 한 번 더 확인한 뒤 원자적 mkdir로 확보합니다 (이미 있으면 다음 번호로 재시도).
+    여러 부스가 같은 루트를 공유해도 같은 폴더를 나눠 쓰지 않습니다.
+    """
+
+    SUFFIX_PATTERN = re.compile(r'^(.+)_(\d+)$')
+    MAX_ATTEMPTS = 100
+
+    def __init__(self, root):
+        self.root = root
+        self._names = set()
+        self._max_suffix = {}
+        self._root_mtime = None
+        self._lock = threading.Lock()
+
+    def _note(self, name):
+        """색인에 폴더 이름 추가 (lock 보유 상태에서 호출)"""
+        self._names.add(name)
+        match = self.SUFFIX_PATTERN.match(name)
+        if match:
+            base, suffix = match.group(1), int(match.group(2))
+            if suffix > self._max_suffix.get(base, 0):
+                self._max_suffix[base] = suffix
+
+    def _refresh(self, force=False):
+        """루트 폴더가 바뀌었으면 색인 재구성 (lock 보유 상태에서 호출)"""
+        try:
+            mtime = os.stat(self.root).st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        if not force and mtime == self._root_mtime:
+            return
+
+        self._names = set()
+        self._max_suffix = {}
+        if mtime is not None:
+            with os.scandir(self.root) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        self._note(entry.name)
+        self._root_mtime = mtime
+
+    def refresh(self, force=False):
+        with self._lock:
+            self._refresh(force)
+
+    def exists(self, name):
+        """폴더 존재 여부 (색인 조회 후 stat으로 확인)"""
+        path = os.path.join(self.root, name)
+        with self._lock:
+            self._refresh()
+            if name in self._names:
+                if os.path.isdir(path):
+                    return True
+                self._names.discard(name)  # 다른 곳에서 삭제됨
+                return False
+            if os.path.isdir(path):
+                # 루트 수정 시각 해상도가 낮은 파일 시스템 (네트워크 드라이브 등)
+                self._note(name)
+                return True
+            return False
+
+    def _candidate(self, base):
+        """다음 사용 가능한 이름 (lock 보유 상태에서 호출)"""
+        if base not in self._names and not os.path.exists(os.path.join(self.root, base)):
+            return base
+        self._note(base)
+        while True:
+            candidate = f"{base}_{self._max_suffix.get(base, 0) + 1}"
+            if not os.path.exists(os.path.join(self.root, candidate)):
+                return candidate
+            self._note(candidate)
+
+    def next_name(self, base):
+        """기본 이름이 비어 있으면 그대로, 있으면 '{base}_{최대 접미사 + 1}'"""
+        with self._lock:
+            self._refresh()
+            return self._candidate(base)
+
+    def claim(self, base, preferred=None):
+        """폴더를 원자적으로 생성하여 확보
+
+        Parameters:
+        - base: 기본 이름 (폴더 번호)
+        - preferred: 먼저 시도할 이름 (사용자에게 안내한 이름, 이미 있으면 다음 번호로)
+
+        Returns: (폴더 이름, 폴더 경로)
+        """
+        with self._lock:
+            self._refresh()
+            os.makedirs(self.root, exist_ok=True)
+            name = preferred or self._candidate(base)
+            for _ in range(self.MAX_ATTEMPTS):
+                path = os.path.join(self.root, name)
+                try:
+                    os.mkdir(path)
+                    self._note(name)
+                    return name, path
+                except FileExistsError:
+                    # 다른 부스가 먼저 생성함 - 색인 갱신 후 다음 번호로 재시도
+                    self._note(name)
+                    self._refresh(force=True)
+                    name = self._candidate(base)
+        raise OSError(f"세션 폴더를 확보할 수 없습니다: {base}")
+
+
+class FolderManager:
+    """폴더 관리 클래스: 이름 생성, 중복 확인, 생성"""
+    
+    def __init__(self, base_path=None):
+        self.base_path = base_path or os.getcwd()
+        self.created_folder = None
+        self.previous_folder_number = None
+        self.allocator = FolderAllocator(self.base_path)
+
+    def get_actual_folder_name(self, folder_number_text):
+        """실제 생성될 폴더 이름을 반환"""
+        return self.allocator.next_name(folder_number_text)
+
+    def create_folder(self, folder_name):
+        """폴더 생성 (이미 있으면 그 폴더 사용)"""
+        folder_path = os.path.join(self.base_path, folder_name)
+        try:
+            os.makedirs(folder_path)
+            status = "created"
+        except FileExistsError:
+            status = "existing"
+        self.allocator.refresh()
+        self.created_folder = folder_path
+        return True, folder_path, status
+
+    def claim_folder(self, folder_name):
+        """새 세션 폴더를 원자적으로 확보
+
+        folder_name(예: '100_1')을 먼저 시도하고, 그 사이 다른 부스가 만들었으면
+        같은 폴더 번호의 다음 이름으로 생성합니다.
+
+        Returns: (성공 여부, 폴더 경로, 상태)
+                 상태는 요청한 이름으로 만들었으면 "created", 다음 이름으로 만들었으면 "renamed"
+        """
+        match = FolderAllocator.SUFFIX_PATTERN.match(folder_name)
+        base = match.group(1) if match else folder_name
+        name, folder_path = self.allocator.claim(base, preferred=folder_name)
+        self.created_folder = folder_path
+        return True, folder_path, "created" if name == folder_name else "renamed"
+
+    def check_availability(self, folder_number_text):
+        """폴더 이름 가용성 확인"""
+        if not folder_number_text:
+            return None
+
+        if not folder_number_text.isdigit():
+            return {"status": "invalid", "message": "유효한 번호를 입력해주세요."}
+
+        folder_name = str(folder_number_text)
+        folder_path = os.path.join(self.base_path, folder_name)
+
+        if self.allocator.exists(folder_name):
+            folder_creation_time = os.path.getctime(folder_path)
+            time_str = datetime.datetime.fromtimestamp(folder_creation_time).strftime('%Y-%m-%d %H:%M:%S')
+            
+            # 다음 가능한 이름 찾기
+            actual_name = self.get_actual_folder_name(folder_name)
+            
+            return {
+                "status": "exists",
+                "message": "이미 있는 이름입니다.",
+                "creation_time": time_str,
+                "next_name": actual_name
+            }
+        else:
+            return {
+                "status": "available",
+                "message": "새로운 이름입니다.",
+                "next_name": folder_name
+            }
+
+
+class SessionManifest:
+    """세션 폴더에 앱이 만든 파일 기록 (.session.json)
+
+    입력 사본(copy{N}_), 가공 결과(processed_), 이전 버전의 다이제스트 사이드카, 인쇄 래스터를 슬롯/역할/해시와 함께
+    기록합니다. 초기화와 재가공은 폴더를 훑지 않고 이 기록에 있는 파일만 다루므로
+    운영자가 넣어 둔 다른 파일은 건드리지 않습니다. 중단된 세션 복구에도 사용합니다.
+    """
+
+    FILENAME = ".session.json"
+    VERSION = 1
+
+    ROLE_INPUT = "input"
+    ROLE_OUTPUT = "output"
+    ROLE_SIDECAR = "sidecar"  # 이전 버전의 다이제스트 사이드카 (현재는 cache/renders/outputs에 기록)
+    ROLE_PRINT = "print"  # 인쇄 래스터 캐시 (.print/ 아래, core.print_render)
+
+    STATE_ACTIVE = "active"
+    STATE_CLOSED = "closed"
+
+    def __init__(self, folder, data=None):
+        self.folder = folder
+        self.data = data or {
+            "version": self.VERSION,
+            "state": self.STATE_ACTIVE,
+            "mode": None,
+            "frame": None,
+            "updated": None,
+            "files": [],
+        }
+
+    @classmethod
+    def path_for(cls, folder):
+        return os.path.join(folder, cls.FILENAME)
+
+    @classmethod
+    def load(cls, folder):
+        """기록 로드 (없거나 읽을 수 없으면 None)"""
+        try:
+            with open(cls.path_for(folder), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or not isinstance(data.get("files"), list):
+            return None
+        return cls(folder, data)
+
+    @classmethod
+    def open(cls, folder):
+        """기록 로드, 없으면 새로 생성 (기존 폴더를 다시 사용하면 세션을 다시 활성화)"""
+        manifest = cls.load(folder) or cls(folder)
+        manifest.data["state"] = cls.STATE_ACTIVE
+        manifest.save()
+        return manifest
+
+    def save(self):
+        """원자적 저장 (임시 파일에 쓴 뒤 교체)"""
+        self.data["updated"] = datetime.datetime.now().isoformat(timespec='seconds')
+        target = self.path_for(self.folder)
+        fd, tmp_path = tempfile.mkstemp(dir=self.folder, prefix=self.FILENAME, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self.data, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, target)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    # --- 조회 ---
+
+    @property
+    def state(self):
+        return self.data.get("state")
+
+    @property
+    def mode(self):
+        return self.data.get("mode")
+
+    @property
+    def frame(self):
+        return self.data.get("frame")
+
+    def entries(self, role=None):
+        return [e for e in self.data["files"] if role is None or e.get("role") == role]
+
+    def path(self, entry):
+        return os.path.join(self.folder, entry["name"])
+
+    def input_slots(self, slot_count=None):
+        """슬롯 순서대로의 입력 사본 경로 (빈 슬롯은 None, 파일이 없어진 항목 제외)"""
+        inputs = [e for e in self.entries(self.ROLE_INPUT) if os.path.exists(self.path(e))]
+        if slot_count is None:
+            slot_count = max((e["slot"] for e in inputs), default=-1) + 1
+        slots = [None] * slot_count
+        for entry in inputs:
+            if 0 <= entry["slot"] < slot_count:
+                slots[entry["slot"]] = self.path(entry)
+        return slots
+
+    def output(self):
+        """가공 결과 경로 (없으면 None)"""
+        entries = self.entries(self.ROLE_OUTPUT)
+        return self.path(entries[-1]) if entries else None
+
+    # --- 기록 ---
+
+    def _remove_entry(self, name):
+        self.data["files"] = [e for e in self.data["files"] if e["name"] != name]
+
+    def record_input(self, slot, path, source=None, mode=None, digest=None):
+        """입력 사본 기록 (같은 슬롯의 이전 기록은 대체, digest를 주면 다시 해시하지 않음)"""
+        name = os.path.basename(path)
+        self.data["files"] = [e for e in self.data["files"]
+                              if e["name"] != name and not (e.get("role") == self.ROLE_INPUT and e.get("slot") == slot)]
+        self.data["files"].append({
+            "name": name,
+            "role": self.ROLE_INPUT,
+            "slot": slot,
+            "hash": digest or file_digest(path),
+            "source": source,
+        })
+        if mode is not None:
+            self.data["mode"] = mode
+        self.save()
+
+    def record_output(self, path, frame=None):
+        """가공 결과 기록 (이전 버전이 옆에 남긴 다이제스트 사이드카는 정리)"""
+        name = os.path.basename(path)
+        self._remove_entry(name)
+        self.data["files"].append({"name": name, "role": self.ROLE_OUTPUT, "slot": None,
+                                   "hash": file_digest(path), "source": None})
+        sidecar = legacy_sidecar_path(path)
+        self._remove_entry(os.path.basename(sidecar))
+        try:
+            os.remove(sidecar)
+        except FileNotFoundError:
+            pass
+        if frame is not None:
+            self.data["frame"] = frame
+        self.save()
+
+    def record_print(self, path, source):
+        """인쇄 래스터 캐시 기록 (세션 폴더 기준 상대 경로, source는 원본 결과 파일명)"""
+        name = os.path.relpath(path, self.folder)
+        self._remove_entry(name)
+        self.data["files"].append({"name": name, "role": self.ROLE_PRINT, "slot": None,
+                                   "hash": None, "source": os.path.basename(source)})
+        self.save()
+
+    def forget(self, path):
+        """파일 기록 제거 (파일은 호출자가 삭제)"""
+        self._remove_entry(os.path.basename(path))
+        self.save()
+
+    def delete_files(self, roles=None, keep=()):
+        """기록된 파일 삭제 후 기록에서 제거
+
+        Parameters:
+        - roles: 삭제할 역할 목록 (None이면 전체)
+        - keep: 남겨 둘 파일명
+        """
+        remaining = []
+        for entry in self.data["files"]:
+            if (roles is not None and entry.get("role") not in roles) or entry["name"] in keep:
+                remaining.append(entry)
+                continue
+            file_path = self.path(entry)
+            try:
+                if os.path.exists(file_path):
+                    os.remove(file_path)
+                    print(f"파일 삭제됨: {file_path}")
+            except OSError as e:
+                print(f"파일 삭제 오류: {e}")
+                remaining.append(entry)
+        self.data["files"] = remaining
+        self.save()
+
+    def close(self):
+        """세션 종료 표시 (다음 실행 시 복구 대상 아님)"""
+        self.data["state"] = self.STATE_CLOSED
+        self.save()
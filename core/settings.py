@@ -0,0 +1,85 @@
+"""
+설정 모듈
+settings.json 사용자 설정을 읽고 저장합니다.
+최근 프레임, 진행 중인 세션처럼 실행 중에 바뀌는 상태는 추적되지 않는 cache/state.json에 따로 저장해
+버전 관리되는 settings.json을 다시 쓰지 않습니다.
+"""
+
+import json
+import os
+
+# settings.json이 아닌 상태 파일(cache/state.json)에 저장하는 실행 상태 키
+RUNTIME_KEYS = ("recent_frames", "active_session")
+
+class SettingsManager:
+    def __init__(self, filepath="settings.json", state_path=None):
+        self.filepath = filepath
+        # 설정 파일 옆 cache/ 폴더 (기본: 작업 폴더의 cache/state.json)
+        self.state_path = state_path or os.path.join(os.path.dirname(filepath), 'cache', 'state.json')
+        self.settings = {
+            "preview_aspect_ratio": "3:2",
+            "direct_print": True,
+            "print_layout": "1up",
+            "print_collect": False,
+            "print_backend": "native",
+            "print_output_dir": "prints",
+            "print_file_dpi": 300,
+            "expand_pixels": 0,
+            "frame_cache_budget_mb": 256,
+            "ingest_mode": "original"
+        }
+        self.state = {
+            "recent_frames": [],
+            "active_session": None
+        }
+        self.load_settings()
+        self.load_state()
+
+    def load_settings(self):
+        if os.path.exists(self.filepath):
+            try:
+                with open(self.filepath, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                    # 이전 버전이 settings.json에 남긴 실행 상태는 상태 값으로 옮김 (상태 파일이 있으면 그 값 우선)
+                    for key in RUNTIME_KEYS:
+                        if key in data:
+                            self.state[key] = data.pop(key)
+                    self.settings.update(data)
+            except Exception as e:
+                print(f"Error loading settings: {e}")
+
+    def save_settings(self):
+        try:
+            with open(self.filepath, 'w', encoding='utf-8') as f:
+                json.dump(self.settings, f, indent=4, ensure_ascii=False)
+        except Exception as e:
+            print(f"Error saving settings: {e}")
+
+    def load_state(self):
+        if os.path.exists(self.state_path):
+            try:
+                with open(self.state_path, 'r', encoding='utf-8') as f:
+                    self.state.update(json.load(f))
+            except Exception as e:
+                print(f"Error loading state: {e}")
+
+    def save_state(self):
+        try:
+            os.makedirs(os.path.dirname(self.state_path) or '.', exist_ok=True)
+            with open(self.state_path, 'w', encoding='utf-8') as f:
+                json.dump(self.state, f, indent=4, ensure_ascii=False)
+        except Exception as e:
+            print(f"Error saving state: {e}")
+
+    def get(self, key, default=None):
+        if key in RUNTIME_KEYS:
+            return self.state.get(key, default)
+        return self.settings.get(key, default)
+
+    def set(self, key, value):
+        if key in RUNTIME_KEYS:
+            self.state[key] = value
+            self.save_state()
+            return
+        self.settings[key] = value
+        self.save_settings()
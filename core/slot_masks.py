@@ -0,0 +1,109 @@
+"""
+슬롯 마스크 모듈
+프레임 알파 채널에서 합성 영역별 사진 마스크(프레임이 투명한 만큼 사진이 보임)를 만듭니다.
+원형, 하트, 둥근 모서리처럼 사각형이 아닌 구멍도 가장자리 안티앨리어싱 그대로 합성되고,
+영역 사각형이 겹쳐도 각 사진은 자기 구멍으로만 보입니다. Qt에 의존하지 않습니다.
+
+구멍은 알파 임계값 미만 픽셀의 행별 연속 구간(run)을 위아래로 이어 붙여(union-find, core.region_detect) 찾습니다.
+마스크는 영역 안의 프레임 투명도 그대로이며(작은 장식 구멍, 반투명 틴트 포함), 다른 슬롯 영역에 속한
+구멍(영역 사각형이 겹쳐 걸친 이웃 구멍)만 제외합니다. 기울어진 사각형 구멍은 가장 큰 구멍 기준으로
+사진을 그 모양으로 펼치는 변환도 함께 구합니다. 결과는 프레임 캐시에 보관됩니다 (FrameCache.slot_mask).
+"""
+
+from typing import Optional, Sequence, Tuple
+
+from PIL import Image, ImageChops, ImageFilter
+
+from .region_detect import describe_opening, group_runs, label_runs, opening_runs, quad_warp
+
+# 이 알파 값 미만이면 구멍(투명)으로 판정
+OPENING_ALPHA_THRESHOLD = 128
+
+Box = Tuple[int, int, int, int]
+
+
+def _owned_by_other(group, offset, box: Box, others: Sequence[Box]) -> bool:
+    """구멍(영역 안에 보이는 부분)이 다른 슬롯 영역 소유이면 True
+
+    구멍 중심이 다른 영역 안에 있고, 그 영역의 가운데에 이 영역보다 가까우면 다른 슬롯의 구멍으로 봅니다.
+    """
+    x0 = min(r[1] for r in group) + offset[0]
+    x1 = max(r[2] for r in group) + offset[0]
+    y0 = group[0][0] + offset[1]
+    y1 = group[-1][0] + 1 + offset[1]
+    cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+
+    def inside(b):
+        return b[0] <= cx < b[2] and b[1] <= cy < b[3]
+
+    def distance(b):  # 영역 크기 기준 가운데로부터의 거리
+        return abs(cx - (b[0] + b[2]) / 2) / max(1, b[2] - b[0]) + abs(cy - (b[1] + b[3]) / 2) / max(1, b[3] - b[1])
+
+    owners = [b for b in others if inside(b)]
+    return bool(owners) and min(distance(b) for b in owners) < distance(box)
+
+
+def build_slot_mask(alpha: Image.Image, box: Box, others: Sequence[Box] = ()):
+    """영역(box, 프레임 좌표)의 사진 마스크와 변형
+
+    마스크는 영역 안의 프레임 투명도(255 - 알파)이며, others(같은 프레임의 다른 슬롯 영역)에 속한 구멍만
+    안티앨리어싱 가장자리까지 제외합니다. 가장 큰 구멍이 기울어진 사각형이나 원근이 있는 사각형이면
+    (core.region_detect) 사진을 그 모양으로 펼칠 원근 변환을 함께 계산합니다. 축 정렬 사각형과 원형/하트 등은
+    변형 없이 영역에 맞춰 마스크로만 합성합니다.
+
+    Returns: (마스크 범위 - 프레임 좌표, 그 범위의 L 마스크, 변형)
+             변형은 None 또는 (사진 맞춤 크기, 마스크 범위 기준 원근 변환 계수)
+             범위 전체가 불투명하면 (None, None, None), 완전히 투명하면 마스크 없이 (box, None, None),
+             구멍은 없지만 반투명하면 (box, 투명도 마스크, None)
+    """
+    left, top, right, bottom = box
+    box = (max(0, left), max(0, top), min(alpha.size[0], right), min(alpha.size[1], bottom))
+    if box[2] <= box[0] or box[3] <= box[1]:
+        return None, None, None
+
+    coverage = ImageChops.invert(alpha.crop(box))  # 사진이 보이는 정도 (255 - 알파)
+    if coverage.getextrema() == (255, 255):
+        return box, None, None
+
+    binary = coverage.point(lambda v: 255 if v > 255 - OPENING_ALPHA_THRESHOLD else 0)
+    runs = opening_runs(binary)
+    if not runs:
+        # 임계값 미만 구멍이 없어도 반투명 창(틴트 등)이면 투명도만큼 사진이 보이도록 변형 없이 마스크만 사용
+        if coverage.getbbox() is None:
+            return None, None, None
+        return box, coverage, None
+    groups = group_runs(runs, label_runs(runs))
+
+    if len(groups) > 1 and others:
+        # 다른 슬롯의 구멍만 제외 (영역 사각형이 겹쳐 걸친 경우), 안티앨리어싱 가장자리 포함하도록 1px 확장
+        owned = [_owned_by_other(group, box[:2], box, others) for group in groups]
+        if any(owned) and not all(owned):
+            width = binary.size[0]
+            drop = bytearray(width * binary.size[1])
+            for group, foreign in zip(groups, owned):
+                if foreign:
+                    for y, x0, x1 in group:
+                        drop[y * width + x0:y * width + x1] = b'\xff' * (x1 - x0)
+            drop = Image.frombytes('L', binary.size, bytes(drop)).filter(ImageFilter.MaxFilter(3))
+            coverage = ImageChops.subtract(coverage, drop)
+            groups = [group for group, foreign in zip(groups, owned) if not foreign]
+
+    bbox = coverage.getbbox()
+    if bbox is None:
+        return None, None, None
+    mask_box = (box[0] + bbox[0], box[1] + bbox[1], box[0] + bbox[2], box[1] + bbox[3])
+
+    largest = max(groups, key=lambda group: sum(x1 - x0 for _, x0, x1 in group))
+    opening = describe_opening(largest, offset=box[:2])
+    warp = quad_warp(opening.quad, mask_box[:2]) if opening.warped else None
+    return mask_box, coverage.crop(bbox), warp
+
+
+def paste_through_mask(base: Image.Image, fitted: Image.Image, position: Tuple[int, int],
+                       mask_box: Optional[Box], mask: Optional[Image.Image]):
+    """영역에 맞춘 사진(position에 놓임)을 마스크 범위 안에서만 base 위에 합성"""
+    if mask_box is None:
+        return
+    x, y = position
+    crop = fitted.crop((mask_box[0] - x, mask_box[1] - y, mask_box[2] - x, mask_box[3] - y))
+    base.paste(crop, mask_box[:2], mask)
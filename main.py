@@ -4,23 +4,26 @@
 
 import sys
 from PyQt5.QtWidgets import QApplication
-from ui.main_window import MultiWindow
-from ui.styles import Styles
 
 
 def main():
     """메인 실행 함수"""
     app = QApplication(sys.argv)
-    
-    # 리소스 초기화
-    Styles.init_resources()
+
+    # 메인 윈도우 모듈은 QApplication 생성 이후 import (PIL/인쇄 모듈은 지연 로드됨)
+    from ui.main_window import MultiWindow
+    from ui.styles import Styles
+
+    # 상태별 스타일을 앱 전역에 한 번만 적용 (위젯은 속성만 전환)
+    Styles.apply_app_styles(app)
     
     # 메인 윈도우 실행 (기존 MultiWindow 사용)
     window = MultiWindow()
+    # 첫 화면이 그려진 뒤(MultiWindow.paintEvent) 리소스 초기화, 프레임 목록 로드, 모듈 사전 로드 수행
     window.show()
-    
+
     sys.exit(app.exec_())
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
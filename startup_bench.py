@@ -0,0 +1,122 @@
+"""
+시작 속도 벤치마크
+`python -X importtime`으로 메인 윈도우 모듈의 import 비용을 측정하고,
+예산(budget)을 넘거나 지연 로드 대상 모듈이 시작 시점에 import 되면 실패합니다.
+
+사용법:
+    python startup_bench.py                 # 기본 예산으로 측정
+    python startup_bench.py --budget-ms 300 --runs 5
+
+단위 테스트는 지연 로드 대상 모듈만 검사합니다. 시간 예산 검사는 기기 부하에 따라 흔들리므로
+BITTARA_STARTUP_BUDGET=1 로 실행할 때만 테스트에 포함됩니다.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 시작 경로에서 import 되는 모듈
+STARTUP_MODULE = "ui.main_window"
+
+# 첫 화면 표시 이전에 로드되면 안 되는 모듈 (warm_up 또는 첫 사용 시 로드)
+DEFERRED_MODULES = ("PIL", "PyQt5.QtPrintSupport", "ui.settings_dialog", "processing",
+                    "core.compositing", "core.frame_cache")
+
+DEFAULT_BUDGET_MS = 400
+DEFAULT_RUNS = 3
+
+
+def parse_importtime(stderr_text):
+    """-X importtime 출력 파싱
+
+    Returns:
+        [(module_name, self_us, cumulative_us, depth), ...]
+    """
+    entries = []
+    for line in stderr_text.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us = int(parts[0].strip())
+            cumulative_us = int(parts[1].strip())
+        except ValueError:
+            continue  # 헤더 행
+        raw_name = parts[2].rstrip()
+        name = raw_name.lstrip()
+        depth = (len(raw_name) - len(name) - 1) // 2
+        entries.append((name, self_us, cumulative_us, depth))
+    return entries
+
+
+def measure_import_time(module=STARTUP_MODULE, runs=DEFAULT_RUNS):
+    """모듈 import 시간을 여러 번 측정하여 가장 빠른 결과 반환
+
+    Returns:
+        {"total_ms": float, "entries": [...], "modules": set([...])}
+    """
+    best = None
+    for _ in range(max(1, runs)):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=ROOT_DIR, capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"'{module}' import 실패:\n{result.stderr}")
+
+        entries = parse_importtime(result.stderr)
+        total_us = sum(cumulative for _, _, cumulative, depth in entries if depth == 0)
+        if best is None or total_us < best["total_us"]:
+            best = {
+                "total_us": total_us,
+                "entries": entries,
+                "modules": {name for name, _, _, _ in entries},
+            }
+
+    best["total_ms"] = best.pop("total_us") / 1000.0
+    return best
+
+
+def find_deferred_imports(modules, deferred=DEFERRED_MODULES):
+    """시작 시점에 import 된 지연 로드 대상 모듈 목록"""
+    found = []
+    for name in deferred:
+        if any(m == name or m.startswith(name + ".") for m in modules):
+            found.append(name)
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bittara Photo 시작 import 시간 벤치마크")
+    parser.add_argument("--module", default=STARTUP_MODULE, help="측정할 모듈")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="허용 import 시간 (ms)")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help="측정 횟수 (최솟값 사용)")
+    parser.add_argument("--top", type=int, default=10, help="출력할 상위 모듈 수")
+    args = parser.parse_args(argv)
+
+    result = measure_import_time(args.module, args.runs)
+
+    print(f"[startup] {args.module} import: {result['total_ms']:.1f} ms (예산 {args.budget_ms:.0f} ms)")
+    heaviest = sorted(result["entries"], key=lambda e: e[1], reverse=True)[:args.top]
+    for name, self_us, cumulative_us, _ in heaviest:
+        print(f"  {self_us / 1000.0:8.1f} ms self  {cumulative_us / 1000.0:8.1f} ms cumulative  {name}")
+
+    failed = False
+    deferred = find_deferred_imports(result["modules"])
+    if deferred:
+        print(f"[startup] 실패: 시작 시점에 지연 로드 대상 모듈이 import 됨: {', '.join(deferred)}")
+        failed = True
+    if result["total_ms"] > args.budget_ms:
+        print(f"[startup] 실패: 예산 초과 ({result['total_ms']:.1f} ms > {args.budget_ms:.0f} ms)")
+        failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
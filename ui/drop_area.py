@@ -62,8 +62,10 @@ class SingleDropArea(QFrame):
         self.labels = [self.zone1]
 
     def reset_zones(self):
-        """모든 드롭 존을 초기 상태로 리셋"""
-        self.zone1.reset_to_default()
+        """이미지가 있는 드롭 존만 초기 상태로 리셋"""
+        for zone in self.labels:
+            if not zone.is_empty():
+                zone.reset_to_default()
 
     def set_image_to_zone(self, zone_index, image_path):
         """특정 존에 이미지 설정"""
@@ -136,9 +138,10 @@ class MultiDropArea(QFrame):
         self.labels = [self.zone1, self.zone2, self.zone3, self.zone4]
 
     def reset_zones(self):
-        """모든 드롭 존을 초기 상태로 리셋"""
-        for zone in [self.zone1, self.zone2, self.zone3, self.zone4]:
-            zone.reset_to_default()
+        """이미지가 있는 드롭 존만 초기 상태로 리셋"""
+        for zone in self.labels:
+            if not zone.is_empty():
+                zone.reset_to_default()
 
     def set_image_to_zone(self, zone_index, image_path):
         """특정 존에 이미지 설정"""
@@ -7,8 +7,7 @@ import os
 from PyQt5.QtWidgets import QLabel, QMessageBox, QFrame, QVBoxLayout, QSizePolicy, QPushButton
 from PyQt5.QtGui import QFont, QPixmap, QPainter, QColor, QImage
 from PyQt5.QtCore import Qt, QRect
-from PIL import Image as PILImage
-from .styles import Styles, Colors, Fonts
+from .styles import Styles, Fonts
 from .toast_message import ToastMessage
 
 class ImageUtils:
@@ -19,6 +18,7 @@ class ImageUtils:
         """PIL 이미지를 QPixmap으로 변환"""
         try:
             import io
+            from PIL import Image as PILImage
             
             if pil_image.mode == 'RGBA':
                 background = PILImage.new('RGB', pil_image.size, (255, 255, 255))
@@ -55,6 +55,7 @@ class DropZone(QFrame):
         self.parent_drop_area = parent_drop_area
         self.setAcceptDrops(True)
         self.image_path = None
+        self.state = None  # "empty" / "hover" / "filled"
 
         # 기본 설정
         self.setMinimumSize(130, 90) # 최소 크기 설정
@@ -69,33 +70,24 @@ class DropZone(QFrame):
         
         # 이미지/번호 표시 라벨
         self.image_label = QLabel()
+        self.image_label.setObjectName("dropZoneImage")
         self.image_label.setAlignment(Qt.AlignCenter)
+        self.image_label.setFont(QFont(Fonts.FAMILY, 36, QFont.Bold))
         self.image_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.layout.addWidget(self.image_label)
         
         self.filename_label = QLabel()
+        self.filename_label.setObjectName("dropZoneFilename")
         self.filename_label.setAlignment(Qt.AlignCenter)
         self.filename_label.setFont(QFont(Fonts.FAMILY, 9))
-        self.filename_label.setStyleSheet(f"color: {Colors.TEXT_SECONDARY};")
         self.filename_label.setWordWrap(True)
         self.filename_label.setFixedHeight(20) # 높이 축소하여 이미지 공간 확보
         self.layout.addWidget(self.filename_label)
 
         # 삭제 버튼 (우측 상단)
         self.delete_btn = QPushButton("✕", self)
+        self.delete_btn.setObjectName("dropZoneDelete")
         self.delete_btn.setFixedSize(24, 24)
-        self.delete_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: rgba(0, 0, 0, 0.5);
-                color: white;
-                border-radius: 12px;
-                font-weight: bold;
-                border: none;
-            }}
-            QPushButton:hover {{
-                background-color: {Colors.DESTRUCTIVE};
-            }}
-        """)
         self.delete_btn.setCursor(Qt.PointingHandCursor)
         self.delete_btn.hide()
         self.delete_btn.clicked.connect(self.delete_image)
@@ -126,14 +118,18 @@ class DropZone(QFrame):
             return
 
         try:
-            # PIL로 이미지 로드 및 리사이즈
-            pil_image = PILImage.open(image_path)
+            # PIL로 이미지 로드 및 리사이즈 (PIL은 시작 속도를 위해 지연 import)
+            from PIL import Image as PILImage
+            from core.decode import decode_photo
             
             # 미리보기 크기 계산 (라벨 크기에 맞춤)
             target_width = self.image_label.width()
             target_height = self.image_label.height()
             if target_width <= 0: target_width = 130
             if target_height <= 0: target_height = 90
+
+            # 합성 결과와 같은 방향/색으로 표시 (미리보기 크기만큼만 축소 디코딩)
+            pil_image = decode_photo(image_path, [(target_width, target_height)])
             
             pil_image.thumbnail((target_width, target_height), PILImage.Resampling.LANCZOS)
             
@@ -147,37 +143,14 @@ class DropZone(QFrame):
             # 이미지 설정 (rounded corners effect)
             self.image_label.setPixmap(pixmap)
             self.image_label.setText("") # 텍스트 제거
-            self.image_label.setStyleSheet("""
-                QLabel {
-                    border-radius: 6px;
-                    background-color: transparent;
-                }
-            """)
             
-            # 파일명 설정 - 더 세련된 스타일 (배경 제거하여 깔끔하게)
+            # 파일명 설정
             filename = os.path.basename(image_path)
             self.filename_label.setText(filename)
-            self.filename_label.setStyleSheet(f"""
-                QLabel {{
-                    color: {Colors.TEXT_PRIMARY};
-                    font-weight: 600;
-                    font-size: 11px;
-                    background-color: transparent;
-                    padding: 2px;
-                }}
-            """)
-
-            # 스타일 업데이트 (성공) - 모던한 디자인
-            self.setStyleSheet(f"""
-                #dropZone {{
-                    border: 2px solid {Colors.SUCCESS};
-                    border-radius: 12px;
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                                stop:0 #F1F8F4, stop:1 #E8F5E9);
-                    padding: 8px;
-                }}
-            """)
-            
+
+            # 스타일 업데이트 (성공) - Styles.DROP_ZONE의 filled 상태
+            self.set_state("filled")
+
             # 삭제 버튼 표시 및 위치 조정
             self.delete_btn.show()
             self.delete_btn.raise_()
@@ -193,38 +166,26 @@ class DropZone(QFrame):
         self.image_path = None
         self.image_label.setPixmap(QPixmap())
         self.image_label.setText(f"{self.zone_id + 1}")
-        self.image_label.setFont(QFont(Fonts.FAMILY, 36, QFont.Bold))
-        self.image_label.setStyleSheet(f"""
-            QLabel {{
-                color: {Colors.TEXT_HINT};
-                border: none;
-                background-color: transparent;
-            }}
-        """)
-        
         self.filename_label.setText("이미지 드롭")
-        self.filename_label.setStyleSheet(f"""
-            QLabel {{
-                color: {Colors.TEXT_HINT};
-                font-size: 11px;
-                background-color: transparent;
-            }}
-        """)
-
-        # 스타일 업데이트 (기본) - 부드러운 디자인
-        self.setStyleSheet(f"""
-            #dropZone {{
-                border: 2px dashed {Colors.BORDER};
-                border-radius: 12px;
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #FAFAFA, stop:1 #F5F5F5);
-            }}
-        """)
+
+        # 스타일 업데이트 (기본) - Styles.DROP_ZONE의 empty 상태
+        self.set_state("empty")
         
         # 삭제 버튼 숨기기
         if hasattr(self, 'delete_btn'):
             self.delete_btn.hide()
 
+    def set_state(self, state):
+        """드롭 존 상태 전환 (속성 변경 + polish, 스타일시트 재파싱 없음)"""
+        self.state = state
+        Styles.set_state(self, state)
+        # 파일명 라벨은 이미지 유무만 반영 (hover 중에도 유지)
+        Styles.set_state(self.filename_label, "filled" if self.image_path else "empty")
+
+    def is_empty(self):
+        """이미지가 없고 기본 스타일 상태인지 여부"""
+        return self.state == "empty" and self.image_path is None
+
     def dragEnterEvent(self, event):
         if hasattr(self.parent_drop_area.parent_window,
                    'processed_file') and self.parent_drop_area.parent_window.processed_file:
@@ -233,15 +194,7 @@ class DropZone(QFrame):
 
         if event.mimeData().hasUrls():
             event.acceptProposedAction()
-            self.setStyleSheet(f"""
-                #dropZone {{
-                    border: 2px solid {Colors.PRIMARY};
-                    border-radius: 12px;
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                                stop:0 #E3F2FD, stop:1 #BBDEFB);
-                    padding: 8px;
-                }}
-            """)
+            self.set_state("hover")
         
         # 삭제 버튼 숨기기
         if hasattr(self, 'delete_btn'):
@@ -269,15 +222,7 @@ class DropZone(QFrame):
     def dragLeaveEvent(self, event):
         if self.image_path:
             # 이미지가 있는 경우 성공 스타일 복구
-            self.setStyleSheet(f"""
-                #dropZone {{
-                    border: 2px solid {Colors.SUCCESS};
-                    border-radius: 12px;
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                                stop:0 #F1F8F4, stop:1 #E8F5E9);
-                    padding: 8px;
-                }}
-            """)
+            self.set_state("filled")
             
             # 삭제 버튼 다시 표시
             if hasattr(self, 'delete_btn'):
@@ -285,14 +230,7 @@ class DropZone(QFrame):
                 self.delete_btn.raise_()
         else:
             # 이미지가 없는 경우 기본 스타일 복구
-            self.setStyleSheet(f"""
-                #dropZone {{
-                    border: 2px dashed {Colors.BORDER};
-                    border-radius: 12px;
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                                stop:0 #FAFAFA, stop:1 #F5F5F5);
-                }}
-            """)
+            self.set_state("empty")
 
     def dropEvent(self, event):
         # 1. 가공 상태 확인
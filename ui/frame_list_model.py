@@ -0,0 +1,291 @@
+"""
+FrameListModel 모듈
+프레임 목록을 위한 Model/View 모델을 제공합니다.
+썸네일은 화면에 보이는 항목에 대해서만 백그라운드 스레드에서 로드합니다.
+"""
+
+import os
+from collections import OrderedDict
+from PyQt5.QtCore import (Qt, QAbstractListModel, QSortFilterProxyModel, QModelIndex,
+                          QObject, QRunnable, QThreadPool, QSize, pyqtSignal)
+from PyQt5.QtGui import QImage, QImageReader, QPixmap, QPainter, QIcon
+
+
+class _ThumbnailSignals(QObject):
+    """QRunnable은 시그널을 가질 수 없으므로 별도 QObject 사용"""
+    loaded = pyqtSignal(str, QImage)
+
+
+class _ThumbnailTask(QRunnable):
+    """프레임 이미지를 축소 디코딩하는 작업 (QImage는 스레드 안전)"""
+
+    def __init__(self, path, size, signals):
+        super().__init__()
+        self.path = path
+        self.size = size
+        self.signals = signals
+
+    def run(self):
+        reader = QImageReader(self.path)
+        source_size = reader.size()
+        if source_size.isValid():
+            source_size.scale(self.size, Qt.KeepAspectRatio)
+            reader.setScaledSize(source_size)
+        image = reader.read()
+        self.signals.loaded.emit(self.path, image)
+
+
+class FrameListModel(QAbstractListModel):
+    """프레임 카탈로그(frames.json) 리스트 모델
+
+    - DisplayRole: 프레임 이름
+    - DecorationRole: 썸네일 (요청 시 비동기 로드)
+    - UserRole: 파일명 (QComboBox.currentData() 호환)
+    """
+
+    FilenameRole = Qt.UserRole
+    TypeRole = Qt.UserRole + 1
+    FrameRole = Qt.UserRole + 2
+
+    NONE_FILENAME = "none"
+
+    # 썸네일 캐시는 모델 인스턴스 간 공유 (설정 창을 다시 열어도 재디코딩하지 않음, LRU)
+    _pixmap_cache = OrderedDict()
+    MAX_CACHED_THUMBNAILS = 512
+
+    def __init__(self, frames=None, frame_dir=None, thumbnail_size=QSize(80, 80),
+                 show_thumbnails=True, include_none=False, parent=None):
+        super().__init__(parent)
+        self._frames = frames if frames is not None else []
+        self.frame_dir = frame_dir or os.path.join(os.getcwd(), 'frame')
+        self.thumbnail_size = thumbnail_size
+        self.show_thumbnails = show_thumbnails
+        self.include_none = include_none
+
+        self._pending = set()
+        self._keys = {}             # 경로 -> 캐시 키 (목록을 바꿀 때만 다시 stat)
+        self._rows_by_path = None   # 경로 -> 행 번호 목록 (목록을 바꿀 때 다시 만듦)
+        self._placeholder = None
+        self._missing = None
+
+        self._signals = _ThumbnailSignals()
+        self._signals.loaded.connect(self._on_thumbnail_loaded)
+
+        # 전역 스레드 풀을 점유하지 않도록 전용 풀 사용
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(2)
+
+    # --- 데이터 관리 ---
+
+    def set_frames(self, frames):
+        """프레임 리스트 교체 (전달된 리스트를 그대로 참조)"""
+        self.beginResetModel()
+        self._frames = frames
+        self._invalidate_index()
+        self.endResetModel()
+
+    def frames(self):
+        return self._frames
+
+    def frame_at(self, row):
+        if 0 <= row < len(self._frames):
+            return self._frames[row]
+        return None
+
+    def update_frame(self, row, frame_data):
+        """특정 행의 프레임 데이터 갱신"""
+        if 0 <= row < len(self._frames):
+            old_path, new_path = self._path_for(self._frames[row]), self._path_for(frame_data)
+            self._frames[row] = frame_data
+            if old_path != new_path:
+                self._rows_by_path = None
+            self._keys.pop(new_path, None)  # 파일이 교체되었을 수 있으므로 이 행의 파일만 다시 stat
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+
+    def append_frame(self, frame_data):
+        row = len(self._frames)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._frames.append(frame_data)
+        self._invalidate_index()
+        self.endInsertRows()
+        return row
+
+    def remove_frame(self, row):
+        if 0 <= row < len(self._frames):
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._frames[row]
+            self._invalidate_index()
+            self.endRemoveRows()
+
+    # --- QAbstractListModel 구현 ---
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._frames) + (1 if self.include_none else 0)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = index.row()
+        if row >= len(self._frames):
+            # "프레임 없음" 항목
+            if role == Qt.DisplayRole:
+                return "프레임 없음"
+            if role in (self.FilenameRole, self.TypeRole):
+                return self.NONE_FILENAME
+            return None
+
+        frame = self._frames[row]
+        if role == Qt.DisplayRole:
+            return frame.get('name', '')
+        if role == self.FilenameRole:
+            return frame.get('filename', '')
+        if role == self.TypeRole:
+            return frame.get('type', '')
+        if role == self.FrameRole:
+            return frame
+        if role == Qt.DecorationRole and self.show_thumbnails:
+            return self._thumbnail_for(frame.get('filename', ''))
+        if role == Qt.SizeHintRole and self.show_thumbnails:
+            return QSize(self.thumbnail_size.width() + 20, self.thumbnail_size.height() + 30)
+        return None
+
+    # --- 썸네일 ---
+
+    def _invalidate_index(self):
+        """목록이 바뀌면 경로별 캐시 키(수정 시각)와 행 색인을 다시 구함"""
+        self._keys.clear()
+        self._rows_by_path = None
+
+    def _path_for(self, frame):
+        filename = frame.get('filename', '')
+        return os.path.join(self.frame_dir, filename) if filename else ""
+
+    def _rows_for(self, path):
+        if self._rows_by_path is None:
+            self._rows_by_path = {}
+            for row, frame in enumerate(self._frames):
+                self._rows_by_path.setdefault(self._path_for(frame), []).append(row)
+        return self._rows_by_path.get(path, [])
+
+    def _cache_key(self, path):
+        """썸네일 캐시 키 (경로, 수정 시각, 크기) - 경로마다 목록을 바꿀 때 한 번만 stat"""
+        if path not in self._keys:
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except OSError:
+                self._keys[path] = None
+            else:
+                self._keys[path] = (path, mtime, self.thumbnail_size.width(), self.thumbnail_size.height())
+        return self._keys[path]
+
+    @classmethod
+    def _cache_get(cls, key):
+        pixmap = cls._pixmap_cache.get(key)
+        if pixmap is not None:
+            cls._pixmap_cache.move_to_end(key)
+        return pixmap
+
+    @classmethod
+    def _cache_put(cls, key, pixmap):
+        cls._pixmap_cache[key] = pixmap
+        cls._pixmap_cache.move_to_end(key)
+        while len(cls._pixmap_cache) > cls.MAX_CACHED_THUMBNAILS:
+            cls._pixmap_cache.popitem(last=False)
+
+    def _thumbnail_for(self, filename):
+        """캐시된 썸네일 반환, 없으면 비동기 로드 요청 후 placeholder 반환"""
+        path = os.path.join(self.frame_dir, filename) if filename else ""
+        key = self._cache_key(path) if path else None
+        if key is None:
+            return QIcon(self._missing_pixmap())
+
+        pixmap = self._cache_get(key)
+        if pixmap is not None:
+            return QIcon(pixmap)
+
+        if path not in self._pending:
+            self._pending.add(path)
+            self._pool.start(_ThumbnailTask(path, self.thumbnail_size, self._signals))
+        return QIcon(self._placeholder_pixmap())
+
+    def _on_thumbnail_loaded(self, path, image):
+        self._pending.discard(path)
+        key = self._cache_key(path)
+        if key is None:
+            return
+
+        self._cache_put(key, self._missing_pixmap() if image.isNull() else QPixmap.fromImage(image))
+
+        # 해당 파일을 사용하는 행만 갱신
+        for row in self._rows_for(path):
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [Qt.DecorationRole])
+
+    def _make_placeholder(self, text):
+        pixmap = QPixmap(self.thumbnail_size)
+        pixmap.fill(Qt.lightGray)
+        painter = QPainter(pixmap)
+        painter.setPen(Qt.black)
+        painter.drawText(pixmap.rect(), Qt.AlignCenter, text)
+        painter.end()
+        return pixmap
+
+    def _placeholder_pixmap(self):
+        if self._placeholder is None:
+            self._placeholder = self._make_placeholder("...")
+        return self._placeholder
+
+    def _missing_pixmap(self):
+        if self._missing is None:
+            self._missing = self._make_placeholder("No Image")
+        return self._missing
+
+
+class FrameFilterProxyModel(QSortFilterProxyModel):
+    """프레임 이름/타입 필터링 프록시 모델"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._name_filter = ""
+        self._type_filter = None
+        # 편집 중 이름 변경으로 현재 행이 사라지지 않도록 필터 변경 시에만 재평가
+        self.setDynamicSortFilter(False)
+
+    def set_name_filter(self, text):
+        self._name_filter = (text or "").strip().lower()
+        self.invalidateFilter()
+
+    def set_type_filter(self, frame_type):
+        self._type_filter = frame_type or None
+        self.invalidateFilter()
+
+    def is_filtered(self):
+        return bool(self._name_filter) or self._type_filter is not None
+
+    def clear_filters(self):
+        self._name_filter = ""
+        self._type_filter = None
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        model = self.sourceModel()
+        index = model.index(source_row, 0, source_parent)
+
+        frame_type = model.data(index, FrameListModel.TypeRole)
+        if frame_type == FrameListModel.NONE_FILENAME:
+            return True
+
+        if self._type_filter and frame_type != self._type_filter:
+            return False
+
+        if self._name_filter:
+            name = (model.data(index, Qt.DisplayRole) or "").lower()
+            filename = (model.data(index, FrameListModel.FilenameRole) or "").lower()
+            if self._name_filter not in name and self._name_filter not in filename:
+                return False
+
+        return True
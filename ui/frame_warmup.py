@@ -0,0 +1,30 @@
+"""
+FrameWarmup 모듈
+메인 윈도우 표시 이후 유휴 시간에 프레임 에셋(디코딩, 미리보기, 합성 영역별 사진 마스크)을
+낮은 우선순위 스레드에서 미리 준비합니다.
+"""
+
+from PyQt5.QtCore import QThread
+
+
+class FrameWarmupThread(QThread):
+    """프레임 에셋 사전 로드 스레드 (QThread.IdlePriority로 실행)"""
+
+    def __init__(self, frames, frame_paths, budget_bytes, expand_pixels=0, parent=None):
+        super().__init__(parent)
+        self.frames = list(frames)            # 프레임 데이터 (frame_paths와 같은 순서, 합성 영역 계산용)
+        self.frame_paths = list(frame_paths)
+        self.budget_bytes = budget_bytes
+        self.expand_pixels = expand_pixels
+
+    def run(self):
+        # PIL은 시작 속도를 위해 이 스레드에서 처음 import
+        from core.frame_cache import get_frame_cache
+        from core.frame_catalog import frame_pixel_regions
+
+        regions = {path: frame_pixel_regions(frame, path) for frame, path in zip(self.frames, self.frame_paths)}
+        cache = get_frame_cache()
+        cache.set_budget(self.budget_bytes)
+        count = cache.warm(self.frame_paths, should_stop=self.isInterruptionRequested, regions=regions,
+                           expand_pixels=self.expand_pixels)
+        print(f"[DEBUG] 프레임 사전 로드: {count}개")
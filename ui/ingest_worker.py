@@ -0,0 +1,60 @@
+"""
+IngestWorker 모듈
+선택/드롭한 사진을 세션 폴더로 가져오는 작업(core.ingest)을 GUI 스레드 밖에서 처리합니다.
+USB 카드 리더나 네트워크 공유에서 큰 원본을 복사하는 동안에도 화면이 멈추지 않습니다.
+"""
+
+import queue
+import threading
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from core.ingest import get_ingestor, working_region_sizes
+
+
+class IngestWorker(QThread):
+    """가져오기 작업 큐를 순서대로 처리하는 스레드 (큐가 비면 종료, 다음 요청 시 다시 시작)"""
+
+    ingested = pyqtSignal(object, object)  # (요청 토큰, IngestResult)
+    failed = pyqtSignal(object, str)        # (요청 토큰, 오류 메시지)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tasks = queue.Queue()
+        self._lock = threading.Lock()
+        self._active = False
+
+    def submit(self, token, source, target, working=None):
+        """가져오기 요청 (결과는 ingested/failed 시그널로 GUI 스레드에 전달)
+
+        working: 작업 해상도 사본으로 가져올 때 (프레임 목록, 프레임 폴더, 확장 픽셀)
+        """
+        with self._lock:
+            self._tasks.put((token, source, target, working))
+            if self._active:
+                return
+            self._active = True
+        # 이전 실행이 막 끝나는 중이면 완전히 종료된 뒤 다시 시작
+        self.wait()
+        self.start()
+
+    def stop(self):
+        """남은 요청을 버리고 진행 중인 가져오기가 끝날 때까지 대기"""
+        with self._lock:
+            while not self._tasks.empty():
+                self._tasks.get_nowait()
+        self.wait()
+
+    def run(self):
+        ingestor = get_ingestor()
+        while True:
+            with self._lock:
+                if self._tasks.empty():
+                    self._active = False
+                    return
+                token, source, target, working = self._tasks.get_nowait()
+            try:
+                region_sizes = working_region_sizes(*working) if working else None
+                self.ingested.emit(token, ingestor.ingest(source, target, region_sizes))
+            except Exception as e:
+                self.failed.emit(token, str(e))
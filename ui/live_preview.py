@@ -0,0 +1,70 @@
+"""
+LivePreview 모듈
+슬롯에 사진을 넣거나 빼고 프레임을 바꿀 때마다 미리보기 크기 합성(core.processor.render_preview)을
+GUI 스레드 밖에서 다시 만듭니다.
+
+요청은 큐에 쌓지 않고 가장 최근 것 하나만 보관합니다. 합성 중에 여러 번 요청되면(연속 드롭 등)
+끝난 뒤 마지막 요청만 합성하므로 지난 상태를 다시 그리는 작업이 쌓이지 않습니다.
+영역에 맞춘 사진은 슬롯별로 캐시되어, 한 슬롯만 바뀌면 나머지는 디코딩 없이 다시 붙입니다.
+"""
+
+import threading
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from .render_worker import to_qimage
+
+
+class LivePreview(QThread):
+    """실시간 미리보기 합성 스레드 (최근 요청만 처리, 요청이 없으면 종료)"""
+
+    rendered = pyqtSignal(int, object)  # (요청 번호, QImage 또는 None - 넣은 사진이 없음)
+
+    def __init__(self, image_processor, frame_manager, parent=None):
+        super().__init__(parent)
+        self.image_processor = image_processor
+        self.frame_manager = frame_manager
+        self.serial = 0           # 마지막 요청 번호 (GUI 스레드)
+        self._request = None
+        self._lock = threading.Lock()
+        self._active = False
+        self._fitted_cache = {}   # 합성 스레드에서만 사용
+
+    def request(self, files, frame_name, box_size, expand_pixels=0):
+        """미리보기 다시 합성 요청 - 아직 처리되지 않은 이전 요청은 대체됨
+
+        Returns: 요청 번호 (rendered 시그널의 번호가 이 값과 같을 때만 최신 결과)
+        """
+        self.serial += 1
+        with self._lock:
+            self._request = (self.serial, list(files), frame_name, box_size, expand_pixels)
+            if self._active:
+                return self.serial
+            self._active = True
+        # 이전 실행이 막 끝나는 중이면 완전히 종료된 뒤 다시 시작
+        self.wait()
+        self.start()
+        return self.serial
+
+    def stop(self):
+        """남은 요청을 버리고 진행 중인 합성이 끝날 때까지 대기"""
+        with self._lock:
+            self._request = None
+        self.wait()
+
+    def run(self):
+        while True:
+            with self._lock:
+                if self._request is None:
+                    self._active = False
+                    return
+                serial, files, frame_name, box_size, expand_pixels = self._request
+                self._request = None
+
+            try:
+                preview = self.image_processor.render_preview(files, frame_name, self.frame_manager, box_size,
+                                                              expand_pixels=expand_pixels,
+                                                              fitted_cache=self._fitted_cache)
+                self.rendered.emit(serial, to_qimage(preview) if preview is not None else None)
+            except Exception as e:
+                print(f"[WARNING] 실시간 미리보기 실패: {e}")
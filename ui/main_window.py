@@ -1,222 +1,32 @@
 import sys
 import os
 import shutil
-import datetime
 import io
+import threading
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QPushButton, QVBoxLayout,
                            QWidget, QFileDialog, QLineEdit, QLabel, QHBoxLayout,
                            QFrame, QSizePolicy, QSpacerItem, QMessageBox, QComboBox,
-                           QDialog, QButtonGroup)
+                           QDialog, QButtonGroup, QStackedWidget)
 from PyQt5.QtGui import QFont, QDragEnterEvent, QDropEvent, QPixmap, QImage, QPainter, QColor
-from PyQt5.QtCore import Qt, QRect
-from PyQt5.QtPrintSupport import QPrinter, QPrintDialog
-from PIL import Image as PILImage
+from PyQt5.QtCore import Qt, QRect, QTimer, QThread
+from core import FrameManager, SettingsManager, FolderManager, ImageProcessor
+from core.digest import remove_output_digest
+from core.session import SessionManifest
+from core.render_cache import RenderCache
 from .drop_area import SingleDropArea, MultiDropArea
-from .frame_manager import FrameManager
-from .drop_area import SingleDropArea, MultiDropArea
-from .frame_manager import FrameManager
-from .settings_dialog import SettingsDialog
-from .settings_manager import SettingsManager
+from .frame_list_model import FrameListModel
+from .frame_warmup import FrameWarmupThread
+from .ingest_worker import IngestWorker
+from .render_worker import RenderWorker
+from .live_preview import LivePreview
 from .styles import Styles, Colors, Fonts
 from .message_box import MessageBox
 from .status_card import StatusCard
 from .toast_message import ToastMessage
+from .print_manager import PrintManager
+from .print_queue import PrintQueuePanel, STATUS_COLLECTING, STATUS_DONE, STATUS_FAILED
 
-
-
-class FolderManager:
-    """폴더 관리 클래스: 이름 생성, 중복 확인, 생성"""
-    
-    def __init__(self, base_path=None):
-        self.base_path = base_path or os.getcwd()
-        self.created_folder = None
-        self.previous_folder_number = None
-
-    def get_actual_folder_name(self, folder_number_text):
-        """실제 생성될 폴더 이름을 반환"""
-        folder_name = folder_number_text
-        folder_path = os.path.join(self.base_path, folder_name)
-
-        if os.path.exists(folder_path):
-            base_folder_name = folder_name
-            existing_folders = [d for d in os.listdir(self.base_path)
-                                if os.path.isdir(os.path.join(self.base_path, d)) and
-                                d.startswith(base_folder_name + "_")]
-
-            if existing_folders:
-                max_num = 0
-                for folder in existing_folders:
-                    try:
-                        suffix = folder[len(base_folder_name) + 1:]
-                        if suffix.isdigit():
-                            num = int(suffix)
-                            if num > max_num:
-                                max_num = num
-                    except:
-                        continue
-                folder_name = f"{base_folder_name}_{max_num + 1}"
-            else:
-                folder_name = f"{base_folder_name}_1"
-
-        return folder_name
-
-    def create_folder(self, folder_name):
-        """폴더 생성"""
-        folder_path = os.path.join(self.base_path, folder_name)
-        if not os.path.exists(folder_path):
-            os.makedirs(folder_path)
-            self.created_folder = folder_path
-            return True, folder_path, "created"
-        else:
-            self.created_folder = folder_path
-            return True, folder_path, "existing"
-
-    def check_availability(self, folder_number_text):
-        """폴더 이름 가용성 확인"""
-        if not folder_number_text:
-            return None
-
-        if not folder_number_text.isdigit():
-            return {"status": "invalid", "message": "유효한 번호를 입력해주세요."}
-
-        folder_name = str(folder_number_text)
-        folder_path = os.path.join(self.base_path, folder_name)
-
-        if os.path.exists(folder_path):
-            folder_creation_time = os.path.getctime(folder_path)
-            time_str = datetime.datetime.fromtimestamp(folder_creation_time).strftime('%Y-%m-%d %H:%M:%S')
-            
-            # 다음 가능한 이름 찾기
-            actual_name = self.get_actual_folder_name(folder_name)
-            
-            return {
-                "status": "exists",
-                "message": "이미 있는 이름입니다.",
-                "creation_time": time_str,
-                "next_name": actual_name
-            }
-        else:
-            return {
-                "status": "available",
-                "message": "새로운 이름입니다.",
-                "next_name": folder_name
-            }
-
-
-class ImageProcessor:
-    """이미지 처리 클래스: 가공 로직 연결"""
-    
-    def __init__(self):
-        pass
-
-    def process_images(self, files, frame_name, frame_manager, output_folder, expand_pixels=0):
-        """이미지 가공 실행"""
-        try:
-            from processing import insert_images_into_frame
-            
-            base_name = os.path.basename(files[0]) if files[0] else "image.jpg"
-            processed_image_path = os.path.join(output_folder, "processed_" + base_name)
-
-            if frame_name == "none":
-                if files[0]:
-                    image = PILImage.open(files[0])
-                    image.save(processed_image_path, quality=100)
-                return processed_image_path
-
-            frame_path = os.path.join(os.getcwd(), 'frame', frame_name)
-            os.makedirs(os.path.dirname(frame_path), exist_ok=True)
-
-            if not os.path.exists(frame_path):
-                print(f"[WARNING] 프레임 이미지를 찾을 수 없음: {frame_path}")
-                if files[0]:
-                    shutil.copy(files[0], processed_image_path)
-                return processed_image_path
-
-            # FrameManager를 통해 영역 정보 가져오기
-            # frame_name은 파일명(01.png)이므로, 이를 이용해 데이터를 찾음
-            # FrameManager 구조상 get_frame_by_name은 '4컷 - 파란색' 같은 이름을 받음
-            # 따라서 파일명으로 이름을 찾거나, 파일명으로 직접 데이터를 찾아야 함.
-            # 여기서는 FrameManager의 get_all_frames를 순회하여 찾거나, MultiWindow에서 넘겨주는 방식 고려
-            # 일단 MultiWindow에서 frame_data를 넘겨주는 것이 더 깔끔할 수 있으나,
-            # 여기서는 frame_manager를 이용해 직접 찾도록 구현
-            
-            frames = frame_manager.get_all_frames()
-            frame_data = next((f for f in frames if f['filename'] == frame_name), None)
-            
-            if frame_data:
-                regions = frame_data.get('regions', [])
-            else:
-                regions = []
-
-            photo_regions = []
-            for i, file_path in enumerate(files):
-                if file_path and os.path.exists(file_path):
-                    if i < len(regions):
-                        photo_regions.append((file_path, regions[i]))
-
-            if photo_regions:
-                insert_images_into_frame(photo_regions, frame_path, processed_image_path, expand_pixels=expand_pixels)
-                return processed_image_path
-            else:
-                return None
-
-        except Exception as e:
-            print(f"[ERROR] 이미지 가공 중 오류: {e}")
-            raise e
-
-
-class PrintManager:
-    """인쇄 관리 클래스"""
-    
-    def __init__(self):
-        pass
-
-    def print_image(self, image_path, parent_widget):
-        """이미지 인쇄"""
-        if not image_path or not os.path.exists(image_path):
-            MessageBox.warning(parent_widget, "경고", "인쇄할 이미지가 없습니다.")
-            return False
-
-        try:
-            # PIL을 통해 이미지 로드 시도
-            pil_image = PILImage.open(image_path)
-            qimage = ImageUtils.pil_to_qimage(pil_image)
-
-            if qimage.isNull():
-                qimage = QImage(image_path)
-
-            if qimage.isNull():
-                MessageBox.critical(parent_widget, "오류", "이미지를 인쇄용으로 로드할 수 없습니다.")
-                return False
-
-            # 프린터 설정
-            printer = QPrinter(QPrinter.HighResolution)
-            printer.setOutputFormat(QPrinter.NativeFormat)
-
-            print_dialog = QPrintDialog(printer, parent_widget)
-            print_dialog.setWindowTitle("이미지 인쇄")
-
-            if print_dialog.exec_() == QPrintDialog.Accepted:
-                painter = QPainter()
-                if painter.begin(printer):
-                    rect = painter.viewport()
-                    image_size = qimage.size()
-                    image_size.scale(rect.size(), Qt.KeepAspectRatio)
-                    painter.setViewport(rect.x(), rect.y(), image_size.width(), image_size.height())
-                    painter.setWindow(qimage.rect())
-
-                    painter.drawImage(0, 0, qimage)
-                    painter.end()
-                    return True
-                else:
-                    MessageBox.critical(parent_widget, "오류", "인쇄 작업을 시작할 수 없습니다.")
-                    return False
-            return False
-
-        except Exception as e:
-            print(f"[ERROR] 인쇄 중 오류: {e}")
-            MessageBox.critical(parent_widget, "오류", f"인쇄 중 오류가 발생했습니다: {e}")
-            return False
+# PIL, QtPrintSupport, 설정 다이얼로그는 첫 화면 표시 이후 지연 로드 (MultiWindow.warm_up 참고)
 
 
 class ImageUtils:
@@ -226,6 +36,8 @@ class ImageUtils:
     def pil_to_qpixmap(pil_image):
         """PIL 이미지를 QPixmap으로 변환"""
         try:
+            from PIL import Image as PILImage
+
             if pil_image.mode == 'RGBA':
                 background = PILImage.new('RGB', pil_image.size, (255, 255, 255))
                 background.paste(pil_image, mask=pil_image.split()[-1])
@@ -256,6 +68,8 @@ class ImageUtils:
     def pil_to_qimage(pil_image):
         """PIL 이미지를 QImage로 변환"""
         try:
+            from PIL import Image as PILImage
+
             if pil_image.mode == 'RGBA':
                 background = PILImage.new('RGB', pil_image.size, (255, 255, 255))
                 background.paste(pil_image, mask=pil_image.split()[-1])
@@ -276,10 +90,22 @@ class ImageUtils:
             print(f"[DEBUG] ImageUtils: PIL → QImage 변환 오류: {e}")
             return QImage()
 
+    @staticmethod
+    def pil_rgba_to_qpixmap(pil_image):
+        """PIL 이미지를 투명도를 유지한 채 QPixmap으로 변환 (PNG 인코딩 없이 직접 복사)"""
+        if pil_image.mode != 'RGBA':
+            pil_image = pil_image.convert('RGBA')
+        w, h = pil_image.size
+        data = pil_image.tobytes('raw', 'RGBA')
+        qimage = QImage(data, w, h, w * 4, QImage.Format_RGBA8888)
+        return QPixmap.fromImage(qimage.copy())
+
     @staticmethod
     def load_and_resize_with_pil(image_path, target_width, target_height):
         """PIL을 통해 이미지를 로드하고 크기 조정"""
         try:
+            from PIL import Image as PILImage
+
             print(f"[DEBUG] ImageUtils: PIL로 이미지 로드 시작: {image_path}")
 
             pil_image = PILImage.open(image_path)
@@ -315,6 +141,10 @@ class MultiWindow(QMainWindow):
         # 추가: 첫 번째 체크 상태 관리 변수
         self.is_first_check = True
 
+        # 인쇄 관리 (인쇄 대기열 패널이 UI에 포함되므로 먼저 생성)
+        self.print_manager = PrintManager()
+        self.print_manager.queue.job_changed.connect(self.on_print_job_changed)
+
         # 종료 버튼 제거됨
 
 
@@ -416,9 +246,14 @@ class MultiWindow(QMainWindow):
         self.drop_container_layout.setContentsMargins(0, 0, 0, 0)
         self.drop_container_layout.setSpacing(0) # 간격 제거 (드롭 영역과 버튼 사이)
 
-        # 초기 드롭 영역 설정 (Placeholder)
-        self.drop_area = MultiDropArea(self)
-        self.drop_container_layout.addWidget(self.drop_area)
+        # 드롭 영역은 모드별로 한 번만 생성하고 스택으로 전환 (모드 전환 시 재생성 비용 제거)
+        self.multi_drop_area = MultiDropArea(self)
+        self.single_drop_area = SingleDropArea(self)
+        self.drop_stack = QStackedWidget()
+        self.drop_stack.addWidget(self.multi_drop_area)
+        self.drop_stack.addWidget(self.single_drop_area)
+        self.drop_area = self.multi_drop_area
+        self.drop_container_layout.addWidget(self.drop_stack)
         
         # 파일 선택 버튼 (고정)
         self.select_file_button = QPushButton("또는 파일 선택")
@@ -495,6 +330,10 @@ class MultiWindow(QMainWindow):
 
         self.frame_combo = QComboBox()
         self.frame_combo.setStyleSheet(Styles.INPUT)
+        # 프레임 목록은 모델로 관리 (목록 갱신 시 항목을 재생성하지 않음)
+        self.frame_model = FrameListModel(show_thumbnails=False, include_none=True, parent=self)
+        self.frame_combo.setModel(self.frame_model)
+        self.frame_combo.view().setUniformItemSizes(True)
         frame_select_layout.addWidget(self.frame_combo)
 
         # 설정 버튼 제거됨 (상단으로 이동)
@@ -529,11 +368,15 @@ class MultiWindow(QMainWindow):
         
         # 인쇄 버튼 (이미지 하단)
         self.print_button = QPushButton("인쇄")
-        self.print_button.setStyleSheet(Styles.BTN_PRIMARY)
+        self.print_button.setObjectName("printButton")  # Styles.PRINT_BUTTON (variant 속성)
         self.print_button.setEnabled(False)
         self.print_button.clicked.connect(self.print_image)
         right_layout.addWidget(self.print_button)
 
+        # 인쇄 대기열 상태 (첫 인쇄 작업부터 표시)
+        self.print_queue_panel = PrintQueuePanel(self.print_manager.queue)
+        right_layout.addWidget(self.print_queue_panel)
+
         split_layout.addWidget(right_container, 1) # 비율 1
 
         main_layout.addLayout(split_layout)
@@ -549,6 +392,7 @@ class MultiWindow(QMainWindow):
         self.selected_files = [None, None, None, None]
         self.processed_file = None
         self.created_folder = None
+        self.session = None  # 현재 세션 폴더의 SessionManifest
 
         # 선택된 프레임 변수 초기화
         self.selected_frame = "01.png"
@@ -559,33 +403,211 @@ class MultiWindow(QMainWindow):
         # 모드 관련 변수 초기화
         self.current_mode = "four_cut"  # 기본값: 네컷 모드
 
-        # 프레임 매니저 초기화 및 콤보박스 설정
-        self.frame_manager = FrameManager()
+        # 프레임 에셋 사전 로드 스레드 (warm_up 이후 시작)
+        self.frame_warmup = None
+
+        # 사진 가져오기 스레드 (첫 요청 시 시작) - 슬롯별 진행 중인 요청 {슬롯: (토큰, 대상 경로)}
+        self.ingest_worker = IngestWorker(self)
+        self.ingest_worker.ingested.connect(self.on_image_ingested)
+        self.ingest_worker.failed.connect(self.on_image_ingest_failed)
+        self.pending_ingest = {}
+        self.ingest_serial = 0
+
+        # 프레임 매니저 초기화 (프레임 목록은 warm_up에서 로드)
+        self.frame_manager = FrameManager(autoload=False)
         
         # 헬퍼 클래스 초기화
         self.folder_manager = FolderManager()
-        self.image_processor = ImageProcessor()
-        self.print_manager = PrintManager()
+        # 같은 입력으로 다시 가공하면 렌더 캐시의 결과를 재사용
+        self.image_processor = ImageProcessor(render_cache=RenderCache())
         self.settings_manager = SettingsManager()
+
+        # 가공 스레드 (첫 가공 시 시작) - 진행 중인 가공 (토큰, 결과 경로, 폴더, 프레임)
+        self.render_worker = RenderWorker(self.image_processor, self.frame_manager, self)
+        self.render_worker.previewed.connect(self.on_render_previewed)
+        self.render_worker.rendered.connect(self.on_render_finished)
+        self.render_worker.failed.connect(self.on_render_failed)
+        self.pending_render = None
+        self.render_serial = 0
+
+        # 실시간 미리보기 (슬롯/프레임이 바뀔 때 프레임 미리보기 자리에 합성) - 같은 이벤트 루프 안의 변경은 한 번에
+        self.live_preview = LivePreview(self.image_processor, self.frame_manager, self)
+        self.live_preview.rendered.connect(self.on_live_preview)
+        self.live_preview_timer = QTimer(self)
+        self.live_preview_timer.setSingleShot(True)
+        self.live_preview_timer.setInterval(0)
+        self.live_preview_timer.timeout.connect(self.request_live_preview)
         
-        self.update_frame_combo()
-        self.apply_aspect_ratio()
+        # 프레임 목록/미리보기 디코딩은 첫 화면이 그려진 뒤 warm_up에서 수행 (paintEvent 참고)
+        self._warm_up_scheduled = False
+        self.apply_aspect_ratio(update_previews=False)
         self.update_print_button_ui()
+        self.clear_processed_view()
         
         # 초기 상태 메시지 설정 (모든 초기화가 끝난 후 설정해야 덮어씌워지지 않음)
         self.processing_status_card.show_success("준비됨")
 
+    def paintEvent(self, event):
+        """첫 그리기가 끝나면 warm_up 예약 (창이 실제로 화면에 그려진 뒤 무거운 초기화 시작)"""
+        super().paintEvent(event)
+        if not self._warm_up_scheduled:
+            self._warm_up_scheduled = True
+            QTimer.singleShot(0, self.warm_up)
+
+    def warm_up(self):
+        """첫 화면이 그려진 이후 실행되는 초기화 단계 (첫 paintEvent에서 예약)
+
+        프레임 목록 로드와 미리보기 디코딩, 리소스 생성을 수행하고
+        첫 사용 시 필요한 무거운 모듈(PIL, QtPrintSupport, 설정 다이얼로그)을
+        백그라운드 스레드에서 미리 import 합니다.
+        """
+        if Styles.init_resources():
+            Styles.repolish(self.frame_combo)
+
+        self.frame_manager.load_frames()
+        if self.frame_manager.migrated:
+            # 이전 형식 frames.json에 정규화 좌표 추가 저장
+            self.frame_manager.save_frames()
+        self.update_frame_combo(suppress_status=True)
+
+        threading.Thread(target=self._preload_modules, daemon=True).start()
+
+        # 이벤트 루프가 한가해지면 프레임 에셋 사전 로드 시작
+        QTimer.singleShot(0, self.start_frame_warmup)
+
+        # 비정상 종료로 중단된 세션이 있으면 복구 제안
+        QTimer.singleShot(0, self.offer_session_recovery)
+
+    def session_for(self, folder_path):
+        """세션 폴더의 SessionManifest (현재 세션과 다른 폴더면 새로 열기)"""
+        if self.session is None or os.path.abspath(self.session.folder) != os.path.abspath(folder_path):
+            self.session = SessionManifest.open(folder_path)
+        return self.session
+
+    def offer_session_recovery(self):
+        """이전 실행에서 중단된 세션 복구 제안"""
+        folder_path = self.settings_manager.get("active_session")
+        if not folder_path:
+            return
+
+        manifest = SessionManifest.load(folder_path) if os.path.isdir(folder_path) else None
+        if (manifest is None or manifest.state == SessionManifest.STATE_CLOSED
+                or not any(manifest.input_slots())):
+            self.settings_manager.set("active_session", None)
+            return
+
+        folder_name = os.path.basename(folder_path)
+        reply = MessageBox.question(self, '작업 복구',
+                                    f"이전에 중단된 '{folder_name}' 작업이 있습니다.\n이어서 작업하시겠습니까?")
+        if reply == MessageBox.No:
+            self.settings_manager.set("active_session", None)
+            return
+
+        self.restore_session(manifest)
+
+    def restore_session(self, manifest):
+        """SessionManifest 기록으로 폴더, 모드, 슬롯 이미지, 프레임, 가공 결과 복원"""
+        folder_name = os.path.basename(manifest.folder)
+
+        # 모드 및 드롭 영역
+        self.current_mode = manifest.mode or "four_cut"
+        self.four_cut_button.setChecked(self.current_mode == "four_cut")
+        self.single_cut_button.setChecked(self.current_mode != "four_cut")
+        self.setup_drop_area()
+
+        # 폴더 (설정 후 변경 불가 상태)
+        self.folder_input.setText(folder_name)
+        self.folder_input.setReadOnly(True)
+        Styles.repolish(self.folder_input)
+        self.created_folder = manifest.folder
+        self.session = manifest
+        self.open_folder_btn.setEnabled(True)
+
+        # 프레임
+        if manifest.frame:
+            index = self.frame_combo.findData(manifest.frame)
+            if index >= 0:
+                self.frame_combo.setCurrentIndex(index)
+
+        # 슬롯 이미지
+        self.selected_files = manifest.input_slots(len(self.selected_files))
+        for slot, path in enumerate(self.selected_files):
+            if path:
+                self.drop_area.set_image_to_zone(slot, path)
+        self.update_frame_preview()
+
+        filled_count = sum(1 for file in self.selected_files if file is not None)
+        all_filled = filled_count == len(self.selected_files)
+
+        # 가공 결과 (입력이 모두 있을 때만)
+        output = manifest.output()
+        if all_filled and output and os.path.exists(output):
+            self.processed_file = output
+            self.load_processed_preview()
+            self.update_print_button_ui()
+            self.process_button.setEnabled(False)
+            self.processing_status_card.show_success(f"'{folder_name}' 작업을 복구했습니다. 가공된 이미지를 인쇄할 수 있습니다.")
+        else:
+            self.process_button.setEnabled(all_filled)
+            self.processing_status_card.show_info(
+                f"'{folder_name}' 작업을 복구했습니다. {filled_count}/{len(self.selected_files)}개 이미지가 준비되었습니다.")
+
+    def start_frame_warmup(self):
+        """프레임 에셋(디코딩, 미리보기, 합성 영역별 사진 마스크) 사전 로드 - 최근 사용 프레임 우선"""
+        from core.frame_cache import order_frames_for_warmup
+
+        if self.frame_warmup and self.frame_warmup.isRunning():
+            return
+
+        recent = self.settings_manager.get("recent_frames", [])
+        filenames = order_frames_for_warmup(self.frame_manager.get_all_frames(), recent)
+        frames = [self.frame_manager.get_frame_by_filename(name) for name in filenames]
+        frame_paths = [os.path.join(os.getcwd(), 'frame', name) for name in filenames]
+        budget_mb = self.settings_manager.get("frame_cache_budget_mb", 256)
+
+        # 합성 영역 확장 설정이 가공과 같아야 미리 만든 슬롯 마스크가 재사용됨
+        self.frame_warmup = FrameWarmupThread(frames, frame_paths, budget_mb * 1024 * 1024,
+                                              self.settings_manager.get("expand_pixels", 0), self)
+        self.frame_warmup.start(QThread.IdlePriority)
+
+    def stop_frame_warmup(self):
+        if self.frame_warmup and self.frame_warmup.isRunning():
+            self.frame_warmup.requestInterruption()
+            self.frame_warmup.wait()
+
+    def record_recent_frame(self, frame_filename):
+        """최근 사용 프레임 기록 (다음 실행 시 사전 로드 우선순위)"""
+        if not frame_filename or frame_filename == "none":
+            return
+        recent = [name for name in self.settings_manager.get("recent_frames", []) if name != frame_filename]
+        recent.insert(0, frame_filename)
+        self.settings_manager.set("recent_frames", recent[:10])
+
+    def closeEvent(self, event):
+        self.stop_frame_warmup()
+        self.ingest_worker.stop()
+        self.render_worker.stop()
+        self.live_preview.stop()
+        self.print_manager.queue.stop()
+        super().closeEvent(event)
+
+    @staticmethod
+    def _preload_modules():
+        """첫 가공/인쇄/설정 시 지연이 없도록 모듈을 미리 로드"""
+        try:
+            import PIL.Image  # noqa: F401
+            import core.compositing  # noqa: F401
+            from PyQt5 import QtPrintSupport  # noqa: F401
+            from . import settings_dialog  # noqa: F401
+        except Exception as e:
+            print(f"[WARNING] 모듈 사전 로드 실패: {e}")
+
     def update_frame_combo(self, suppress_status=False):
         """프레임 콤보박스 목록 업데이트"""
-        current_text = self.frame_combo.currentText()
+        # 최초 로드 전에는 "프레임 없음" 항목만 있으므로 복원할 선택이 없음
+        current_text = self.frame_combo.currentText() if self.frame_model.frames() else ""
         self.frame_combo.blockSignals(True)
-        self.frame_combo.clear()
-        
-        frames = self.frame_manager.get_all_frames()
-        for frame in frames:
-            self.frame_combo.addItem(frame['name'], frame['filename'])
-            
-        self.frame_combo.addItem("프레임 없음", "none")
+        self.frame_model.set_frames(self.frame_manager.get_all_frames())
         
         # 이전 선택 복원 시도
         index = self.frame_combo.findText(current_text)
@@ -600,6 +622,8 @@ class MultiWindow(QMainWindow):
 
     def open_settings(self):
         """설정 다이얼로그 열기"""
+        from .settings_dialog import SettingsDialog
+
         dialog = SettingsDialog(self.frame_manager, self.settings_manager, self)
         dialog.exec_()
         self.update_frame_combo(suppress_status=True)
@@ -685,37 +709,39 @@ class MultiWindow(QMainWindow):
         print("[DEBUG] 한컷 모드로 변경됨")
 
     def setup_drop_area(self):
-        """모드에 따른 드롭 영역 설정"""
-        # 기존 드롭 영역 제거
-        if hasattr(self, 'drop_area') and self.drop_area:
-            self.drop_container_layout.removeWidget(self.drop_area)
-            self.drop_area.setParent(None)
-            self.drop_area.deleteLater()
-
-        # 새 드롭 영역 생성
+        """모드에 따른 드롭 영역 전환"""
+        previous_area = self.drop_area
+
+        self.pending_ingest.clear()
         if self.current_mode == "four_cut":
-            self.drop_area = MultiDropArea(self)
+            self.drop_area = self.multi_drop_area
             self.selected_files = [None, None, None, None]  # 4개 슬롯
         else:  # single_cut
-            self.drop_area = SingleDropArea(self)
+            self.drop_area = self.single_drop_area
             self.selected_files = [None]  # 1개 슬롯
 
-        # 컨테이너에 새 드롭 영역 추가 (버튼 위인 0번 인덱스에 삽입)
-        self.drop_container_layout.insertWidget(0, self.drop_area)
+        # 숨겨지는 영역에 남은 이미지가 다음 전환 때 보이지 않도록 정리
+        if previous_area is not self.drop_area:
+            previous_area.reset_zones()
+
+        self.drop_stack.setCurrentWidget(self.drop_area)
+        self.update_frame_preview()
 
-        print(f"[DEBUG] 드롭 영역이 {self.current_mode} 모드로 교체됨")
+        print(f"[DEBUG] 드롭 영역이 {self.current_mode} 모드로 전환됨")
 
     def reset_work_without_folder(self):
         """폴더 정보는 유지하고 작업만 초기화"""
-        # 선택된 파일들과 가공된 파일 정보 초기화
+        # 선택된 파일들과 가공된 파일 정보 초기화 (진행 중인 가져오기 결과는 도착 시 정리)
+        self.pending_ingest.clear()
         if self.current_mode == "four_cut":
             self.selected_files = [None, None, None, None]
         else:
             self.selected_files = [None]
         self.processed_file = None
 
-        # 드롭 영역 초기화
+        # 드롭 영역 및 실시간 미리보기 초기화
         self.drop_area.reset_zones()
+        self.update_frame_preview()
 
         # 가공된 이미지 초기화 (helper 사용)
         self.clear_processed_view()
@@ -746,7 +772,7 @@ class MultiWindow(QMainWindow):
 
 
 
-    def apply_aspect_ratio(self):
+    def apply_aspect_ratio(self, update_previews=True):
         """설정된 비율에 따라 미리보기 영역 크기 조정"""
         ratio_str = self.settings_manager.get("preview_aspect_ratio", "3:2")
         
@@ -764,6 +790,9 @@ class MultiWindow(QMainWindow):
         # Expanding 정책이 있으면 레이아웃이 늘려버리므로 고정 크기로 변경
         self.frame_preview_label.setFixedSize(base_width, target_height)
         self.processed_label.setFixedSize(base_width, target_height)
+
+        if not update_previews:
+            return
         
         # 현재 표시된 이미지도 업데이트
         self.update_frame_preview()
@@ -772,10 +801,33 @@ class MultiWindow(QMainWindow):
             self.load_processed_preview()
 
     def update_frame_preview(self):
-        """선택된 프레임 미리보기 업데이트"""
+        """선택된 프레임 미리보기 업데이트 (넣은 사진이 있으면 실시간 합성으로 표시)"""
         if not hasattr(self, 'frame_preview_label'):
             return
 
+        if any(getattr(self, 'selected_files', None) or []):
+            # 합성이 도착할 때까지 현재 미리보기 유지 (프레임만 잠깐 보이지 않도록)
+            self.live_preview_timer.start()
+            return
+        self.live_preview.serial += 1  # 진행 중인 합성 결과 무시
+        self.show_frame_preview()
+
+    def request_live_preview(self):
+        """실시간 미리보기 합성 요청 (live_preview_timer - 연속 변경은 한 번으로 합침)"""
+        self.live_preview.request(self.selected_files, self.selected_frame or "none", self.preview_size(),
+                                  expand_pixels=self.settings_manager.get("expand_pixels", 0))
+
+    def on_live_preview(self, serial, qimage):
+        """실시간 미리보기 도착 - 최신 요청의 결과만 표시"""
+        if serial != self.live_preview.serial:
+            return
+        if qimage is None:
+            self.show_frame_preview()
+        else:
+            self.frame_preview_label.setPixmap(QPixmap.fromImage(qimage))
+
+    def show_frame_preview(self):
+        """프레임만 표시"""
         if self.selected_frame == "none" or not self.selected_frame:
             self.frame_preview_label.setText("프레임 없음")
             self.frame_preview_label.setPixmap(QPixmap())
@@ -786,7 +838,10 @@ class MultiWindow(QMainWindow):
             self.frame_preview_label.setText("프레임 파일 없음")
             return
 
-        pixmap = QPixmap(frame_path)
+        # 사전 로드된 미리보기가 있으면 원본 PNG 디코딩 생략
+        pixmap = self.cached_frame_preview(frame_path)
+        if pixmap is None:
+            pixmap = QPixmap(frame_path)
         if not pixmap.isNull():
             # 미리보기 크기 제한 (너비 기준)
             target_width = 280
@@ -815,6 +870,17 @@ class MultiWindow(QMainWindow):
         else:
             self.frame_preview_label.setText("이미지 로드 실패")
 
+    def cached_frame_preview(self, frame_path):
+        """프레임 캐시에 미리보기가 있으면 QPixmap으로 반환 (없으면 None)"""
+        if "core.frame_cache" not in sys.modules:
+            return None  # 아직 사전 로드가 시작되지 않음 (PIL 로드 비용 회피)
+        from core.frame_cache import get_frame_cache
+
+        assets = get_frame_cache().peek(frame_path)
+        if assets is None or assets.preview is None:
+            return None
+        return ImageUtils.pil_rgba_to_qpixmap(assets.preview)
+
     def on_frame_changed(self, index, suppress_status=False):
         """프레임 선택이 변경되었을 때 호출"""
         self.selected_frame = self.frame_combo.currentData()
@@ -856,8 +922,8 @@ class MultiWindow(QMainWindow):
                     if reply == MessageBox.Yes:
                         self.folder_input.setReadOnly(True) # setEnabled(False) 대신 setReadOnly(True) 사용
                         self.folder_input.setText(actual_folder_name) # 실제 생성된 폴더 이름으로 업데이트
-                        # 스타일 강제 업데이트 (readOnly 상태 반영을 위해)
-                        self.folder_input.setStyleSheet(Styles.INPUT)
+                        # readOnly 상태 반영 (스타일시트 재설정 없이 polish만 수행)
+                        Styles.repolish(self.folder_input)
                         
                         self.create_folder(actual_folder_name)
                     else:
@@ -867,16 +933,25 @@ class MultiWindow(QMainWindow):
 
 
     def create_folder(self, folder_name):
-        """폴더를 즉시 생성하는 메서드"""
-        success, folder_path, status = self.folder_manager.create_folder(folder_name)
+        """폴더를 즉시 생성하는 메서드
+
+        폴더는 원자적으로 확보하며, 그 사이 다른 부스가 같은 이름을 만들었으면
+        같은 폴더 번호의 다음 이름으로 생성하고 입력 필드를 갱신합니다.
+        """
+        success, folder_path, status = self.folder_manager.claim_folder(folder_name)
         if success:
             self.created_folder = folder_path
-            if status == "created":
-                ToastMessage.show_toast(self, f"'{folder_name}' 폴더가 생성되었습니다.", type="success", anchor_widget=self.folder_input, center_x=True, position="top")
-                print(f"폴더 생성됨: {folder_path}")
-            else: # existing
-                ToastMessage.show_toast(self, f"'{folder_name}' 폴더를 사용합니다.", type="success", anchor_widget=self.folder_input, center_x=True, position="top")
-            
+            if status == "renamed":
+                actual_folder_name = os.path.basename(folder_path)
+                print(f"[DEBUG] '{folder_name}' 폴더가 이미 생성되어 '{actual_folder_name}'(으)로 변경")
+                self.folder_input.setText(actual_folder_name)
+                folder_name = actual_folder_name
+            # 세션 기록 시작 (비정상 종료 시 다음 실행에서 복구)
+            self.session = SessionManifest.open(folder_path)
+            self.settings_manager.set("active_session", folder_path)
+            ToastMessage.show_toast(self, f"'{folder_name}' 폴더가 생성되었습니다.", type="success", anchor_widget=self.folder_input, center_x=True, position="top")
+            print(f"폴더 생성됨: {folder_path}")
+
             # 폴더 열기 버튼 활성화
             self.open_folder_btn.setEnabled(True)
             
@@ -940,67 +1015,82 @@ class MultiWindow(QMainWindow):
             actual_folder_name = self.folder_manager.get_actual_folder_name(folder_number_text)
             self.create_folder(actual_folder_name)
 
-        # 파일 즉시 복사
-        try:
-            base_name = os.path.basename(file_path)
-            copy_filename = f"copy{slot_index + 1}_{base_name}"
-            target_path = os.path.join(self.created_folder, copy_filename)
-            
-            # 기존에 같은 슬롯에 파일이 있었다면 삭제 (덮어쓰기 전 정리)
-            # 하지만 슬롯 인덱스로 관리되므로 덮어쓰기가 됨.
-            # 다만 이름이 다를 수 있으므로, 기존 슬롯의 파일을 확인해서 삭제해야 함.
-            # self.selected_files[slot_index]에 이전 파일 경로가 있다면 삭제
-            if self.current_mode == "four_cut":
-                if 0 <= slot_index < 4 and self.selected_files[slot_index]:
-                    if os.path.exists(self.selected_files[slot_index]):
-                        try:
-                            os.remove(self.selected_files[slot_index])
-                            print(f"[DEBUG] 이전 파일 삭제됨: {self.selected_files[slot_index]}")
-                        except Exception as e:
-                            print(f"[ERROR] 이전 파일 삭제 실패: {e}")
-            else:
-                 if slot_index == 0 and self.selected_files[0]:
-                    if os.path.exists(self.selected_files[0]):
-                        try:
-                            os.remove(self.selected_files[0])
-                            print(f"[DEBUG] 이전 파일 삭제됨: {self.selected_files[0]}")
-                        except Exception as e:
-                            print(f"[ERROR] 이전 파일 삭제 실패: {e}")
-
-            shutil.copy(file_path, target_path)
-            print(f"[DEBUG] 파일 복사됨: {target_path}")
-            
-            # 저장할 경로는 복사된 파일의 경로
-            final_path = target_path
-
-        except Exception as e:
-            print(f"[ERROR] 파일 복사 실패: {e}")
-            MessageBox.critical(self, "오류", f"파일 복사 중 오류가 발생했습니다: {e}")
+        # 슬롯 인덱스 검증
+        max_files = 4 if self.current_mode == "four_cut" else 1
+        if not 0 <= slot_index < max_files:
+            print(f"[DEBUG] prepare_image: 잘못된 슬롯 인덱스 ({self.current_mode}): {slot_index}")
             return
 
-        # 파일 경로 저장 (슬롯 인덱스 검증)
-        if self.current_mode == "four_cut":
-            if 0 <= slot_index < 4:
-                self.selected_files[slot_index] = final_path
-                max_files = 4
-            else:
-                print(f"[DEBUG] prepare_image: 잘못된 슬롯 인덱스 (네컷): {slot_index}")
-                return
-        else:  # single_cut
-            if slot_index == 0:
-                self.selected_files[0] = final_path
-                max_files = 1
-            else:
-                print(f"[DEBUG] prepare_image: 잘못된 슬롯 인덱스 (한컷): {slot_index}")
-                return
+        base_name = os.path.basename(file_path)
+        copy_filename = f"copy{slot_index + 1}_{base_name}"
+        target_path = os.path.join(self.created_folder, copy_filename)
 
+        # 같은 슬롯의 이전 파일 삭제 (파일명이 다를 수 있으므로 덮어쓰기 전에 정리)
+        previous_file = self.selected_files[slot_index]
+        if previous_file and os.path.exists(previous_file):
+            try:
+                os.remove(previous_file)
+                print(f"[DEBUG] 이전 파일 삭제됨: {previous_file}")
+                if self.session:
+                    self.session.forget(previous_file)
+            except Exception as e:
+                print(f"[ERROR] 이전 파일 삭제 실패: {e}")
+        self.selected_files[slot_index] = None
+
+        # 파일 가져오기는 작업 스레드에서 (하드 링크 -> 커널 복사 -> 청크 복사)
+        # 작업 해상도 모드이면 모든 프레임 영역에 충분한 크기로 축소한 사본 저장
+        self.ingest_serial += 1
+        token = (slot_index, self.ingest_serial)
+        self.pending_ingest[slot_index] = (token, target_path)
+        self.update_ready_state()
+        working = None
+        if self.settings_manager.get("ingest_mode", "original") == "working":
+            working = (self.frame_manager.get_all_frames(), self.image_processor.frame_path(""),
+                       self.settings_manager.get("expand_pixels", 0))
+        self.ingest_worker.submit(token, file_path, target_path, working)
+        print(f"[DEBUG] prepare_image: 슬롯 {slot_index + 1} 가져오기 요청됨")
+
+    def on_image_ingested(self, token, result):
+        """가져오기 완료 (GUI 스레드) - 슬롯에 사본 등록"""
+        slot_index = token[0]
+        pending = self.pending_ingest.get(slot_index)
+        if pending is None or pending[0] != token:
+            # 그 사이 슬롯이 바뀌었거나 초기화됨 - 사용 중이 아닌 사본은 정리
+            in_use = result.path in self.selected_files or (pending and pending[1] == result.path)
+            if not in_use and os.path.exists(result.path):
+                os.remove(result.path)
+            print(f"[DEBUG] 지난 가져오기 결과 무시: {result.path}")
+            return
+        del self.pending_ingest[slot_index]
+
+        print(f"[DEBUG] 파일 가져옴 ({result.method}): {result.path}")
+        self.session_for(os.path.dirname(result.path)).record_input(
+            slot_index, result.path, source=result.source, mode=self.current_mode, digest=result.digest)
+        self.selected_files[slot_index] = result.path
         print(f"[DEBUG] prepare_image: 슬롯 {slot_index + 1}에 파일 저장됨")
+        self.update_ready_state()
+        self.update_frame_preview()
 
-        # 상태 업데이트
+    def on_image_ingest_failed(self, token, message):
+        slot_index = token[0]
+        pending = self.pending_ingest.get(slot_index)
+        if pending is None or pending[0] != token:
+            return
+        del self.pending_ingest[slot_index]
+        print(f"[ERROR] 파일 복사 실패: {message}")
+        self.update_ready_state()
+        MessageBox.critical(self, "오류", f"파일 복사 중 오류가 발생했습니다: {message}")
+
+    def update_ready_state(self):
+        """채워진 슬롯 수에 따라 상태 메시지와 가공하기 버튼 갱신"""
+        max_files = len(self.selected_files)
         filled_count = sum(1 for file in self.selected_files if file is not None)
         print(f"[DEBUG] prepare_image: 채워진 슬롯 수: {filled_count}/{max_files}")
 
-        if all(file is not None for file in self.selected_files):
+        if self.pending_ingest:
+            self.processing_status_card.show_info(f"사진을 가져오는 중입니다... ({filled_count}/{max_files})")
+            self.process_button.setEnabled(False)
+        elif all(file is not None for file in self.selected_files):
             self.process_button.setEnabled(True)
             if self.current_mode == "four_cut":
                 self.processing_status_card.show_success("4개 이미지가 모두 준비되었습니다. 가공하기 버튼을 누르세요.")
@@ -1013,8 +1103,6 @@ class MultiWindow(QMainWindow):
                 self.processing_status_card.show_info("이미지를 선택해주세요.")
             self.process_button.setEnabled(False)
 
-        print(f"[DEBUG] prepare_image 완료")
-
     def remove_image(self, slot_index):
         """이미지 삭제 처리"""
         print(f"[DEBUG] remove_image 호출됨: 슬롯={slot_index}")
@@ -1026,10 +1114,13 @@ class MultiWindow(QMainWindow):
                 try:
                     os.remove(file_path)
                     print(f"[DEBUG] 파일 삭제됨: {file_path}")
+                    if self.session:
+                        self.session.forget(file_path)
                 except Exception as e:
                     print(f"[ERROR] 파일 삭제 실패: {e}")
 
             self.selected_files[slot_index] = None
+            self.pending_ingest.pop(slot_index, None)
             
             # 상태 업데이트
             filled_count = sum(1 for file in self.selected_files if file is not None)
@@ -1049,9 +1140,11 @@ class MultiWindow(QMainWindow):
             
             # 가공된 이미지 초기화
             self.clear_processed_view()
+            self.update_frame_preview()
 
     def clear_processed_view(self):
-        """가공된 이미지 뷰 초기화"""
+        """가공된 이미지 뷰 초기화 (진행 중인 가공 결과는 도착 시 정리)"""
+        self.pending_render = None
         self.processed_file = None
         self.processed_label.setText("가공 후 미리보기")
         self.processed_label.setPixmap(QPixmap())
@@ -1096,6 +1189,9 @@ class MultiWindow(QMainWindow):
 
     def process_selected_image(self):
         """가공하기 버튼 - 모드별 처리"""
+        if self.pending_render:
+            return  # 가공 중
+
         # 모드별 파일 확인
         if self.current_mode == "four_cut":
             if not all(file is not None for file in self.selected_files):
@@ -1120,6 +1216,7 @@ class MultiWindow(QMainWindow):
                 actual_folder_name = self.folder_manager.get_actual_folder_name(folder_number_text)
                 self.folder_input.setText(actual_folder_name)
                 self.folder_input.setReadOnly(True)
+                Styles.repolish(self.folder_input)
             else:
                 return
 
@@ -1132,26 +1229,7 @@ class MultiWindow(QMainWindow):
             
             ToastMessage.show_toast(self, f"'{folder_name}' 폴더가 생성되었습니다.", type="success", anchor_widget=self.folder_input, center_x=True, position="top")
 
-        processed_path = self.process_and_save(self.selected_files, self.created_folder)
-
-        # 가공된 이미지 미리보기 표시
-        if processed_path and os.path.exists(processed_path):
-            print(f"[DEBUG] 가공된 이미지 로드 시작: {processed_path}")
-            self.processed_file = processed_path
-            
-            self.load_processed_preview()
-            
-            if self.processed_label.pixmap() and not self.processed_label.pixmap().isNull():
-                folder_name = os.path.basename(self.created_folder)
-                frame_name = self.frame_combo.currentText()
-                self.processing_status_card.show_success(f"{frame_name}로 가공이 성공적으로 완료되었습니다.\n'{folder_name}' 폴더에 저장되었습니다.")
-            else:
-                self.processing_status_card.show_error("가공된 이미지를 표시할 수 없습니다.")
-        else:
-            print(f"[DEBUG] 가공된 이미지 파일이 존재하지 않음: {processed_path}")
-            self.processed_label.setText("가공된 이미지를 표시할 수 없습니다")
-            self.processing_status_card.show_error("이미지 가공에 실패했습니다.")
-
+        self.process_and_save(self.selected_files, self.created_folder)
         self.process_button.setEnabled(False)
 
     def load_processed_preview(self):
@@ -1159,16 +1237,8 @@ class MultiWindow(QMainWindow):
         if not self.processed_file or not os.path.exists(self.processed_file):
             return
 
-        # 비율 설정 가져오기
-        ratio_str = self.settings_manager.get("preview_aspect_ratio", "3:2")
-        try:
-            w_ratio, h_ratio = map(int, ratio_str.split(":"))
-        except:
-            w_ratio, h_ratio = 3, 2
-            
-        target_width = 280
-        target_height = int(target_width * (h_ratio / w_ratio))
-        
+        target_width, target_height = self.preview_size()
+
         print(f"[DEBUG] 가공된 이미지 미리보기 크기: {target_width}x{target_height}")
 
         pixmap = ImageUtils.load_and_resize_with_pil(self.processed_file, target_width, target_height)
@@ -1180,66 +1250,126 @@ class MultiWindow(QMainWindow):
         else:
             self.processed_label.setText("가공된 이미지를 표시할 수 없습니다")
 
+    def preview_size(self):
+        """미리보기 라벨 크기 (너비 280, 비율은 preview_aspect_ratio 설정)"""
+        ratio_str = self.settings_manager.get("preview_aspect_ratio", "3:2")
+        try:
+            w_ratio, h_ratio = map(int, ratio_str.split(":"))
+        except:
+            w_ratio, h_ratio = 3, 2
+        return 280, int(280 * (h_ratio / w_ratio))
+
     def process_and_save(self, files, folder_path):
-        processed_image_path = None
+        """가공 시작 - 미리보기 크기 합성을 먼저 보여 주고, 원본 해상도 결과가 저장되면 교체
+
+        가공은 가공 스레드에서 진행되며 결과는 on_render_finished/on_render_failed에서 처리합니다.
+        """
+        # 기존 가공된 파일 삭제 (새로 가공하므로) - 세션 기록에 있는 결과만 삭제
+        # 이번 결과 파일과 다이제스트는 남겨 둠 - 입력이 같으면 다시 인코딩하지 않고 재사용
+        session = self.session_for(folder_path)
+        target_path = self.image_processor.output_path(files, folder_path)
+        keep = {os.path.basename(target_path)}
+        session.delete_files(roles=(SessionManifest.ROLE_OUTPUT, SessionManifest.ROLE_SIDECAR,
+                                    SessionManifest.ROLE_PRINT), keep=keep)
+
+        self.render_serial += 1
+        token = self.render_serial
+        self.pending_render = (token, target_path, folder_path, self.selected_frame)
+        self.processed_file = None
+        self.print_button.setEnabled(False)
+        self.processing_status_card.show_info("가공 중입니다...")
+
+        # 합성 영역 확장 설정 가져오기
+        expand_pixels = self.settings_manager.get("expand_pixels", 0)
+        self.render_worker.submit(token, files, self.selected_frame, folder_path, expand_pixels,
+                                  self.preview_size())
+
+    def take_pending_render(self, token, output_path=None):
+        """가공 결과가 현재 요청의 것이면 진행 중 상태를 꺼내 반환 (버려진 요청이면 None)
+
+        초기화나 프레임/사진 변경으로 버려진 요청의 결과 파일은, 같은 경로로 새 가공이 진행 중이
+        아니면 삭제합니다 (세션 기록 전이라 초기화 때 정리되지 않음).
+        """
+        pending = self.pending_render
+        if pending is not None and pending[0] == token:
+            self.pending_render = None
+            return pending
+        if output_path and os.path.exists(output_path) and not (pending and pending[1] == output_path):
+            print(f"[DEBUG] 버려진 가공 결과 정리: {output_path}")
+            try:
+                os.remove(output_path)
+            except OSError as e:
+                print(f"[ERROR] 파일 삭제 실패: {e}")
+            remove_output_digest(output_path)
+        return None
+
+    def on_render_previewed(self, token, qimage):
+        """미리보기 크기 합성 도착 (원본 해상도 결과 저장 전)"""
+        if self.pending_render is None or self.pending_render[0] != token:
+            return
+        self.processed_label.setPixmap(QPixmap.fromImage(qimage))
+        self.processed_label.setAlignment(Qt.AlignCenter)
 
-        # 기존 가공된 파일 삭제 (새로 가공하므로)
-        try:
-            old_files = [f for f in os.listdir(folder_path) if os.path.isfile(os.path.join(folder_path, f))]
-            for old_file in old_files:
-                if old_file.startswith("processed_"):
-                    old_file_path = os.path.join(folder_path, old_file)
-                    os.remove(old_file_path)
-                    print(f"이전 가공 파일 삭제됨: {old_file_path}")
-        except Exception as e:
-            print(f"파일 삭제 오류: {e}")
+    def on_render_finished(self, token, processed_path, qimage):
+        """원본 해상도 결과 저장 완료 - 결과 미리보기로 교체"""
+        pending = self.take_pending_render(token, processed_path)
+        if pending is None:
+            return
+        _, _, folder_path, frame_name = pending
 
-        try:
-            processed_image_path = self.process_image(files, folder_path)
-            if processed_image_path:
-                print(f"가공된 이미지 저장됨: {processed_image_path}")
-        except Exception as e:
-            print(f"이미지 가공 오류: {e}")
-            MessageBox.critical(self, "오류", f"이미지 가공 중 오류가 발생했습니다: {str(e)}")
+        if not processed_path:
+            MessageBox.warning(self, "경고", "처리할 이미지가 없습니다.")
+        if not processed_path or not os.path.exists(processed_path):
+            print(f"[DEBUG] 가공된 이미지 파일이 존재하지 않음: {processed_path}")
+            self.processed_label.setPixmap(QPixmap())
+            self.processed_label.setText("가공된 이미지를 표시할 수 없습니다")
+            self.processing_status_card.show_error("이미지 가공에 실패했습니다.")
+            return
 
-        # 파일 복사 로직 제거 (prepare_image에서 이미 수행됨)
+        print(f"가공된 이미지 저장됨: {processed_path}")
+        self.session_for(folder_path).record_output(processed_path, frame=frame_name)
+        self.record_recent_frame(frame_name)
 
-        return processed_image_path
+        # 가공된 이미지 미리보기 표시 (가공 스레드에서 축소해 둔 결과, 없으면 파일에서 로드)
+        self.processed_file = processed_path
+        if qimage is not None and not qimage.isNull():
+            self.processed_label.setPixmap(QPixmap.fromImage(qimage))
+            self.processed_label.setAlignment(Qt.AlignCenter)
+            self.print_button.setEnabled(True)
+        else:
+            self.load_processed_preview()
 
-    def process_image(self, files, folder_path):
-        try:
-            # 합성 영역 확장 설정 가져오기
-            expand_pixels = self.settings_manager.get("expand_pixels", 0)
-
-            processed_path = self.image_processor.process_images(
-                files, 
-                self.selected_frame, 
-                self.frame_manager, 
-                folder_path,
-                expand_pixels=expand_pixels
-            )
-            
-            if processed_path:
-                if self.selected_frame != "none":
-                    self.processing_status_card.show_success(f"이미지가 '{self.selected_frame}' 프레임으로 가공되었습니다.")
-                return processed_path
-            else:
-                MessageBox.warning(self, "경고", "처리할 이미지가 없습니다.")
-                return None
+        if self.processed_label.pixmap() and not self.processed_label.pixmap().isNull():
+            folder_name = os.path.basename(folder_path)
+            frame_text = self.frame_combo.currentText()
+            self.processing_status_card.show_success(f"{frame_text}로 가공이 성공적으로 완료되었습니다.\n'{folder_name}' 폴더에 저장되었습니다.")
+        else:
+            self.processing_status_card.show_error("가공된 이미지를 표시할 수 없습니다.")
 
-        except Exception as e:
-            error_msg = f"이미지 가공 중 오류가 발생했습니다: {str(e)}"
-            print(error_msg)
-            MessageBox.critical(self, "오류", error_msg)
-            
-            # 오류 발생 시 원본 복사 시도 (기존 로직 유지)
-            base_name = os.path.basename(files[0]) if files[0] else "image.jpg"
-            processed_image_path = os.path.join(folder_path, "processed_" + base_name)
-            if files[0]:
+    def on_render_failed(self, token, message):
+        """가공 실패 - 원본 이미지를 결과로 사용 (기존 동작 유지)"""
+        pending = self.take_pending_render(token)
+        if pending is None:
+            return
+        _, processed_image_path, folder_path, _ = pending
+
+        error_msg = f"이미지 가공 중 오류가 발생했습니다: {message}"
+        print(error_msg)
+        MessageBox.critical(self, "오류", error_msg)
+
+        # 오류 발생 시 원본 복사 시도
+        files = self.selected_files
+        if files and files[0]:
+            try:
                 shutil.copy(files[0], processed_image_path)
-            
-            self.processing_status_card.show_error("오류로 인해 원본 이미지가 그대로 사용되었습니다.")
-            return processed_image_path
+                remove_output_digest(processed_image_path)  # 원본 복사본은 가공 결과로 재사용하지 않음
+                self.session_for(folder_path).record_output(processed_image_path)
+                self.processed_file = processed_image_path
+                self.load_processed_preview()
+            except OSError as e:
+                print(f"[ERROR] 원본 복사 실패: {e}")
+
+        self.processing_status_card.show_error("오류로 인해 원본 이미지가 그대로 사용되었습니다.")
 
     def print_image(self):
         """인쇄 기능 - 설정에 따라 분기"""
@@ -1251,11 +1381,19 @@ class MultiWindow(QMainWindow):
 
         if direct_print:
             print(f"[DEBUG] 인쇄 요청: {self.processed_file}")
-            success = self.print_manager.print_image(self.processed_file, self)
-            
-            if success:
-                MessageBox.information(self, "성공", "이미지 인쇄가 시작되었습니다.")
-                print(f"[DEBUG] 인쇄 작업 시작됨")
+            self.print_manager.set_backend(self.settings_manager.get("print_backend", "native"),
+                                           output_dir=self.settings_manager.get("print_output_dir"),
+                                           dpi=self.settings_manager.get("print_file_dpi"))
+            job = self.print_manager.print_image(self.processed_file, self,
+                                                 layout=self.settings_manager.get("print_layout", "1up"),
+                                                 collect=self.settings_manager.get("print_collect", False))
+
+            if job:
+                # 인쇄는 대기열에서 진행 - 기다리지 않고 다음 세션을 시작할 수 있음
+                message = (f"모아서 인쇄합니다. (#{job.id}: {job.describe()})" if job.status == STATUS_COLLECTING
+                           else f"인쇄 대기열에 추가되었습니다. (#{job.id})")
+                ToastMessage.show_toast(self, message, type="success", anchor_widget=self.print_button)
+                print(f"[DEBUG] 인쇄 작업 #{job.id} 대기열에 추가됨")
         else:
             # 사진 보기 (기본 뷰어 실행)
             if os.path.exists(self.processed_file):
@@ -1263,15 +1401,36 @@ class MultiWindow(QMainWindow):
             else:
                 MessageBox.warning(self, "오류", "파일을 찾을 수 없습니다.")
 
+    def on_print_job_changed(self, job):
+        """인쇄 작업 상태 변경 (GUI 스레드) - 새 인쇄 래스터를 해당 세션 기록에 추가"""
+        print(f"[DEBUG] 인쇄 작업 #{job.id}: {job.status}")
+        if job.status == STATUS_FAILED:
+            ToastMessage.show_toast(self, f"인쇄 작업 #{job.id} 실패: {job.error}", type="error",
+                                    anchor_widget=self.print_button)
+        if job.status != STATUS_DONE:
+            return
+        if job.sink.output_path:
+            ToastMessage.show_toast(self, f"인쇄 파일 저장: {os.path.basename(job.sink.output_path)}",
+                                    type="success", anchor_widget=self.print_button)
+        # 인쇄 중 다음 세션으로 넘어갔을 수 있으므로 결과 파일이 있는 세션에 기록 (다시 활성화하지 않음)
+        for raster_path, image_path in job.new_rasters:
+            folder = os.path.dirname(image_path)
+            if self.session and os.path.abspath(self.session.folder) == os.path.abspath(folder):
+                manifest = self.session
+            else:
+                manifest = SessionManifest.load(folder)
+            if manifest is not None:
+                manifest.record_print(raster_path, image_path)
+
     def update_print_button_ui(self):
         """설정에 따라 인쇄 버튼 UI 업데이트"""
         direct_print = self.settings_manager.get("direct_print", True)
         if direct_print:
             self.print_button.setText("🖨 인쇄")
-            self.print_button.setStyleSheet(Styles.BTN_PRIMARY)
+            Styles.set_state(self.print_button, "primary", name="variant")
         else:
             self.print_button.setText("👁 사진 보기")
-            self.print_button.setStyleSheet(Styles.BTN_SECONDARY)
+            Styles.set_state(self.print_button, "secondary", name="variant")
 
 
 
@@ -1293,7 +1452,7 @@ class MultiWindow(QMainWindow):
 
     def reset_image(self):
         """사진 초기화 버튼을 눌렀을 때 실행되는 메서드"""
-        if not any(file is not None for file in self.selected_files):
+        if not any(file is not None for file in self.selected_files) and not self.pending_ingest:
             return
 
         reply = MessageBox.question(self, '사진 초기화 확인',
@@ -1302,23 +1461,19 @@ class MultiWindow(QMainWindow):
         if reply == MessageBox.No:
             return
 
+        # 세션 기록에 있는 파일(입력 사본, 가공 결과)만 삭제 - 폴더의 다른 파일은 유지
         if self.created_folder and os.path.exists(self.created_folder):
-            try:
-                files = os.listdir(self.created_folder)
-                for file in files:
-                    if file.startswith("copy") or file.startswith("processed_"):
-                        file_path = os.path.join(self.created_folder, file)
-                        os.remove(file_path)
-                        print(f"파일 삭제됨: {file_path}")
-            except Exception as e:
-                print(f"파일 삭제 오류: {e}")
+            self.session_for(self.created_folder).delete_files()
 
-        # 선택된 파일들과 가공된 파일 정보 초기화
+        # 선택된 파일들과 가공된 파일 정보 초기화 (진행 중인 가져오기/가공 결과는 도착 시 정리)
+        self.pending_ingest.clear()
+        self.pending_render = None
         self.selected_files = [None, None, None, None]
         self.processed_file = None
 
-        # 드롭 영역 초기화
+        # 드롭 영역 및 실시간 미리보기 초기화
         self.drop_area.reset_zones()
+        self.update_frame_preview()
 
         # 가공된 이미지 미리보기 초기화
         self.processed_label.setText("가공 후 미리보기")
@@ -1340,27 +1495,21 @@ class MultiWindow(QMainWindow):
 
     def reset_work_without_folder(self):
         """폴더 정보는 유지하고 작업만 초기화"""
-        # 파일 정리 (copy 및 processed 파일 삭제)
+        # 파일 정리 (copy 및 processed 파일 삭제) - 세션 기록에 있는 파일만, 폴더의 다른 파일은 유지
         if self.created_folder and os.path.exists(self.created_folder):
-            try:
-                files = os.listdir(self.created_folder)
-                for file in files:
-                    if file.startswith("copy") or file.startswith("processed_"):
-                        file_path = os.path.join(self.created_folder, file)
-                        os.remove(file_path)
-                        print(f"파일 삭제됨: {file_path}")
-            except Exception as e:
-                print(f"파일 삭제 오류: {e}")
+            self.session_for(self.created_folder).delete_files()
 
-        # 선택된 파일들과 가공된 파일 정보 초기화
+        # 선택된 파일들과 가공된 파일 정보 초기화 (진행 중인 가져오기 결과는 도착 시 정리)
+        self.pending_ingest.clear()
         if self.current_mode == "four_cut":
             self.selected_files = [None, None, None, None]
         else:
             self.selected_files = [None]
         self.processed_file = None
 
-        # 드롭 영역 초기화
+        # 드롭 영역 및 실시간 미리보기 초기화
         self.drop_area.reset_zones()
+        self.update_frame_preview()
 
         # 가공된 이미지 초기화 (helper 사용)
         self.clear_processed_view()
@@ -1399,9 +1548,7 @@ class MultiWindow(QMainWindow):
         # 폴더 입력 필드 다시 활성화
         # 폴더 입력 필드 다시 활성화
         self.folder_input.setReadOnly(False)
-        self.folder_input.setStyleSheet(Styles.INPUT)
-
-        self.folder_input.setStyleSheet(Styles.INPUT)
+        Styles.repolish(self.folder_input)
 
         # self.folder_status_card.clear()
 
@@ -1424,11 +1571,18 @@ class MultiWindow(QMainWindow):
         self.process_button.setEnabled(False)
         self.print_button.setEnabled(False)
 
-        # 내부 변수 초기화
+        # 내부 변수 초기화 (진행 중인 가공 결과는 도착 시 정리)
+        self.pending_render = None
         self.selected_files = [None, None, None, None]  # 네컷 모드 기본값
         self.processed_file = None
         self.created_folder = None
         self.previous_folder_number = None
+
+        # 세션 종료 (파일은 유지, 다음 실행 시 복구 대상 아님)
+        if self.session:
+            self.session.close()
+            self.session = None
+        self.settings_manager.set("active_session", None)
         self.is_first_check = True
 
         # 프레임 선택 초기화
@@ -0,0 +1,110 @@
+"""
+인쇄 백엔드 모듈
+인쇄 작업이 그려질 대상(sink)을 만듭니다.
+
+- native: 인쇄 대화상자에서 고른 프린터 (기존 동작)
+- pdf:    대화상자 없이 PDF 파일로 저장 (QPrinter.PdfFormat)
+- png:    대화상자 없이 용지 크기의 PNG 래스터로 저장
+
+파일 백엔드는 프린터 없이 인쇄 경로(래스터화, 배치, 스풀링)를 그대로 거치므로, offscreen QPA로
+인쇄 지연 시간과 출력 결과를 자동 테스트에서 측정할 수 있습니다 (ui.print_cli 참고).
+
+sink는 작업마다 하나이며 begin()으로 QPaintDevice를 얻어 그린 뒤 finish()로 마무리합니다.
+begin()/finish()는 인쇄 대기열 스레드에서 호출되고, 다시 시도하면 장치를 새로 만듭니다.
+"""
+
+import itertools
+import os
+import time
+
+from PyQt5.QtCore import QSizeF
+from PyQt5.QtGui import QImage, QPageSize
+
+BACKEND_NATIVE = "native"
+BACKEND_PDF = "pdf"
+BACKEND_PNG = "png"
+PRINT_BACKENDS = (BACKEND_NATIVE, BACKEND_PDF, BACKEND_PNG)
+
+# 파일 백엔드 기본 용지 (4x6인치 사진 용지)와 해상도
+DEFAULT_PAGE_SIZE_INCH = (4.0, 6.0)
+DEFAULT_FILE_DPI = 300
+DEFAULT_OUTPUT_DIR = "prints"
+
+_file_serial = itertools.count(1)
+
+
+def output_file_path(output_dir, backend):
+    """파일 백엔드 출력 경로 (print_<날짜_시각>_<번호>.pdf/.png)"""
+    name = f"print_{time.strftime('%Y%m%d_%H%M%S')}_{next(_file_serial):03d}.{backend}"
+    return os.path.join(output_dir, name)
+
+
+class NativeSink:
+    """인쇄 대화상자에서 설정한 QPrinter"""
+    output_path = None
+
+    def __init__(self, printer):
+        self.printer = printer
+
+    def begin(self):
+        return self.printer
+
+    def finish(self, device):
+        pass
+
+
+class PdfSink:
+    """PDF 파일 (QPrinter.PdfFormat, 여백 없음)"""
+
+    def __init__(self, output_path, page_size_inch=DEFAULT_PAGE_SIZE_INCH, dpi=DEFAULT_FILE_DPI):
+        self.output_path = output_path
+        self.page_size_inch = page_size_inch
+        self.dpi = dpi
+
+    def begin(self):
+        from PyQt5.QtPrintSupport import QPrinter
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.output_path)), exist_ok=True)
+        printer = QPrinter(QPrinter.HighResolution)
+        printer.setOutputFormat(QPrinter.PdfFormat)
+        printer.setOutputFileName(self.output_path)
+        printer.setResolution(self.dpi)
+        printer.setPageSize(QPageSize(QSizeF(*self.page_size_inch), QPageSize.Inch))
+        printer.setFullPage(True)
+        return printer
+
+    def finish(self, device):
+        pass  # painter.end()에서 파일이 완성됨
+
+
+class PngSink:
+    """용지 크기(장치 픽셀 = 인치 x dpi)의 PNG 래스터"""
+
+    def __init__(self, output_path, page_size_inch=DEFAULT_PAGE_SIZE_INCH, dpi=DEFAULT_FILE_DPI):
+        self.output_path = output_path
+        self.page_size_inch = page_size_inch
+        self.dpi = dpi
+
+    def begin(self):
+        width = round(self.page_size_inch[0] * self.dpi)
+        height = round(self.page_size_inch[1] * self.dpi)
+        image = QImage(width, height, QImage.Format_RGB32)
+        image.fill(0xFFFFFFFF)
+        dots_per_meter = round(self.dpi / 0.0254)
+        image.setDotsPerMeterX(dots_per_meter)
+        image.setDotsPerMeterY(dots_per_meter)
+        return image
+
+    def finish(self, device):
+        os.makedirs(os.path.dirname(os.path.abspath(self.output_path)), exist_ok=True)
+        if not device.save(self.output_path, "PNG"):
+            raise RuntimeError(f"PNG 저장 실패: {self.output_path}")
+
+
+def create_file_sink(backend, output_path, page_size_inch=DEFAULT_PAGE_SIZE_INCH, dpi=DEFAULT_FILE_DPI):
+    """파일 백엔드 sink (backend: pdf/png)"""
+    if backend == BACKEND_PDF:
+        return PdfSink(output_path, page_size_inch, dpi)
+    if backend == BACKEND_PNG:
+        return PngSink(output_path, page_size_inch, dpi)
+    raise ValueError(f"파일 인쇄 백엔드가 아님: {backend} (사용 가능: {BACKEND_PDF}, {BACKEND_PNG})")
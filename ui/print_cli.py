@@ -0,0 +1,119 @@
+"""
+명령줄 인쇄 도구
+프린터와 인쇄 대화상자 없이 가공 결과를 PDF/PNG 파일로 인쇄합니다 (ui.print_backends).
+GUI와 같은 인쇄 경로(인쇄 래스터, 배치, 인쇄 대기열 스레드)를 거치므로 인쇄 지연 시간 측정과
+출력 확인에 사용합니다. 화면이 없으면 offscreen QPA 플랫폼으로 실행됩니다.
+
+사용법:
+    python -m ui.print_cli --backend pdf processed_a.png processed_b.png
+    python -m ui.print_cli --backend png --layout 2up --collect -o out/ a.png b.png c.png
+    python -m ui.print_cli --backend pdf --dpi 600 --page-size 6x4 a.png
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from core.imposition import DEFAULT_LAYOUT, IMPOSITION_LAYOUTS
+
+from .print_backends import BACKEND_PDF, BACKEND_PNG, DEFAULT_FILE_DPI, DEFAULT_OUTPUT_DIR, DEFAULT_PAGE_SIZE_INCH
+
+
+def _page_size(text):
+    try:
+        width, height = (float(v) for v in text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"용지 크기는 <가로>x<세로> 인치 형식이어야 합니다: {text}")
+    if width <= 0 or height <= 0:
+        raise argparse.ArgumentTypeError(f"용지 크기가 올바르지 않습니다: {text}")
+    return width, height
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m ui.print_cli", description="Bittara Photo 파일 인쇄 도구")
+    parser.add_argument("images", nargs="+", help="인쇄할 가공 결과 경로")
+    parser.add_argument("--backend", default=BACKEND_PDF, choices=[BACKEND_PDF, BACKEND_PNG],
+                        help=f"출력 형식 (기본: {BACKEND_PDF})")
+    parser.add_argument("-o", "--output-dir", default=DEFAULT_OUTPUT_DIR,
+                        help=f"출력 폴더 (기본: {DEFAULT_OUTPUT_DIR})")
+    parser.add_argument("--layout", default=DEFAULT_LAYOUT, choices=sorted(IMPOSITION_LAYOUTS),
+                        help=f"용지 한 장당 배치 (기본: {DEFAULT_LAYOUT})")
+    parser.add_argument("--collect", action="store_true",
+                        help="결과마다 반복하지 않고 여러 결과를 모아 한 장에 배치")
+    parser.add_argument("--dpi", type=int, default=DEFAULT_FILE_DPI, help=f"출력 해상도 (기본: {DEFAULT_FILE_DPI})")
+    parser.add_argument("--page-size", type=_page_size, default=DEFAULT_PAGE_SIZE_INCH,
+                        help="용지 크기 (인치, 기본: 4x6)")
+    return parser
+
+
+def run(args):
+    """인쇄 작업을 대기열에 넣고 모두 끝날 때까지 대기 - 작업별 지연 시간 출력
+
+    Returns: 종료 코드 (실패한 작업이 있으면 1)
+    """
+    from PyQt5.QtCore import QEventLoop
+
+    from .print_manager import PrintManager
+    from .print_queue import STATUS_DONE, STATUS_FAILED
+
+    manager = PrintManager(args.backend, args.output_dir, args.dpi, args.page_size)
+    submitted = {}  # job id -> 대기열 추가 시각
+    finished = []
+    loop = QEventLoop()
+
+    def on_job_changed(job):
+        if job.status not in (STATUS_DONE, STATUS_FAILED):
+            return
+        finished.append(job)
+        latency_ms = (time.perf_counter() - submitted[job.id]) * 1000
+        if job.status == STATUS_DONE:
+            print(f"[print] 완료 #{job.id} {job.sink.output_path} ({latency_ms:.1f} ms)")
+        else:
+            print(f"[print] 실패 #{job.id}: {job.error}", file=sys.stderr)
+        if len(finished) == len(submitted):
+            loop.quit()
+
+    manager.queue.job_changed.connect(on_job_changed)
+
+    started = time.perf_counter()
+    for image_path in args.images:
+        if args.collect:
+            # 이미 모으는 중이면 그 작업의 출력 파일에 추가
+            sink = None if manager.queue.collecting(args.layout) else manager.create_sink(None)
+            job = manager.queue.collect(image_path, sink, args.layout)
+        else:
+            job = manager.queue.submit([image_path], manager.create_sink(None), args.layout)
+        submitted.setdefault(job.id, time.perf_counter())
+    # 배치 수를 채우지 못한 마지막 모음도 인쇄
+    collecting = manager.queue.collecting(args.layout)
+    if collecting is not None:
+        manager.queue.flush(collecting)
+
+    if len(finished) < len(submitted):
+        loop.exec_()
+    manager.queue.stop()
+
+    failed = sum(1 for job in finished if job.status == STATUS_FAILED)
+    wall_ms = (time.perf_counter() - started) * 1000
+    print(f"[print] 작업 {len(finished)}개 (실패 {failed}개), 전체 {wall_ms:.1f} ms")
+    return 1 if failed else 0
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    missing = [path for path in args.images if not os.path.exists(path)]
+    if missing:
+        print(f"[print] 파일 없음: {', '.join(missing)}", file=sys.stderr)
+        return 2
+
+    # 화면 없이 실행 (QPrinter/QImage 그리기에 QGuiApplication만 필요)
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtGui import QGuiApplication
+
+    app = QGuiApplication.instance() or QGuiApplication(sys.argv[:1])  # 종료까지 유지
+    return run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
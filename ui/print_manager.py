@@ -0,0 +1,147 @@
+"""
+PrintManager 모듈
+QtPrintSupport를 이용한 이미지 인쇄를 담당합니다. 인쇄 대화상자 이후의 래스터화와 스풀링은
+인쇄 대기열(PrintQueue) 스레드에서 진행됩니다.
+이미지는 프린터 장치 픽셀 크기로 한 번만 리샘플링해 그립니다 (core.print_render).
+인쇄 대상은 백엔드(ui.print_backends)로 고르며, pdf/png 백엔드는 대화상자 없이 파일로 저장합니다.
+QtPrintSupport와 PIL은 시작 속도를 위해 첫 인쇄 시 로드합니다.
+"""
+
+import os
+from PyQt5.QtGui import QImage, QPainter, QPen
+from PyQt5.QtCore import Qt, QPoint, QRect
+from core.imposition import DEFAULT_LAYOUT
+from .message_box import MessageBox
+from .print_backends import (BACKEND_NATIVE, DEFAULT_FILE_DPI, DEFAULT_OUTPUT_DIR, DEFAULT_PAGE_SIZE_INCH,
+                             PRINT_BACKENDS, NativeSink, create_file_sink, output_file_path)
+from .print_queue import PrintQueue
+
+
+class PrintManager:
+    """인쇄 관리 클래스 (인쇄는 대기열 스레드에서 진행)"""
+    
+    def __init__(self, backend=BACKEND_NATIVE, output_dir=DEFAULT_OUTPUT_DIR, dpi=DEFAULT_FILE_DPI,
+                 page_size_inch=DEFAULT_PAGE_SIZE_INCH):
+        self.queue = PrintQueue(self)
+        self.backend = BACKEND_NATIVE
+        self.output_dir = output_dir
+        self.dpi = dpi
+        self.page_size_inch = page_size_inch  # 파일 백엔드 용지 크기
+        self.set_backend(backend)
+
+    def set_backend(self, backend, output_dir=None, dpi=None):
+        """인쇄 백엔드 변경 (다음 작업부터 적용 - native/pdf/png)"""
+        if backend not in PRINT_BACKENDS:
+            print(f"[WARNING] 알 수 없는 인쇄 백엔드: {backend} (native 사용)")
+            backend = BACKEND_NATIVE
+        self.backend = backend
+        if output_dir:
+            self.output_dir = output_dir
+        if dpi:
+            self.dpi = dpi
+
+    def create_sink(self, parent_widget):
+        """현재 백엔드의 인쇄 대상 - native는 인쇄 대화상자를 띄움 (취소하면 None)"""
+        if self.backend != BACKEND_NATIVE:
+            return create_file_sink(self.backend, output_file_path(self.output_dir, self.backend),
+                                    self.page_size_inch, self.dpi)
+
+        from PyQt5.QtPrintSupport import QPrinter, QPrintDialog
+
+        # 프린터 설정
+        printer = QPrinter(QPrinter.HighResolution)
+        printer.setOutputFormat(QPrinter.NativeFormat)
+
+        print_dialog = QPrintDialog(printer, parent_widget)
+        print_dialog.setWindowTitle("이미지 인쇄")
+
+        if print_dialog.exec_() == QPrintDialog.Accepted:
+            return NativeSink(printer)
+        return None
+
+    def print_image(self, image_path, parent_widget, layout=DEFAULT_LAYOUT, collect=False):
+        """인쇄 대상을 정하고(native는 인쇄 대화상자) 작업을 인쇄 대기열에 추가
+
+        - layout: 인쇄 배치 (core.imposition.IMPOSITION_LAYOUTS, 예: "2up")
+        - collect: True면 같은 결과를 반복하지 않고 여러 세션의 결과를 모아 한 장에 인쇄
+                   (배치 수만큼 모이면 인쇄, 프린터 설정은 모으기 시작한 작업의 것을 사용)
+
+        Returns: PrintJob (취소하거나 오류면 None) - 인쇄 완료를 기다리지 않음
+        """
+        if not image_path or not os.path.exists(image_path):
+            MessageBox.warning(parent_widget, "경고", "인쇄할 이미지가 없습니다.")
+            return None
+
+        if collect and self.queue.collecting(layout):
+            return self.queue.collect(image_path, None, layout)
+
+        try:
+            sink = self.create_sink(parent_widget)
+            if sink is None:
+                return None
+            if collect:
+                return self.queue.collect(image_path, sink, layout)
+            return self.queue.submit([image_path], sink, layout)
+
+        except Exception as e:
+            print(f"[ERROR] 인쇄 중 오류: {e}")
+            MessageBox.critical(parent_widget, "오류", f"인쇄 중 오류가 발생했습니다: {e}")
+            return None
+
+    def render_to_sink(self, sink, image_paths, layout=DEFAULT_LAYOUT, repeat=False):
+        """인쇄 대상(sink)에 그리고 마무리 (파일 백엔드는 저장) - 인쇄 대기열 스레드에서 호출
+
+        Returns: render_to_printer와 같음
+        """
+        device = sink.begin()
+        rasters = self.render_to_printer(device, image_paths, layout, repeat=repeat)
+        if rasters is not None:
+            sink.finish(device)
+        return rasters
+
+    def render_to_printer(self, printer, image_paths, layout=DEFAULT_LAYOUT, repeat=False):
+        """결과 이미지를 인쇄 배치(layout)에 따라 용지에 그림
+
+        각 결과는 셀의 장치 픽셀 크기로 만든 래스터를 1:1로 그립니다 (추가 축소 없음). 래스터는 세션
+        폴더의 .print/에 캐시되어 다시 인쇄하면 디코딩 없이 바로 그립니다. repeat이면 결과 하나를 배치 수만큼
+        반복하고(모은 작업은 모인 셀만 채움), N개 배치에는 재단선을 함께 그립니다.
+        printer는 QPrinter 외의 QPaintDevice(QImage 등)여도 됩니다.
+
+        Returns: {결과 이미지 경로: 그린 PrintRaster} (인쇄를 시작할 수 없으면 None)
+        """
+        from core.imposition import layout_count, plan_page
+        from core.print_render import image_size, render_print_raster
+
+        image_paths = list(image_paths)
+        count = layout_count(layout)
+        if repeat and len(image_paths) == 1:
+            image_paths *= count
+
+        painter = QPainter()
+        if not painter.begin(printer):
+            return None
+        rasters = {}
+        try:
+            rect = painter.viewport()
+            plan = plan_page((rect.width(), rect.height()), image_size(image_paths[0]), count)
+
+            # raster.data는 painter.end()까지 참조 유지 (QImage가 버퍼를 복사하지 않음)
+            for (x, y, cell_w, cell_h), image_path in zip(plan.cells, image_paths):
+                raster = rasters.get(image_path)
+                if raster is None:
+                    raster = rasters[image_path] = render_print_raster(image_path, (cell_w, cell_h))
+                qimage = QImage(raster.data, raster.width, raster.height, raster.bytes_per_line,
+                                QImage.Format_RGB888)
+                target_w, target_h = raster.target_size((cell_w, cell_h))
+                if (target_w, target_h) == (raster.width, raster.height):
+                    painter.drawImage(QPoint(rect.x() + x, rect.y() + y), qimage)
+                else:
+                    painter.drawImage(QRect(rect.x() + x, rect.y() + y, target_w, target_h), qimage)
+
+            if plan.cut_marks:
+                painter.setPen(QPen(Qt.black, max(1, rect.width() // 1000)))
+                for x1, y1, x2, y2 in plan.cut_marks:
+                    painter.drawLine(rect.x() + x1, rect.y() + y1, rect.x() + x2, rect.y() + y2)
+        finally:
+            painter.end()
+        return rasters
@@ -0,0 +1,247 @@
+"""
+PrintQueue 모듈
+인쇄 작업을 작업 스레드에서 래스터화/스풀링하여, 인쇄가 끝나기를 기다리지 않고
+다음 세션을 바로 시작할 수 있게 합니다. 작업별 상태(대기 중, 인쇄 중, 완료, 실패)를
+패널에 표시하고 실패한 작업은 다시 시도할 수 있습니다.
+
+N개 배치(core.imposition)를 쓰면 한 작업이 용지 한 장이며, 같은 결과를 반복하거나
+여러 세션의 결과를 모아(모으는 중) 배치 수가 차면 한 번에 인쇄합니다.
+
+QPrinter에 대한 QPainter 그리기는 GUI 스레드가 아니어도 되므로, 인쇄 대화상자만
+GUI 스레드에서 띄우고 설정된 인쇄 대상(ui.print_backends의 sink)을 작업과 함께 넘깁니다.
+"""
+
+import itertools
+import os
+import queue
+import threading
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtWidgets import QFrame, QHBoxLayout, QLabel, QListWidget, QListWidgetItem, QPushButton, QVBoxLayout
+
+from core.imposition import DEFAULT_LAYOUT, layout_count
+
+from .styles import Styles
+
+STATUS_COLLECTING = "collecting"
+STATUS_QUEUED = "queued"
+STATUS_SPOOLING = "spooling"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+STATUS_LABELS = {
+    STATUS_COLLECTING: "모으는 중",
+    STATUS_QUEUED: "대기 중",
+    STATUS_SPOOLING: "인쇄 중",
+    STATUS_DONE: "완료",
+    STATUS_FAILED: "실패",
+}
+
+
+@dataclass
+class PrintJob:
+    """인쇄 작업 하나 (용지 한 장 - 인쇄 배치에 따라 결과 여러 개)"""
+    id: int
+    image_paths: List[str]
+    sink: object                       # 인쇄 대상 (ui.print_backends - 프린터 또는 PDF/PNG 파일)
+    layout: str = DEFAULT_LAYOUT       # core.imposition.IMPOSITION_LAYOUTS
+    status: str = STATUS_QUEUED
+    error: Optional[str] = None
+    attempts: int = 0
+    repeat: bool = False               # 결과 하나를 배치 수만큼 반복 (submit으로 넣은 단일 결과만, 모은 작업은 반복 안 함)
+    # 새로 만든 인쇄 래스터 [(래스터 경로, 결과 이미지 경로), ...] (세션 기록용, 캐시 적중은 제외)
+    new_rasters: List[Tuple[str, str]] = field(default_factory=list)
+
+    @property
+    def name(self):
+        name = os.path.basename(self.image_paths[0])
+        if len(self.image_paths) > 1:
+            name += f" 외 {len(self.image_paths) - 1}개"
+        return name
+
+    def describe(self):
+        text = f"#{self.id} {self.name}"
+        if self.layout != DEFAULT_LAYOUT:
+            text += f" [{self.layout}]"
+        if self.status == STATUS_COLLECTING:
+            text += f" ({len(self.image_paths)}/{layout_count(self.layout)})"
+        text += f" - {STATUS_LABELS[self.status]}"
+        if self.status == STATUS_DONE and self.sink.output_path:
+            text += f" ({os.path.basename(self.sink.output_path)})"
+        if self.status == STATUS_FAILED and self.error:
+            text += f" ({self.error})"
+        return text
+
+
+class PrintQueue(QThread):
+    """인쇄 작업 큐를 순서대로 처리하는 스레드 (큐가 비면 종료, 다음 작업 시 다시 시작)"""
+
+    job_changed = pyqtSignal(object)  # PrintJob (상태가 바뀔 때마다)
+
+    def __init__(self, print_manager, parent=None):
+        super().__init__(parent)
+        self.print_manager = print_manager
+        self.jobs = []
+        self._ids = itertools.count(1)
+        self._tasks = queue.Queue()
+        self._lock = threading.Lock()
+        self._active = False
+
+    def submit(self, image_paths, sink, layout=DEFAULT_LAYOUT):
+        """인쇄 작업 추가 - 바로 반환하고 결과는 job_changed 시그널로 전달
+
+        결과가 하나뿐이면 용지를 채우도록 배치 수만큼 반복합니다.
+        """
+        image_paths = list(image_paths)
+        job = PrintJob(next(self._ids), image_paths, sink, layout, repeat=len(image_paths) == 1)
+        self.jobs.append(job)
+        self._enqueue(job)
+        return job
+
+    def collecting(self, layout):
+        """결과를 모으는 중인 작업 (없으면 None)"""
+        return next((job for job in self.jobs
+                     if job.status == STATUS_COLLECTING and job.layout == layout), None)
+
+    def collect(self, image_path, sink, layout):
+        """여러 세션의 결과를 모아 한 장으로 인쇄 - 배치 수만큼 모이면 대기열에 추가
+
+        sink는 새로 모으기 시작할 때만 사용합니다 (이미 모으는 중이면 그 작업의 인쇄 대상).
+        """
+        job = self.collecting(layout)
+        if job is None:
+            job = PrintJob(next(self._ids), [], sink, layout, status=STATUS_COLLECTING)
+            self.jobs.append(job)
+        job.image_paths.append(image_path)
+        if len(job.image_paths) >= layout_count(layout):
+            self.flush(job)
+        else:
+            self.job_changed.emit(job)
+        return job
+
+    def flush(self, job):
+        """모으는 중인 작업을 지금까지 모인 결과로 인쇄"""
+        if job.status != STATUS_COLLECTING or not job.image_paths:
+            return
+        job.status = STATUS_QUEUED
+        self._enqueue(job)
+
+    def retry(self, job):
+        """실패한 작업 다시 시도"""
+        if job.status != STATUS_FAILED:
+            return
+        job.status = STATUS_QUEUED
+        job.error = None
+        self._enqueue(job)
+
+    def _enqueue(self, job):
+        self.job_changed.emit(job)
+        with self._lock:
+            self._tasks.put(job)
+            if self._active:
+                return
+            self._active = True
+        # 이전 실행이 막 끝나는 중이면 완전히 종료된 뒤 다시 시작
+        self.wait()
+        self.start()
+
+    def pending_count(self):
+        return sum(1 for job in self.jobs if job.status in (STATUS_QUEUED, STATUS_SPOOLING))
+
+    def stop(self):
+        """남은 작업을 버리고 진행 중인 인쇄가 끝날 때까지 대기"""
+        with self._lock:
+            while not self._tasks.empty():
+                self._tasks.get_nowait()
+        self.wait()
+
+    def run(self):
+        while True:
+            with self._lock:
+                if self._tasks.empty():
+                    self._active = False
+                    return
+                job = self._tasks.get_nowait()
+
+            job.status = STATUS_SPOOLING
+            job.attempts += 1
+            self.job_changed.emit(job)
+            try:
+                rasters = self.print_manager.render_to_sink(job.sink, job.image_paths, job.layout, repeat=job.repeat)
+                if rasters is None:
+                    raise RuntimeError("인쇄 작업을 시작할 수 없습니다.")
+                job.new_rasters = [(raster.path, image_path) for image_path, raster in rasters.items()
+                                   if not raster.cached]
+                job.status = STATUS_DONE
+            except Exception as e:
+                print(f"[ERROR] 인쇄 작업 #{job.id} 실패: {e}")
+                job.status = STATUS_FAILED
+                job.error = str(e)
+            self.job_changed.emit(job)
+
+
+class PrintQueuePanel(QFrame):
+    """인쇄 작업 상태 목록 (작업이 생기면 표시, 실패한 작업 다시 시도, 모으는 중인 작업 바로 인쇄)"""
+
+    def __init__(self, print_queue, parent=None):
+        super().__init__(parent)
+        self.print_queue = print_queue
+        self._items = {}  # job id -> QListWidgetItem
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 4, 0, 0)
+
+        header = QHBoxLayout()
+        title = QLabel("인쇄 대기열")
+        title.setStyleSheet(Styles.LABEL_TITLE)
+        header.addWidget(title)
+        header.addStretch()
+        self.retry_button = QPushButton("다시 시도")
+        self.retry_button.setStyleSheet(Styles.BTN_SECONDARY)
+        self.retry_button.setEnabled(False)
+        self.retry_button.clicked.connect(self.retry_selected)
+        header.addWidget(self.retry_button)
+        layout.addLayout(header)
+
+        self.list_widget = QListWidget()
+        self.list_widget.setStyleSheet(Styles.LIST_WIDGET)
+        self.list_widget.setMaximumHeight(90)
+        self.list_widget.currentItemChanged.connect(self.update_retry_button)
+        self.list_widget.itemDoubleClicked.connect(lambda item: self.retry_selected())
+        layout.addWidget(self.list_widget)
+
+        print_queue.job_changed.connect(self.update_job)
+        self.hide()
+
+    def _job_for(self, item):
+        job_id = item.data(Qt.UserRole) if item else None
+        return next((job for job in self.print_queue.jobs if job.id == job_id), None)
+
+    def update_job(self, job):
+        item = self._items.get(job.id)
+        if item is None:
+            item = QListWidgetItem()
+            item.setData(Qt.UserRole, job.id)
+            self.list_widget.insertItem(0, item)  # 최근 작업이 위
+            self._items[job.id] = item
+        item.setText(job.describe())
+        self.show()
+        self.update_retry_button()
+
+    def update_retry_button(self, *args):
+        job = self._job_for(self.list_widget.currentItem())
+        # 모으는 중인 작업은 모인 만큼 바로 인쇄
+        collecting = job is not None and job.status == STATUS_COLLECTING
+        self.retry_button.setText("지금 인쇄" if collecting else "다시 시도")
+        self.retry_button.setEnabled(collecting or (job is not None and job.status == STATUS_FAILED))
+
+    def retry_selected(self):
+        job = self._job_for(self.list_widget.currentItem())
+        if job is None:
+            return
+        if job.status == STATUS_COLLECTING:
+            self.print_queue.flush(job)
+        else:
+            self.print_queue.retry(job)
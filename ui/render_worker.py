@@ -0,0 +1,102 @@
+"""
+RenderWorker 모듈
+가공(합성/저장)을 GUI 스레드 밖에서 처리합니다. 요청마다 먼저 미리보기 크기 합성을 만들어
+보내고(수십 ms), 원본 해상도 결과를 저장한 뒤 그 결과의 미리보기로 교체할 수 있게 보냅니다.
+
+미리보기는 QImage로 만들어 보냅니다 (QPixmap은 GUI 스레드에서만 만들 수 있음).
+"""
+
+import queue
+import threading
+
+from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtGui import QImage
+
+
+def to_qimage(pil_image):
+    """PIL 이미지 -> QImage (투명 영역은 흰 배경, 버퍼 복사본)"""
+    from PIL import Image
+
+    if pil_image.mode in ('RGBA', 'LA', 'P'):
+        pil_image = pil_image.convert('RGBA')
+        background = Image.new('RGB', pil_image.size, (255, 255, 255))
+        background.paste(pil_image, mask=pil_image.getchannel('A'))
+        pil_image = background
+    elif pil_image.mode != 'RGB':
+        pil_image = pil_image.convert('RGB')
+    w, h = pil_image.size
+    return QImage(pil_image.tobytes(), w, h, w * 3, QImage.Format_RGB888).copy()
+
+
+def load_preview(image_path, box_size):
+    """저장된 결과의 미리보기 (box_size 안에 맞춤)"""
+    from PIL import Image
+
+    with Image.open(image_path) as image:
+        image.draft('RGB', box_size)
+        image.thumbnail(box_size, Image.LANCZOS)
+        return to_qimage(image)
+
+
+class RenderWorker(QThread):
+    """가공 요청 큐를 순서대로 처리하는 스레드 (큐가 비면 종료, 다음 요청 시 다시 시작)"""
+
+    previewed = pyqtSignal(object, object)       # (요청 토큰, 미리보기 크기 합성 QImage)
+    rendered = pyqtSignal(object, object, object)  # (요청 토큰, 결과 경로 또는 None, 결과 미리보기 QImage 또는 None)
+    failed = pyqtSignal(object, str)              # (요청 토큰, 오류 메시지)
+
+    def __init__(self, image_processor, frame_manager, parent=None):
+        super().__init__(parent)
+        self.image_processor = image_processor
+        self.frame_manager = frame_manager
+        self._tasks = queue.Queue()
+        self._lock = threading.Lock()
+        self._active = False
+
+    def submit(self, token, files, frame_name, output_folder, expand_pixels, preview_size):
+        """가공 요청 (결과는 previewed -> rendered/failed 시그널로 GUI 스레드에 전달)"""
+        with self._lock:
+            self._tasks.put((token, list(files), frame_name, output_folder, expand_pixels, preview_size))
+            if self._active:
+                return
+            self._active = True
+        # 이전 실행이 막 끝나는 중이면 완전히 종료된 뒤 다시 시작
+        self.wait()
+        self.start()
+
+    def stop(self):
+        """남은 요청을 버리고 진행 중인 가공이 끝날 때까지 대기"""
+        with self._lock:
+            while not self._tasks.empty():
+                self._tasks.get_nowait()
+        self.wait()
+
+    def run(self):
+        while True:
+            with self._lock:
+                if self._tasks.empty():
+                    self._active = False
+                    return
+                token, files, frame_name, output_folder, expand_pixels, preview_size = self._tasks.get_nowait()
+
+            # 미리보기는 실패해도 원본 해상도 가공은 계속
+            try:
+                preview = self.image_processor.render_preview(files, frame_name, self.frame_manager,
+                                                              preview_size, expand_pixels=expand_pixels)
+                if preview is not None:
+                    self.previewed.emit(token, to_qimage(preview))
+            except Exception as e:
+                print(f"[WARNING] 가공 미리보기 실패: {e}")
+
+            try:
+                path = self.image_processor.process_images(files, frame_name, self.frame_manager,
+                                                           output_folder, expand_pixels=expand_pixels)
+            except Exception as e:
+                self.failed.emit(token, str(e))
+                continue
+            try:
+                final = load_preview(path, preview_size) if path else None
+            except Exception as e:
+                print(f"[WARNING] 가공 결과 미리보기 로드 실패: {e}")
+                final = None
+            self.rendered.emit(token, path, final)
@@ -1,16 +1,19 @@
 import os
+import sys
 import copy
-from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QListWidget, 
+from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QListView, 
                              QLabel, QLineEdit, QPushButton, QMessageBox, 
                              QComboBox, QWidget, QScrollArea, QFormLayout,
                              QSpinBox, QGroupBox, QGridLayout, QFileDialog,
-                             QTabWidget, QListWidgetItem, QSplitter, QCheckBox)
-from PyQt5.QtCore import Qt, QSize, QRect, pyqtSignal
+                             QTabWidget, QSplitter, QCheckBox)
+from PyQt5.QtCore import Qt, QSize, QRect, QModelIndex, pyqtSignal
 from PyQt5.QtGui import QPixmap, QPainter, QColor, QPen, QIcon
 from PyQt5.QtGui import QPixmap, QPainter, QColor, QPen, QIcon
 from PIL import Image
+from core.region_detect import detect_openings
 from .styles import Styles, Colors, Fonts
 from .message_box import MessageBox
+from .frame_list_model import FrameListModel, FrameFilterProxyModel
 
 class RegionInputWidget(QGroupBox):
     """개별 영역 좌표 입력 위젯 (박스 형태) - Compact"""
@@ -192,6 +195,7 @@ class SettingsDialog(QDialog):
         super().__init__(parent)
         self.frame_manager = frame_manager
         self.settings_manager = settings_manager
+        self._loading_frame = False  # 프레임을 불러오는 중에는 입력값 변경을 편집으로 저장하지 않음
         self.setWindowTitle("설정")
         self.resize(850, 600) # 컴팩트 사이즈
         
@@ -264,6 +268,47 @@ class SettingsDialog(QDialog):
         self.direct_print_chk.stateChanged.connect(self.save_general_settings)
         
         print_layout.addWidget(self.direct_print_chk)
+
+        # 인쇄 대상 (파일 백엔드는 대화상자 없이 print_output_dir에 저장)
+        backend_row = QHBoxLayout()
+        backend_label = QLabel("인쇄 대상:")
+        backend_label.setStyleSheet(f"font-family: '{Fonts.FAMILY}'; font-size: 12px;")
+        self.print_backend_combo = QComboBox()
+        self.print_backend_combo.setStyleSheet(Styles.INPUT)
+        for key, label in (("native", "프린터"), ("pdf", "PDF 파일"), ("png", "PNG 파일")):
+            self.print_backend_combo.addItem(label, key)
+        index = self.print_backend_combo.findData(self.settings_manager.get("print_backend", "native"))
+        if index >= 0:
+            self.print_backend_combo.setCurrentIndex(index)
+        self.print_backend_combo.currentIndexChanged.connect(self.save_general_settings)
+        backend_row.addWidget(backend_label)
+        backend_row.addWidget(self.print_backend_combo)
+        backend_row.addStretch()
+        print_layout.addLayout(backend_row)
+
+        # 용지 한 장에 인쇄할 결과 수 (N개 배치 + 재단선)
+        layout_row = QHBoxLayout()
+        layout_label = QLabel("용지 한 장에:")
+        layout_label.setStyleSheet(f"font-family: '{Fonts.FAMILY}'; font-size: 12px;")
+        self.print_layout_combo = QComboBox()
+        self.print_layout_combo.setStyleSheet(Styles.INPUT)
+        for key, label in (("1up", "1장"), ("2up", "2장"), ("4up", "4장")):
+            self.print_layout_combo.addItem(label, key)
+        index = self.print_layout_combo.findData(self.settings_manager.get("print_layout", "1up"))
+        if index >= 0:
+            self.print_layout_combo.setCurrentIndex(index)
+        self.print_layout_combo.currentIndexChanged.connect(self.save_general_settings)
+        layout_row.addWidget(layout_label)
+        layout_row.addWidget(self.print_layout_combo)
+        layout_row.addStretch()
+        print_layout.addLayout(layout_row)
+
+        self.print_collect_chk = QCheckBox("여러 세션 모아서 인쇄 (배치 수만큼 모이면 인쇄)")
+        self.print_collect_chk.setStyleSheet(f"font-family: '{Fonts.FAMILY}'; font-size: 12px;")
+        self.print_collect_chk.setChecked(self.settings_manager.get("print_collect", False))
+        self.print_collect_chk.stateChanged.connect(self.save_general_settings)
+        print_layout.addWidget(self.print_collect_chk)
+
         print_group.setLayout(print_layout)
         
         print_layout.addWidget(self.direct_print_chk)
@@ -284,6 +329,26 @@ class SettingsDialog(QDialog):
         self.expand_spin.valueChanged.connect(self.save_general_settings)
         
         process_layout.addRow("합성 영역 확장:", self.expand_spin)
+
+        self.frame_cache_spin = QSpinBox()
+        self.frame_cache_spin.setRange(0, 4096)
+        self.frame_cache_spin.setSingleStep(64)
+        self.frame_cache_spin.setSuffix(" MB")
+        self.frame_cache_spin.setToolTip("시작 후 프레임을 미리 디코딩해 둘 메모리 한도")
+        self.frame_cache_spin.setStyleSheet(Styles.INPUT)
+        self.frame_cache_spin.setValue(self.settings_manager.get("frame_cache_budget_mb", 256))
+        self.frame_cache_spin.valueChanged.connect(self.save_general_settings)
+
+        process_layout.addRow("프레임 캐시 메모리:", self.frame_cache_spin)
+
+        self.working_copy_chk = QCheckBox("작업 해상도 사본으로 저장")
+        self.working_copy_chk.setStyleSheet(f"font-family: '{Fonts.FAMILY}'; font-size: 12px;")
+        self.working_copy_chk.setToolTip("원본 대신 프레임 영역에 필요한 크기로 줄이고 방향을 바로잡은 사본을 세션 폴더에 저장합니다.\n"
+                                         "원본은 원래 위치(카드 등)에 그대로 남습니다.")
+        self.working_copy_chk.setChecked(self.settings_manager.get("ingest_mode", "original") == "working")
+        self.working_copy_chk.stateChanged.connect(self.save_general_settings)
+
+        process_layout.addRow("사진 가져오기:", self.working_copy_chk)
         process_group.setLayout(process_layout)
         
         layout.addWidget(process_group)
@@ -302,11 +367,25 @@ class SettingsDialog(QDialog):
         # 바로 인쇄하기 저장
         direct_print = self.direct_print_chk.isChecked()
         self.settings_manager.set("direct_print", direct_print)
+
+        # 인쇄 대상/배치 저장 (다음 인쇄부터 적용)
+        self.settings_manager.set("print_backend", self.print_backend_combo.currentData())
+        self.settings_manager.set("print_layout", self.print_layout_combo.currentData())
+        self.settings_manager.set("print_collect", self.print_collect_chk.isChecked())
         
         # 합성 영역 확장 저장
         old_expand_pixels = self.settings_manager.get("expand_pixels", 0)
         expand_pixels = self.expand_spin.value()
         self.settings_manager.set("expand_pixels", expand_pixels)
+
+        # 사진 가져오기 방식 저장 (다음에 넣는 사진부터 적용)
+        self.settings_manager.set("ingest_mode", "working" if self.working_copy_chk.isChecked() else "original")
+
+        # 프레임 캐시 메모리 한도 저장 (이미 로드된 캐시에도 즉시 반영)
+        budget_mb = self.frame_cache_spin.value()
+        self.settings_manager.set("frame_cache_budget_mb", budget_mb)
+        if "core.frame_cache" in sys.modules:
+            sys.modules["core.frame_cache"].get_frame_cache().set_budget(budget_mb * 1024 * 1024)
         
         # 메인 윈도우에 변경 알림 (부모가 있으면)
         if self.parent():
@@ -454,8 +533,24 @@ class SettingsDialog(QDialog):
         bottom_group.setStyleSheet(Styles.GROUP_BOX)
         bottom_layout = QVBoxLayout()
         
-        # 목록 컨트롤 (추가/삭제)
+        # 목록 컨트롤 (검색/필터, 추가/삭제)
         list_ctrl_layout = QHBoxLayout()
+
+        self.frame_search_edit = QLineEdit()
+        self.frame_search_edit.setPlaceholderText("이름 검색")
+        self.frame_search_edit.setClearButtonEnabled(True)
+        self.frame_search_edit.setStyleSheet(Styles.INPUT)
+        self.frame_search_edit.textChanged.connect(self.on_frame_filter_changed)
+        list_ctrl_layout.addWidget(self.frame_search_edit)
+
+        self.frame_type_filter = QComboBox()
+        self.frame_type_filter.addItem("전체", None)
+        self.frame_type_filter.addItem("four_cut", "four_cut")
+        self.frame_type_filter.addItem("single_cut", "single_cut")
+        self.frame_type_filter.setStyleSheet(Styles.INPUT)
+        self.frame_type_filter.currentIndexChanged.connect(self.on_frame_filter_changed)
+        list_ctrl_layout.addWidget(self.frame_type_filter)
+
         list_ctrl_layout.addStretch()
         self.add_btn = QPushButton("프레임 추가")
         self.add_btn.setStyleSheet(Styles.BTN_SECONDARY)
@@ -469,19 +564,27 @@ class SettingsDialog(QDialog):
         list_ctrl_layout.addWidget(self.del_btn)
         bottom_layout.addLayout(list_ctrl_layout)
         
-        # 리스트 위젯
-        self.frame_list = QListWidget()
+        # 리스트 뷰 (모델 기반, 썸네일은 보이는 항목만 비동기 로드)
+        self.frame_model = FrameListModel(thumbnail_size=QSize(80, 80), parent=self)
+        self.frame_proxy = FrameFilterProxyModel(self)
+        self.frame_proxy.setSourceModel(self.frame_model)
+
+        self.frame_list = QListView()
+        self.frame_list.setModel(self.frame_proxy)
         self.frame_list.setIconSize(QSize(80, 80))
-        self.frame_list.setViewMode(QListWidget.IconMode)
-        self.frame_list.setFlow(QListWidget.LeftToRight) # 가로 배치
+        self.frame_list.setViewMode(QListView.IconMode)
+        self.frame_list.setFlow(QListView.LeftToRight) # 가로 배치
         self.frame_list.setWrapping(False) # 줄바꿈 없음 (가로 스크롤)
-        self.frame_list.setResizeMode(QListWidget.Adjust)
+        self.frame_list.setResizeMode(QListView.Adjust)
+        self.frame_list.setMovement(QListView.Static)
+        self.frame_list.setUniformItemSizes(True) # 항목별 크기 계산 생략
+        self.frame_list.setLayoutMode(QListView.Batched)
         self.frame_list.setStyleSheet(Styles.LIST_WIDGET)
         self.frame_list.setSpacing(10)
         self.frame_list.setFixedHeight(130) # 높이 고정
         self.frame_list.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self.frame_list.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.frame_list.currentRowChanged.connect(self.load_selected_frame)
+        self.frame_list.selectionModel().currentChanged.connect(self.on_frame_list_current_changed)
         
         bottom_layout.addWidget(self.frame_list)
         bottom_group.setLayout(bottom_layout)
@@ -492,30 +595,38 @@ class SettingsDialog(QDialog):
         return widget
 
     def refresh_frame_list(self):
-        self.frame_list.clear()
-        frames = self.temp_frames
-        for frame in frames:
-            item = QListWidgetItem(frame['name'])
-            # 썸네일 로드 시도
-            frame_path = os.path.join(os.getcwd(), 'frame', frame['filename'])
-            icon = None
-            if os.path.exists(frame_path):
-                pixmap = QPixmap(frame_path)
-                if not pixmap.isNull():
-                    icon = QIcon(pixmap)
-            
-            # 아이콘이 없으면 기본 아이콘 생성 (텍스트 정렬을 위해)
-            if icon is None:
-                pixmap = QPixmap(80, 80)
-                pixmap.fill(Qt.lightGray)
-                painter = QPainter(pixmap)
-                painter.setPen(Qt.black)
-                painter.drawText(pixmap.rect(), Qt.AlignCenter, "No Image")
-                painter.end()
-                icon = QIcon(pixmap)
-                
-            item.setIcon(icon)
-            self.frame_list.addItem(item)
+        self.frame_model.set_frames(self.temp_frames)
+
+    def current_frame_row(self):
+        """현재 선택된 프레임의 temp_frames 기준 인덱스 (필터 적용 전 행 번호)"""
+        index = self.frame_list.currentIndex()
+        if not index.isValid():
+            return -1
+        return self.frame_proxy.mapToSource(index).row()
+
+    def select_frame_row(self, row):
+        """temp_frames 기준 인덱스로 프레임 선택 (필터에 가려져 있으면 필터 해제)"""
+        source_index = self.frame_model.index(row)
+        proxy_index = self.frame_proxy.mapFromSource(source_index)
+        if not proxy_index.isValid() and self.frame_proxy.is_filtered():
+            self.frame_search_edit.blockSignals(True)
+            self.frame_type_filter.blockSignals(True)
+            self.frame_search_edit.clear()
+            self.frame_type_filter.setCurrentIndex(0)
+            self.frame_search_edit.blockSignals(False)
+            self.frame_type_filter.blockSignals(False)
+            self.frame_proxy.clear_filters()
+            proxy_index = self.frame_proxy.mapFromSource(source_index)
+        self.frame_list.setCurrentIndex(proxy_index)
+
+    def on_frame_list_current_changed(self, current, previous):
+        if not current.isValid():
+            return
+        self.load_selected_frame(self.frame_proxy.mapToSource(current).row())
+
+    def on_frame_filter_changed(self):
+        self.frame_proxy.set_name_filter(self.frame_search_edit.text())
+        self.frame_proxy.set_type_filter(self.frame_type_filter.currentData())
 
     def load_selected_frame(self, row):
         if row < 0:
@@ -540,12 +651,16 @@ class SettingsDialog(QDialog):
         self.filename_edit.blockSignals(False)
         self.type_combo.blockSignals(False)
             
-        # 영역 로드
-        self.clear_regions()
-        regions = frame.get('regions', [])
-        for i, region in enumerate(regions):
-            self.add_region_input(region)
-            
+        # 영역 로드 (입력 위젯을 하나씩 추가하는 동안의 중간 상태는 저장하지 않음)
+        self._loading_frame = True
+        try:
+            self.clear_regions()
+            regions = self.frame_manager.pixel_regions(frame)
+            for i, region in enumerate(regions):
+                self.add_region_input(region)
+        finally:
+            self._loading_frame = False
+
         self.rearrange_regions()
         self.update_preview()
 
@@ -637,66 +752,12 @@ class SettingsDialog(QDialog):
                 return
 
         try:
-            img = Image.open(filepath).convert("RGBA")
-            width, height = img.size
-            
-            visited = set()
-            regions = []
-            pixels = img.load()
-            step = 5 
-            
-            for y in range(0, height, step):
-                for x in range(0, width, step):
-                    if (x, y) in visited:
-                        continue
-                        
-                    r, g, b, a = pixels[x, y]
-                    if a < 10:
-                        min_x, min_y, max_x, max_y = x, y, x, y
-                        stack = [(x, y)]
-                        visited.add((x, y))
-                        
-                        while stack:
-                            cx, cy = stack.pop()
-                            min_x = min(min_x, cx)
-                            min_y = min(min_y, cy)
-                            max_x = max(max_x, cx)
-                            max_y = max(max_y, cy)
-                            
-                            for dx, dy in [(-step, 0), (step, 0), (0, -step), (0, step)]:
-                                nx, ny = cx + dx, cy + dy
-                                if 0 <= nx < width and 0 <= ny < height:
-                                    if (nx, ny) not in visited:
-                                        nr, ng, nb, na = pixels[nx, ny]
-                                        if na < 10:
-                                            visited.add((nx, ny))
-                                            stack.append((nx, ny))
-                        
-                        if (max_x - min_x) > 50 and (max_y - min_y) > 50:
-                            regions.append([min_x, min_y, max_x + step, max_y + step])
-
-            regions.sort(key=lambda r: (r[1], r[0]))
-            
-            final_regions = []
-            if regions:
-                rows = []
-                current_row = [regions[0]]
-                for i in range(1, len(regions)):
-                    prev = current_row[-1]
-                    curr = regions[i]
-                    prev_cy = (prev[1] + prev[3]) // 2
-                    curr_cy = (curr[1] + curr[3]) // 2
-                    prev_h = prev[3] - prev[1]
-                    if abs(curr_cy - prev_cy) < (prev_h / 2):
-                        current_row.append(curr)
-                    else:
-                        rows.append(current_row)
-                        current_row = [curr]
-                rows.append(current_row)
-                for row in rows:
-                    row.sort(key=lambda r: r[0])
-                    final_regions.extend(row)
-            
+            # 원본 해상도 알파에서 구멍 인식 (영역 좌표는 축 정렬 경계, 기울어진 구멍은 합성 시 변형)
+            with Image.open(filepath) as img:
+                openings = detect_openings(img)
+            final_regions = [list(opening.box) for opening in openings]
+            warped = sum(1 for opening in openings if opening.warped)
+
             self.clear_regions()
             for region in final_regions:
                 self.add_region_input(region)
@@ -707,7 +768,10 @@ class SettingsDialog(QDialog):
             self.rearrange_regions()
             self.update_preview()
             
-            MessageBox.information(self, "완료", f"{len(final_regions)}개의 투명 영역을 감지했습니다.")
+            message = f"{len(final_regions)}개의 투명 영역을 감지했습니다."
+            if warped:
+                message += f"\n기울어진 영역 {warped}개는 합성 시 사진을 구멍 모양에 맞춰 회전/변형합니다."
+            MessageBox.information(self, "완료", message)
 
         except Exception as e:
             MessageBox.critical(self, "오류", f"이미지 분석 중 오류 발생: {e}")
@@ -719,21 +783,20 @@ class SettingsDialog(QDialog):
             "type": "four_cut",
             "regions": [[0,0,0,0], [0,0,0,0], [0,0,0,0], [0,0,0,0]]
         }
-        self.temp_frames.append(new_frame)
-        self.refresh_frame_list()
-        self.frame_list.setCurrentRow(self.frame_list.count() - 1)
+        row = self.frame_model.append_frame(new_frame)
+        self.select_frame_row(row)
 
     def delete_current_frame(self):
-        row = self.frame_list.currentRow()
+        row = self.current_frame_row()
         if row < 0:
             MessageBox.warning(self, "경고", "삭제할 프레임을 선택해주세요.")
             return
             
         reply = MessageBox.question(self, "삭제 확인", "정말로 이 프레임을 삭제하시겠습니까?")
         if reply == MessageBox.Yes:
-            if 0 <= row < len(self.temp_frames):
-                del self.temp_frames[row]
-            self.refresh_frame_list()
+            # 현재 선택을 먼저 해제하여 인접 항목이 비워진 입력값으로 덮어써지지 않도록 함
+            self.frame_list.setCurrentIndex(QModelIndex())
+            self.frame_model.remove_frame(row)
             self.name_edit.clear()
             self.filename_edit.clear()
             self.clear_regions()
@@ -741,23 +804,30 @@ class SettingsDialog(QDialog):
 
     def save_current_frame_info(self):
         """현재 편집 중인 프레임 정보를 즉시 저장"""
-        row = self.frame_list.currentRow()
-        if row < 0:
+        row = self.current_frame_row()
+        if row < 0 or self._loading_frame:
             return
             
         regions = [w.get_values() for w in self.region_widgets]
-        
+
+        # 편집한 항목은 정규화 좌표 없이 현재 PNG 기준 픽셀 좌표로 저장 (저장 시 FrameManager가 다시 정규화)
         frame_data = {
             "name": self.name_edit.text(),
             "filename": self.filename_edit.text(),
             "type": self.type_combo.currentText(),
             "regions": regions
         }
+
+        # 영역과 파일을 바꾸지 않았으면(보기만 했거나 이름/타입만 변경) 기존 정규화 좌표 유지
+        previous = self.temp_frames[row]
+        if (previous.get('norm_regions') and frame_data['filename'] == previous.get('filename')
+                and regions == [list(r) for r in self.frame_manager.pixel_regions(previous)]):
+            for key in ('size', 'regions', 'norm_regions'):
+                if key in previous:
+                    frame_data[key] = previous[key]
         
-        if 0 <= row < len(self.temp_frames):
-            self.temp_frames[row] = frame_data
-        # 리스트 아이템 텍스트 업데이트
-        self.frame_list.item(row).setText(self.name_edit.text())
+        # 모델을 통해 갱신 (리스트 항목 텍스트/썸네일도 함께 갱신됨)
+        self.frame_model.update_frame(row, frame_data)
 
     def save_changes(self):
         """변경사항을 파일에 저장"""
@@ -778,7 +848,7 @@ class SettingsDialog(QDialog):
             self.temp_frames = copy.deepcopy(self.frame_manager.get_all_frames())
             self.refresh_frame_list()
             if self.temp_frames:
-                self.load_selected_frame(0) # 첫 번째 프레임 선택
+                self.select_frame_row(0) # 첫 번째 프레임 선택
             else:
                 self.name_edit.clear()
                 self.filename_edit.clear()
@@ -791,25 +861,9 @@ class SettingsDialog(QDialog):
         if 0 <= index < len(self.region_widgets):
             widget = self.region_widgets[index]
             
-            # 스타일 적용 (파란색 테두리)
+            # 스타일 적용 (파란색 테두리) - Styles.GROUP_BOX의 highlighted 상태
             for w in self.region_widgets:
-                w.setStyleSheet(Styles.GROUP_BOX)
-            
-            widget.setStyleSheet(f"""
-                QGroupBox {{
-                    font-weight: bold;
-                    border: 2px solid {Colors.PRIMARY};
-                    border-radius: 5px;
-                    margin-top: 10px;
-                    background-color: #E3F2FD;
-                }}
-                QGroupBox::title {{
-                    subcontrol-origin: margin;
-                    left: 10px;
-                    padding: 0 3px 0 3px;
-                    color: {Colors.PRIMARY};
-                }}
-            """)
+                Styles.set_state(w, w is widget, name="highlighted")
             
             # 스크롤 이동
             self.regions_container.ensureWidgetVisible(widget)
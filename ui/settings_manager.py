@@ -1,35 +1,7 @@
-import json
-import os
+"""
+하위 호환용 모듈 - SettingsManager는 core.settings로 이동했습니다.
+"""
 
-class SettingsManager:
-    def __init__(self, filepath="settings.json"):
-        self.filepath = filepath
-        self.settings = {
-            "preview_aspect_ratio": "3:2",
-            "direct_print": True,
-            "expand_pixels": 0
-        }
-        self.load_settings()
+from core.settings import SettingsManager
 
-    def load_settings(self):
-        if os.path.exists(self.filepath):
-            try:
-                with open(self.filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.settings.update(data)
-            except Exception as e:
-                print(f"Error loading settings: {e}")
-
-    def save_settings(self):
-        try:
-            with open(self.filepath, 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f, indent=4, ensure_ascii=False)
-        except Exception as e:
-            print(f"Error saving settings: {e}")
-
-    def get(self, key, default=None):
-        return self.settings.get(key, default)
-
-    def set(self, key, value):
-        self.settings[key] = value
-        self.save_settings()
+__all__ = ['SettingsManager']
@@ -5,17 +5,15 @@ class StatusCard(QFrame):
     """
     A unified status card widget to display Info, Success, and Error messages.
     Replaces ad-hoc QLabels and QFrames for status updates.
+
+    Styling comes from Styles.STATUS_CARD (applied app-wide at startup);
+    switching messages only flips the dynamic "state" property.
     """
     def __init__(self, parent=None):
         super().__init__(parent)
         # self.hide() # Initially hidden -> Removed to keep layout stable
         self.setFixedHeight(80) # Fixed height for approx 3 lines
-        
-        # Default style to invisible/empty but taking space? 
-        # Or just transparent background?
-        # Let's keep it visible but empty style if needed, or just apply a default style.
-        # For now, we'll just set the size.
-        self.setStyleSheet("background-color: transparent;")
+        self.setObjectName("statusCard")
         
         # Layout
         layout = QVBoxLayout(self)
@@ -23,29 +21,37 @@ class StatusCard(QFrame):
         
         # Label
         self.label = QLabel()
+        self.label.setObjectName("statusCardLabel")
         self.label.setWordWrap(True)
         layout.addWidget(self.label)
+
+        self._set_state("")
+
+    def _set_state(self, state):
+        """Switch the card and its label to a precompiled style variant"""
+        Styles.set_state(self, state)
+        Styles.set_state(self.label, state)
         
     def show_info(self, message):
         """Display an informational message (Blue)"""
-        self.setStyleSheet(Styles.STATUS_CARD_INFO)
+        self._set_state("info")
         self.label.setText(message)
         self.show()
         
     def show_success(self, message):
         """Display a success message (Green)"""
-        self.setStyleSheet(Styles.STATUS_CARD_SUCCESS)
+        self._set_state("success")
         self.label.setText(message)
         self.show()
         
     def show_error(self, message):
         """Display an error message (Red)"""
-        self.setStyleSheet(Styles.STATUS_CARD_ERROR)
+        self._set_state("error")
         self.label.setText(message)
         self.show()
         
     def clear(self):
         """Reset the card content but keep it visible to maintain layout"""
         self.label.clear()
-        self.setStyleSheet("background-color: transparent;")
+        self._set_state("")
         # self.hide() # Do not hide, to maintain fixed height layout
@@ -252,51 +252,99 @@ class Styles:
     STATUS_INFO = f"color: {Colors.PRIMARY};"             # Blue
     
     # Status Cards (Unified UI)
-    STATUS_CARD_INFO = f"""
-        QFrame {{
+    # state 속성("info" / "success" / "error")으로 전환 - 앱 시작 시 한 번만 적용됨
+    STATUS_CARD = f"""
+        #statusCard {{
+            background-color: transparent;
+            border: none;
+        }}
+        #statusCard[state="info"] {{
             background-color: #E3F2FD; /* Light Blue */
             border: 1px solid #90CAF9;
             border-radius: 6px;
         }}
-        QLabel {{
-            color: #0D47A1; /* Dark Blue Text */
-            font-family: "{Fonts.FAMILY}";
-            font-size: 12px;
-            border: none;
-            background: transparent;
-        }}
-    """
-
-    STATUS_CARD_SUCCESS = f"""
-        QFrame {{
+        #statusCard[state="success"] {{
             background-color: #E8F5E9; /* Light Green */
             border: 1px solid #A5D6A7;
             border-radius: 6px;
         }}
-        QLabel {{
-            color: #1B5E20; /* Dark Green Text */
+        #statusCard[state="error"] {{
+            background-color: #FFEBEE; /* Light Red */
+            border: 1px solid #EF9A9A;
+            border-radius: 6px;
+        }}
+        QLabel#statusCardLabel {{
             font-family: "{Fonts.FAMILY}";
             font-size: 12px;
             border: none;
             background: transparent;
         }}
+        QLabel#statusCardLabel[state="info"] {{
+            color: #0D47A1; /* Dark Blue Text */
+        }}
+        QLabel#statusCardLabel[state="success"] {{
+            color: #1B5E20; /* Dark Green Text */
+        }}
+        QLabel#statusCardLabel[state="error"] {{
+            color: #B71C1C; /* Dark Red Text */
+        }}
     """
 
-    STATUS_CARD_ERROR = f"""
-        QFrame {{
-            background-color: #FFEBEE; /* Light Red */
-            border: 1px solid #EF9A9A;
+    # Drop Zone
+    # state 속성("empty" / "hover" / "filled")으로 전환 - 앱 시작 시 한 번만 적용됨
+    DROP_ZONE = f"""
+        #dropZone[state="empty"] {{
+            border: 2px dashed {Colors.BORDER};
+            border-radius: 12px;
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                        stop:0 #FAFAFA, stop:1 #F5F5F5);
+        }}
+        #dropZone[state="hover"] {{
+            border: 2px solid {Colors.PRIMARY};
+            border-radius: 12px;
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                        stop:0 #E3F2FD, stop:1 #BBDEFB);
+            padding: 8px;
+        }}
+        #dropZone[state="filled"] {{
+            border: 2px solid {Colors.SUCCESS};
+            border-radius: 12px;
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                        stop:0 #F1F8F4, stop:1 #E8F5E9);
+            padding: 8px;
+        }}
+        QLabel#dropZoneImage {{
+            color: {Colors.TEXT_HINT};
+            border: none;
             border-radius: 6px;
+            background-color: transparent;
         }}
-        QLabel {{
-            color: #B71C1C; /* Dark Red Text */
-            font-family: "{Fonts.FAMILY}";
-            font-size: 12px;
+        QLabel#dropZoneFilename {{
+            color: {Colors.TEXT_HINT};
+            font-size: 11px;
+            background-color: transparent;
+        }}
+        QLabel#dropZoneFilename[state="filled"] {{
+            color: {Colors.TEXT_PRIMARY};
+            font-weight: 600;
+            padding: 2px;
+        }}
+        QPushButton#dropZoneDelete {{
+            background-color: rgba(0, 0, 0, 0.5);
+            color: white;
+            border-radius: 12px;
+            font-weight: bold;
             border: none;
-            background: transparent;
+        }}
+        QPushButton#dropZoneDelete:hover {{
+            background-color: {Colors.DESTRUCTIVE};
         }}
     """
-    
+
+    # Print Button (variant 속성: "primary" = 인쇄, "secondary" = 사진 보기)
+    PRINT_BUTTON = BTN_PRIMARY.replace("QPushButton", 'QPushButton#printButton[variant="primary"]') + \
+        BTN_SECONDARY.replace("QPushButton", 'QPushButton#printButton[variant="secondary"]')
+
     # Processed Frame
     PROCESSED_FRAME = f"""
         QFrame {{
@@ -326,26 +374,37 @@ class Styles:
             font-weight: bold;
             font-size: 12px;
         }}
+        QGroupBox[highlighted="true"] {{
+            font-weight: bold;
+            border: 2px solid {Colors.PRIMARY};
+            border-radius: 5px;
+            margin-top: 10px;
+            background-color: #E3F2FD;
+        }}
+        QGroupBox[highlighted="true"]::title {{
+            padding: 0 3px 0 3px;
+            color: {Colors.PRIMARY};
+        }}
     """
     
-    # List Widget
+    # List Widget / List View
     LIST_WIDGET = f"""
-        QListWidget {{
+        QListView {{
             background-color: {Colors.SURFACE};
             border: 1px solid {Colors.BORDER};
             border-radius: 4px;
             outline: none;
         }}
-        QListWidget::item {{
+        QListView::item {{
             border-radius: 4px;
             padding: 5px;
         }}
-        QListWidget::item:selected {{
+        QListView::item:selected {{
             background-color: #E3F2FD;
             color: {Colors.TEXT_PRIMARY};
             border: 1px solid {Colors.PRIMARY};
         }}
-        QListWidget::item:hover {{
+        QListView::item:hover {{
             background-color: #F5F5F5;
         }}
     """
@@ -401,9 +460,33 @@ class Styles:
         }}
     """
 
+    # 앱 전역 스타일 (상태 전환이 잦은 위젯의 모든 상태를 미리 정의)
+    APP = STATUS_CARD + DROP_ZONE + PRINT_BUTTON
+
+    @staticmethod
+    def apply_app_styles(app):
+        """앱 전역 스타일시트 적용 (시작 시 한 번만 파싱)"""
+        app.setStyleSheet(Styles.APP)
+
+    @staticmethod
+    def set_state(widget, value, name="state"):
+        """동적 속성 값을 바꾸고 해당 위젯만 다시 polish (스타일시트 재파싱 없음)"""
+        if widget.property(name) == value:
+            return
+        widget.setProperty(name, value)
+        Styles.repolish(widget)
+
+    @staticmethod
+    def repolish(widget):
+        """속성 변경(readOnly 등)을 스타일에 반영"""
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
+        widget.update()
+
     @staticmethod
     def init_resources():
-        """필요한 리소스 파일 생성 (아이콘 등)"""
+        """필요한 리소스 파일 생성 (아이콘 등). 새로 생성한 경우 True 반환"""
         if not os.path.exists("arrow_down.png"):
             try:
                 pixmap = QPixmap(12, 12)
@@ -426,5 +509,7 @@ class Styles:
                 painter.end()
                 pixmap.save("arrow_down.png")
                 print("Created arrow_down.png")
+                return True
             except Exception as e:
                 print(f"Failed to create resource: {e}")
+        return False